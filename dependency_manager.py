@@ -22,29 +22,37 @@ Dependency Infrastructure Manager - приложение для визуализ
 import sys
 import json
 import os
+import re
+import threading
 import yaml
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
+from functools import cached_property, lru_cache, partial
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QListWidget, QLabel, QDialog, QLineEdit, QComboBox,
-    QTextEdit, QMessageBox, QFileDialog, QSplitter, QGroupBox,
-    QListWidgetItem, QInputDialog, QTabWidget, QMdiArea, QMdiSubWindow,
-    QToolBar, QAction, QMenu, QColorDialog, QFormLayout, QDialogButtonBox,
-    QCheckBox, QGridLayout
+    QPlainTextEdit, QMessageBox, QFileDialog, QSplitter,
+    QListView, QTabWidget, QMdiArea, QMdiSubWindow,
+    QAction, QMenu, QFormLayout, QCheckBox
 )
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QPoint
-from PyQt5.QtGui import QIcon, QFont, QColor, QPalette, QCursor, QFontDatabase
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QDir, QTimer, QThread, QAbstractListModel, QModelIndex
+)
+from PyQt5.QtGui import QFont, QCursor, QKeySequence, QStandardItem, QStandardItemModel
 
 import networkx as nx
 import matplotlib
 matplotlib.use('Qt5Agg')
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from matplotlib.patches import FancyArrowPatch, Circle, Rectangle, RegularPolygon, FancyBboxPatch
-import matplotlib.patches as mpatches
+from matplotlib.patches import FancyArrowPatch, Circle, Rectangle, RegularPolygon, FancyBboxPatch, Ellipse
+from matplotlib.collections import PatchCollection
+from matplotlib.path import Path
+from matplotlib.colors import to_rgba
 import numpy as np
 
 # Настройка matplotlib для корректного отображения шрифтов
@@ -182,6 +190,7 @@ TRANSLATIONS = {
         'confirm_delete_rel': 'Удалить связь?',
         'same_object_error': 'Исходный и целевой объект не могут совпадать',
         'no_objects': 'Нет объектов для отображения',
+        'layout_computing': 'Расчёт компоновки...',
         'graph_title': 'Граф зависимостей',
 
         # Импорт
@@ -209,6 +218,10 @@ TRANSLATIONS = {
         'unsaved_question': 'Хотите сохранить изменения?',
         'btn_save_changes': 'Сохранить',
         'btn_dont_save': 'Не сохранять',
+        'unsaved_many_text': 'Несохранённые изменения в проектах:',
+        'btn_save_all': 'Сохранить все',
+        'btn_discard_all': 'Не сохранять все',
+        'btn_review_each': 'Просмотреть каждый...',
 
         # Подсказки
         'hint_controls': 'Колесо мыши - зум | Shift+ЛКМ / СКМ - перемещение | ЛКМ - выбор узла',
@@ -355,6 +368,7 @@ TRANSLATIONS = {
         'confirm_delete_rel': 'Delete relationship?',
         'same_object_error': 'Source and target objects cannot be the same',
         'no_objects': 'No objects to display',
+        'layout_computing': 'Computing layout...',
         'graph_title': 'Dependencies Graph',
 
         # Import
@@ -382,6 +396,10 @@ TRANSLATIONS = {
         'unsaved_question': 'Do you want to save changes?',
         'btn_save_changes': 'Save',
         'btn_dont_save': "Don't Save",
+        'unsaved_many_text': 'The following projects have unsaved changes:',
+        'btn_save_all': 'Save All',
+        'btn_discard_all': 'Discard All',
+        'btn_review_each': 'Review Each...',
 
         # Hints
         'hint_controls': 'Mouse wheel - zoom | Shift+LMB / MMB - pan | LMB - select node',
@@ -408,6 +426,9 @@ TRANSLATIONS = {
 # Текущий язык интерфейса
 CURRENT_LANGUAGE = 'ru'
 
+# Словарь строк текущего языка (переключается в set_language)
+_STRINGS: Dict[str, str] = TRANSLATIONS[CURRENT_LANGUAGE]
+
 
 def tr(key: str) -> str:
     """Получает перевод строки по ключу.
@@ -418,7 +439,7 @@ def tr(key: str) -> str:
     Returns:
         Переведённая строка на текущем языке или ключ, если перевод не найден.
     """
-    return TRANSLATIONS.get(CURRENT_LANGUAGE, {}).get(key, key)
+    return _STRINGS.get(key, key)
 
 
 def set_language(lang: str) -> None:
@@ -427,9 +448,10 @@ def set_language(lang: str) -> None:
     Args:
         lang: Код языка ('ru' или 'en').
     """
-    global CURRENT_LANGUAGE
+    global CURRENT_LANGUAGE, _STRINGS
     if lang in TRANSLATIONS:
         CURRENT_LANGUAGE = lang
+        _STRINGS = TRANSLATIONS[lang]
 
 
 # =============================================================================
@@ -487,6 +509,19 @@ COLOR_SCHEMES = {
     }
 }
 
+# Цвет узлов неизвестного типа
+DEFAULT_NODE_COLOR = '#ADB5BD'
+
+# Таблицы цветов для отрисовки: схема -> ({тип: строка}, RGBA-массив),
+# последняя строка массива - DEFAULT_NODE_COLOR
+COLOR_TABLES = {
+    scheme: (
+        {obj_type: i for i, obj_type in enumerate(colors)},
+        np.array([to_rgba(color) for color in (*colors.values(), DEFAULT_NODE_COLOR)])
+    )
+    for scheme, colors in COLOR_SCHEMES.items()
+}
+
 # Unicode-символы для обозначения типов объектов
 NODE_ICONS = {
     'file': '■',
@@ -526,6 +561,91 @@ def get_node_label(obj_type: str) -> str:
     return labels.get(obj_type, obj_type.upper())
 
 
+def get_type_prefix(obj_type: str) -> str:
+    """Возвращает префикс подписи объекта: иконку и метку типа.
+
+    Args:
+        obj_type: Внутренний идентификатор типа объекта.
+
+    Returns:
+        Строка вида '<иконка> <метка>: ' на текущем языке.
+    """
+    return _type_prefix(obj_type, CURRENT_LANGUAGE)
+
+
+@lru_cache(maxsize=None)
+def _type_prefix(obj_type: str, language: str) -> str:
+    """Строит префикс подписи; кэшируется по типу и языку."""
+    return f"{NODE_ICONS.get(obj_type, '◉')} {get_node_label(obj_type)}: "
+
+
+# =============================================================================
+# СТИЛИ
+# =============================================================================
+
+# Таблица стилей окон проектов и диалогов хранится в отдельном файле
+# рядом с модулем; правила каждого окна ограничены его objectName
+STYLE_QSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'style.qss')
+
+# Каталог изображений, на которые таблица стилей ссылается как icons:<файл>
+ICONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
+
+# Содержимое файла стилей, читается при первом обращении
+_style_qss: Optional[str] = None
+
+# Установлена ли таблица стилей на QApplication
+_GLOBAL_STYLES_INSTALLED = False
+
+
+def _minify_qss(text: str) -> str:
+    """Убирает из таблицы стилей комментарии и лишние пробелы.
+
+    Args:
+        text: Исходный текст таблицы стилей.
+
+    Returns:
+        Эквивалентная таблица стилей без комментариев, переводов строк
+        и пробелов вокруг скобок и разделителей.
+    """
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r' ?([{};]) ?', r'\1', text)
+    return text.replace(': ', ':').replace(';}', '}').strip()
+
+
+def app_stylesheet() -> str:
+    """Возвращает таблицу стилей приложения.
+
+    Файл читается и сжимается (_minify_qss) один раз.
+
+    Returns:
+        Текст таблицы стилей или пустая строка, если файл недоступен.
+    """
+    global _style_qss
+    if _style_qss is None:
+        try:
+            with open(STYLE_QSS_PATH, encoding='utf-8') as f:
+                _style_qss = _minify_qss(f.read())
+        except OSError as e:
+            print(f"Ошибка загрузки стилей: {e}")
+            _style_qss = ''
+    return _style_qss
+
+
+def install_app_styles() -> None:
+    """Устанавливает таблицу стилей на QApplication.
+
+    Таблица разбирается Qt один раз за сеанс, а не при создании каждого
+    окна и диалога; повторные вызовы ничего не делают.
+    """
+    global _GLOBAL_STYLES_INSTALLED
+    if _GLOBAL_STYLES_INSTALLED:
+        return
+    QDir.addSearchPath('icons', ICONS_DIR)
+    QApplication.instance().setStyleSheet(app_stylesheet())
+    _GLOBAL_STYLES_INSTALLED = True
+
+
 # =============================================================================
 # КЛАССЫ ДАННЫХ
 # =============================================================================
@@ -542,12 +662,13 @@ class InfraObject:
         name: Человекочитаемое название.
         properties: Дополнительные свойства объекта.
         created_at: Дата и время создания в формате ISO.
+        display_label: Подпись "название (ID)" для выпадающих списков.
     """
 
-    VALID_TYPES = [
+    VALID_TYPES = (
         'file', 'docker_container', 'router', 'switch', 'server', 'database',
         'godot_scene', 'godot_script', 'godot_resource', 'godot_autoload'
-    ]
+    )
 
     def __init__(self, obj_id: str, obj_type: str, name: str,
                  properties: Dict = None) -> None:
@@ -590,6 +711,18 @@ class InfraObject:
             text = text.replace(char, '')
         return text.strip()
 
+    @cached_property
+    def display_label(self) -> str:
+        """Подпись объекта для выпадающих списков.
+
+        Вычисляется при первом обращении и кэшируется: id и name задаются
+        в конструкторе, а при редактировании создаётся новый объект.
+
+        Returns:
+            Строка вида "название (ID)".
+        """
+        return f"{self.name} ({self.id})"
+
     @staticmethod
     def _sanitize_id(obj_id: str) -> str:
         """Очищает идентификатор от недопустимых символов.
@@ -599,9 +732,13 @@ class InfraObject:
 
         Returns:
             Очищенный идентификатор (только буквы, цифры, дефис и подчёркивание).
+            Строка интернируется: ID многократно используются как ключи
+            словарей и кортежей, и сравнение сводится к сравнению указателей.
         """
         obj_id = str(obj_id)
-        return ''.join(c for c in obj_id if c.isalnum() or c in ['-', '_'])[:100]
+        return sys.intern(
+            ''.join(c for c in obj_id if c.isalnum() or c in ['-', '_'])[:100]
+        )
 
     def to_dict(self) -> Dict:
         """Сериализует объект в словарь.
@@ -654,10 +791,10 @@ class Relationship:
         created_at: Дата и время создания в формате ISO.
     """
 
-    VALID_TYPES = [
+    VALID_TYPES = (
         'calls', 'sends_to', 'depends_on', 'connects_to',
         'uses', 'provides', 'routes_through'
-    ]
+    )
 
     def __init__(self, source_id: str, target_id: str, rel_type: str,
                  description: str = "") -> None:
@@ -677,7 +814,7 @@ class Relationship:
 
         self.source_id = InfraObject._sanitize_id(source_id)
         self.target_id = InfraObject._sanitize_id(target_id)
-        self.type = rel_type
+        self.type = sys.intern(rel_type)
         self.description = InfraObject._sanitize_string(description)
         self.created_at = datetime.now().isoformat()
 
@@ -723,6 +860,21 @@ class Relationship:
 # МЕНЕДЖЕР ЗАВИСИМОСТЕЙ
 # =============================================================================
 
+def _json_safe(value):
+    """Приводит значение из YAML к типам, которые можно записать в JSON.
+
+    YAML может вернуть, например, datetime.date для `BUILD: 2020-01-01`;
+    такие значения превращаются в строки, структуры сохраняются.
+
+    Args:
+        value: Значение, загруженное yaml.safe_load.
+
+    Returns:
+        Значение из dict/list/str/int/float/bool/None.
+    """
+    return json.loads(json.dumps(value, default=str))
+
+
 class DependencyManager:
     """Менеджер зависимостей инфраструктуры.
 
@@ -733,6 +885,7 @@ class DependencyManager:
         objects: Словарь объектов {id: InfraObject}.
         relationships: Список связей между объектами.
         graph: Направленный граф NetworkX.
+        revision: Счётчик изменений объектов и связей.
     """
 
     def __init__(self) -> None:
@@ -740,6 +893,52 @@ class DependencyManager:
         self.objects: Dict[str, InfraObject] = {}
         self.relationships: List[Relationship] = []
         self.graph = nx.DiGraph()
+        self.revision = 0
+        # Ключи (source_id, target_id, type) для проверки дубликатов за O(1)
+        self._rel_keys: Set[Tuple[str, str, str]] = set()
+
+        # Отложенные изменения графа в режиме пакетного обновления
+        self._deferred = False
+        self._pending_nodes: List[InfraObject] = []
+        self._pending_edges: List[Relationship] = []
+
+    @contextmanager
+    def bulk_update(self):
+        """Режим пакетного добавления объектов и связей.
+
+        Внутри блока объекты и связи сразу попадают в objects и
+        relationships, а граф NetworkX обновляется одним вызовом
+        add_nodes_from/add_edges_from при выходе из блока.
+
+        Example:
+            >>> with manager.bulk_update():
+            ...     manager.add_object(obj)
+        """
+        if self._deferred:
+            # Вложенный блок: изменения применит внешний
+            yield self
+            return
+
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self._flush_deferred()
+
+    def _flush_deferred(self) -> None:
+        """Применяет к графу отложенные добавления узлов и рёбер."""
+        if self._pending_nodes:
+            self.graph.add_nodes_from(
+                (obj.id, obj.to_dict()) for obj in self._pending_nodes
+            )
+            self._pending_nodes.clear()
+        if self._pending_edges:
+            self.graph.add_edges_from(
+                (rel.source_id, rel.target_id, rel.to_dict())
+                for rel in self._pending_edges
+            )
+            self._pending_edges.clear()
 
     def add_object(self, obj: InfraObject) -> bool:
         """Добавляет объект в менеджер.
@@ -752,10 +951,29 @@ class DependencyManager:
         """
         if obj.id in self.objects:
             return False
+        self.revision += 1
         self.objects[obj.id] = obj
-        self.graph.add_node(obj.id, **obj.to_dict())
+        if self._deferred:
+            self._pending_nodes.append(obj)
+        else:
+            self.graph.add_node(obj.id, **obj.to_dict())
         return True
 
+    def add_objects(self, objects: Iterable[InfraObject]) -> int:
+        """Добавляет несколько объектов одним пакетом.
+
+        Граф обновляется один раз для всего пакета (см. bulk_update).
+
+        Args:
+            objects: Объекты для добавления.
+
+        Returns:
+            Количество добавленных объектов (объекты с уже существующими
+            ID пропускаются).
+        """
+        with self.bulk_update():
+            return sum(1 for obj in objects if self.add_object(obj))
+
     def update_object(self, obj_id: str, obj: InfraObject) -> bool:
         """Обновляет существующий объект.
 
@@ -770,18 +988,23 @@ class DependencyManager:
         """
         if obj_id not in self.objects:
             return False
+        self._flush_deferred()
+        self.revision += 1
 
-        # Удаляем старый объект
+        # Удаляем старый объект (узел графа всегда соответствует объекту)
         del self.objects[obj_id]
-        if self.graph.has_node(obj_id):
-            self.graph.remove_node(obj_id)
+        self.graph.remove_node(obj_id)
 
         # Обновляем связи при изменении ID
-        for rel in self.relationships:
-            if rel.source_id == obj_id:
-                rel.source_id = obj.id
-            if rel.target_id == obj_id:
-                rel.target_id = obj.id
+        if obj.id != obj_id:
+            self._discard_rel_keys(obj_id)
+            for rel in self.relationships:
+                if rel.source_id == obj_id:
+                    rel.source_id = obj.id
+                if rel.target_id == obj_id:
+                    rel.target_id = obj.id
+                if rel.source_id == obj.id or rel.target_id == obj.id:
+                    self._rel_keys.add((rel.source_id, rel.target_id, rel.type))
 
         # Добавляем обновлённый объект
         self.objects[obj.id] = obj
@@ -807,17 +1030,19 @@ class DependencyManager:
         """
         if obj_id not in self.objects:
             return False
+        self._flush_deferred()
+        self.revision += 1
 
         # Удаляем связи, связанные с объектом
         self.relationships = [
             rel for rel in self.relationships
             if rel.source_id != obj_id and rel.target_id != obj_id
         ]
+        self._discard_rel_keys(obj_id)
 
-        # Удаляем объект
+        # Удаляем объект (узел графа всегда соответствует объекту)
         del self.objects[obj_id]
-        if self.graph.has_node(obj_id):
-            self.graph.remove_node(obj_id)
+        self.graph.remove_node(obj_id)
         return True
 
     def add_relationship(self, rel: Relationship) -> bool:
@@ -835,16 +1060,34 @@ class DependencyManager:
             return False
 
         # Проверяем на дубликат
-        for existing_rel in self.relationships:
-            if (existing_rel.source_id == rel.source_id and
-                existing_rel.target_id == rel.target_id and
-                existing_rel.type == rel.type):
-                return False
+        key = (rel.source_id, rel.target_id, rel.type)
+        if key in self._rel_keys:
+            return False
 
+        self.revision += 1
+        self._rel_keys.add(key)
         self.relationships.append(rel)
-        self.graph.add_edge(rel.source_id, rel.target_id, **rel.to_dict())
+        if self._deferred:
+            self._pending_edges.append(rel)
+        else:
+            self.graph.add_edge(rel.source_id, rel.target_id, **rel.to_dict())
         return True
 
+    def add_relationships(self, relationships: Iterable[Relationship]) -> int:
+        """Добавляет несколько связей одним пакетом.
+
+        Граф обновляется один раз для всего пакета (см. bulk_update).
+
+        Args:
+            relationships: Связи для добавления.
+
+        Returns:
+            Количество добавленных связей (связи с несуществующими
+            объектами и дубликаты пропускаются).
+        """
+        with self.bulk_update():
+            return sum(1 for rel in relationships if self.add_relationship(rel))
+
     def update_relationship(self, old_rel: Tuple[str, str, str],
                            new_rel: Relationship) -> bool:
         """Обновляет существующую связь.
@@ -856,17 +1099,8 @@ class DependencyManager:
         Returns:
             True если связь обновлена.
         """
-        source_id, target_id, rel_type = old_rel
-
         # Удаляем старую связь
-        for i, rel in enumerate(self.relationships):
-            if (rel.source_id == source_id and
-                rel.target_id == target_id and
-                rel.type == rel_type):
-                del self.relationships[i]
-                if self.graph.has_edge(source_id, target_id):
-                    self.graph.remove_edge(source_id, target_id)
-                break
+        self.remove_relationship(*old_rel)
 
         return self.add_relationship(new_rel)
 
@@ -882,6 +1116,13 @@ class DependencyManager:
         Returns:
             True если связь удалена, False если не найдена.
         """
+        key = (source_id, target_id, rel_type)
+        if key not in self._rel_keys:
+            return False
+
+        self._flush_deferred()
+        self.revision += 1
+        self._rel_keys.discard(key)
         for i, rel in enumerate(self.relationships):
             if (rel.source_id == source_id and
                 rel.target_id == target_id and
@@ -892,6 +1133,17 @@ class DependencyManager:
                 return True
         return False
 
+    def _discard_rel_keys(self, obj_id: str) -> None:
+        """Удаляет из индекса ключи всех связей, затрагивающих объект.
+
+        Args:
+            obj_id: ID объекта.
+        """
+        self._rel_keys -= {
+            key for key in self._rel_keys
+            if key[0] == obj_id or key[1] == obj_id
+        }
+
     def get_dependencies(self, obj_id: str) -> List[str]:
         """Возвращает список объектов, от которых зависит данный объект.
 
@@ -941,60 +1193,63 @@ class DependencyManager:
             added_objects = 0
             added_relationships = 0
 
-            # Создаём объекты для сервисов
-            for service_name, service_config in services.items():
-                obj_id = f"docker_{service_name}"
-                properties = {
-                    'image': service_config.get('image', 'N/A'),
-                    'ports': str(service_config.get('ports', [])),
-                    'environment': str(service_config.get('environment', {}))
-                }
+            with self.bulk_update():
+                # Создаём объекты для сервисов
+                for service_name, service_config in services.items():
+                    obj_id = f"docker_{service_name}"
+                    # Храним исходные структуры: в строку они превращаются
+                    # только при отображении
+                    properties = {
+                        'image': service_config.get('image', 'N/A'),
+                        'ports': _json_safe(service_config.get('ports') or []),
+                        'environment': _json_safe(service_config.get('environment') or {})
+                    }
 
-                obj = InfraObject(obj_id, 'docker_container', service_name, properties)
-                if self.add_object(obj):
-                    added_objects += 1
-
-                # Обрабатываем depends_on
-                depends_on = service_config.get('depends_on', [])
-                if isinstance(depends_on, dict):
-                    depends_on = list(depends_on.keys())
-
-                for dep in depends_on:
-                    dep_id = f"docker_{dep}"
-                    rel = Relationship(obj_id, dep_id, 'depends_on', 'Docker Compose dependency')
-                    if self.add_relationship(rel):
-                        added_relationships += 1
-
-                # Обрабатываем тома
-                service_volumes = service_config.get('volumes', [])
-                for vol in service_volumes:
-                    if isinstance(vol, str) and ':' in vol:
-                        vol_name = vol.split(':')[0]
-                        if vol_name in volumes:
-                            vol_id = f"vol_{vol_name}"
-                            if vol_id not in self.objects:
-                                vol_obj = InfraObject(
-                                    vol_id, 'database', f"Том: {vol_name}",
-                                    {'type': 'volume'}
-                                )
-                                if self.add_object(vol_obj):
-                                    added_objects += 1
-
-                            rel = Relationship(obj_id, vol_id, 'uses', 'Uses volume')
-                            if self.add_relationship(rel):
-                                added_relationships += 1
-
-            # Создаём объект для сети если есть
-            for network_name in networks.keys():
-                net_id = f"net_{network_name}"
-                if net_id not in self.objects:
-                    net_obj = InfraObject(
-                        net_id, 'router', f"Сеть: {network_name}",
-                        {'type': 'network'}
-                    )
-                    if self.add_object(net_obj):
+                    obj = InfraObject(obj_id, 'docker_container', service_name, properties)
+                    if self.add_object(obj):
                         added_objects += 1
 
+                    # Обрабатываем depends_on
+                    depends_on = service_config.get('depends_on', [])
+                    if isinstance(depends_on, dict):
+                        depends_on = list(depends_on.keys())
+
+                    for dep in depends_on:
+                        dep_id = f"docker_{dep}"
+                        rel = Relationship(obj_id, dep_id, 'depends_on', 'Docker Compose dependency')
+                        if self.add_relationship(rel):
+                            added_relationships += 1
+
+                    # Обрабатываем тома
+                    service_volumes = service_config.get('volumes', [])
+                    for vol in service_volumes:
+                        if isinstance(vol, str) and ':' in vol:
+                            vol_name = vol.split(':')[0]
+                            if vol_name in volumes:
+                                vol_id = f"vol_{vol_name}"
+                                if vol_id not in self.objects:
+                                    vol_obj = InfraObject(
+                                        vol_id, 'database', f"Том: {vol_name}",
+                                        {'type': 'volume'}
+                                    )
+                                    if self.add_object(vol_obj):
+                                        added_objects += 1
+
+                                rel = Relationship(obj_id, vol_id, 'uses', 'Uses volume')
+                                if self.add_relationship(rel):
+                                    added_relationships += 1
+
+                # Создаём объект для сети если есть
+                for network_name in networks.keys():
+                    net_id = f"net_{network_name}"
+                    if net_id not in self.objects:
+                        net_obj = InfraObject(
+                            net_id, 'router', f"Сеть: {network_name}",
+                            {'type': 'network'}
+                        )
+                        if self.add_object(net_obj):
+                            added_objects += 1
+
             return added_objects, added_relationships
 
         except Exception as e:
@@ -1019,75 +1274,76 @@ class DependencyManager:
             added_objects = 0
             added_relationships = 0
 
-            for doc in docs:
-                if not doc or 'kind' not in doc:
-                    continue
-
-                kind = doc['kind']
-                metadata = doc.get('metadata', {})
-                name = metadata.get('name', 'unnamed')
-
-                if kind == 'Deployment':
-                    spec = doc.get('spec', {})
-                    template = spec.get('template', {})
-                    containers = template.get('spec', {}).get('containers', [])
+            with self.bulk_update():
+                for doc in docs:
+                    if not doc or 'kind' not in doc:
+                        continue
+
+                    kind = doc['kind']
+                    metadata = doc.get('metadata', {})
+                    name = metadata.get('name', 'unnamed')
+
+                    if kind == 'Deployment':
+                        spec = doc.get('spec', {})
+                        template = spec.get('template', {})
+                        containers = template.get('spec', {}).get('containers', [])
+
+                        for container in containers:
+                            container_name = container.get('name', 'container')
+                            obj_id = f"k8s_{name}_{container_name}"
+
+                            properties = {
+                                'image': container.get('image', 'N/A'),
+                                'kind': 'Deployment',
+                                'namespace': metadata.get('namespace', 'default')
+                            }
+
+                            obj = InfraObject(
+                                obj_id, 'docker_container',
+                                f"{name}/{container_name}", properties
+                            )
+                            if self.add_object(obj):
+                                added_objects += 1
 
-                    for container in containers:
-                        container_name = container.get('name', 'container')
-                        obj_id = f"k8s_{name}_{container_name}"
+                    elif kind == 'Service':
+                        obj_id = f"k8s_svc_{name}"
+                        spec = doc.get('spec', {})
 
                         properties = {
-                            'image': container.get('image', 'N/A'),
-                            'kind': 'Deployment',
-                            'namespace': metadata.get('namespace', 'default')
+                            'type': spec.get('type', 'ClusterIP'),
+                            'ports': _json_safe(spec.get('ports') or []),
+                            'kind': 'Service'
                         }
 
-                        obj = InfraObject(
-                            obj_id, 'docker_container',
-                            f"{name}/{container_name}", properties
-                        )
+                        obj = InfraObject(obj_id, 'server', f"Service: {name}", properties)
                         if self.add_object(obj):
                             added_objects += 1
 
-                elif kind == 'Service':
-                    obj_id = f"k8s_svc_{name}"
-                    spec = doc.get('spec', {})
-
-                    properties = {
-                        'type': spec.get('type', 'ClusterIP'),
-                        'ports': str(spec.get('ports', [])),
-                        'kind': 'Service'
-                    }
-
-                    obj = InfraObject(obj_id, 'server', f"Service: {name}", properties)
-                    if self.add_object(obj):
-                        added_objects += 1
-
-                    # Связываем с подами по селектору
-                    selector = spec.get('selector', {})
-                    if 'app' in selector:
-                        app_name = selector['app']
-                        for obj_key in self.objects.keys():
-                            if app_name in obj_key and 'k8s_' in obj_key and obj_key != obj_id:
-                                rel = Relationship(
-                                    obj_id, obj_key, 'routes_through',
-                                    'K8s Service routes to Pod'
-                                )
-                                if self.add_relationship(rel):
-                                    added_relationships += 1
-
-                elif kind == 'PersistentVolumeClaim':
-                    obj_id = f"k8s_pvc_{name}"
-                    spec = doc.get('spec', {})
+                        # Связываем с подами по селектору
+                        selector = spec.get('selector', {})
+                        if 'app' in selector:
+                            app_name = selector['app']
+                            for obj_key in self.objects.keys():
+                                if app_name in obj_key and 'k8s_' in obj_key and obj_key != obj_id:
+                                    rel = Relationship(
+                                        obj_id, obj_key, 'routes_through',
+                                        'K8s Service routes to Pod'
+                                    )
+                                    if self.add_relationship(rel):
+                                        added_relationships += 1
+
+                    elif kind == 'PersistentVolumeClaim':
+                        obj_id = f"k8s_pvc_{name}"
+                        spec = doc.get('spec', {})
 
-                    properties = {
-                        'storage': str(spec.get('resources', {}).get('requests', {}).get('storage', 'N/A')),
-                        'kind': 'PersistentVolumeClaim'
-                    }
+                        properties = {
+                            'storage': str(spec.get('resources', {}).get('requests', {}).get('storage', 'N/A')),
+                            'kind': 'PersistentVolumeClaim'
+                        }
 
-                    obj = InfraObject(obj_id, 'database', f"PVC: {name}", properties)
-                    if self.add_object(obj):
-                        added_objects += 1
+                        obj = InfraObject(obj_id, 'database', f"PVC: {name}", properties)
+                        if self.add_object(obj):
+                            added_objects += 1
 
             return added_objects, added_relationships
 
@@ -1117,8 +1373,19 @@ class DependencyManager:
                 }
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Пишем во временный файл и подменяем им старый: при ошибке
+            # сериализации прежний файл проекта остаётся целым
+            tmp_filename = filename + '.tmp'
+            try:
+                with open(tmp_filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_filename, filename)
+            except BaseException:
+                try:
+                    os.remove(tmp_filename)
+                except OSError:
+                    pass
+                raise
             return True
         except Exception as e:
             print(f"Ошибка сохранения: {e}")
@@ -1134,30 +1401,37 @@ class DependencyManager:
             True если загрузка успешна, False при ошибке.
         """
         try:
-            if not os.path.exists(filename):
+            # Один stat вместо отдельных проверок существования и размера
+            try:
+                st = os.stat(filename)
+            except FileNotFoundError:
                 return False
 
             # Ограничение размера файла (10 МБ)
-            if os.path.getsize(filename) > 10 * 1024 * 1024:
+            if st.st_size > 10 * 1024 * 1024:
                 raise ValueError("Файл слишком большой")
 
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Читаем файл целиком за один вызов, json сам декодирует UTF-8
+            with open(filename, 'rb') as f:
+                data = json.loads(f.read())
 
             # Очищаем текущие данные
             self.objects.clear()
             self.relationships.clear()
+            self._rel_keys.clear()
             self.graph.clear()
+            self.revision += 1
 
-            # Загружаем объекты
-            for obj_data in data.get('objects', []):
-                obj = InfraObject.from_dict(obj_data)
-                self.add_object(obj)
+            with self.bulk_update():
+                # Загружаем объекты
+                for obj_data in data.get('objects', []):
+                    obj = InfraObject.from_dict(obj_data)
+                    self.add_object(obj)
 
-            # Загружаем связи
-            for rel_data in data.get('relationships', []):
-                rel = Relationship.from_dict(rel_data)
-                self.add_relationship(rel)
+                # Загружаем связи
+                for rel_data in data.get('relationships', []):
+                    rel = Relationship.from_dict(rel_data)
+                    self.add_relationship(rel)
 
             return True
         except Exception as e:
@@ -1169,7 +1443,95 @@ class DependencyManager:
 # ДИАЛОГОВЫЕ ОКНА
 # =============================================================================
 
-class GodotImportDialog(QDialog):
+class _ReusableDialog(QDialog):
+    """Базовый класс диалога, переиспользуемого между открытиями.
+
+    Экземпляр создаётся один раз для родительского окна и текущего языка;
+    при повторном открытии заполняются только поля через reset(), без
+    построения виджетов и разбора таблицы стилей заново. Стили
+    применяются при первом показе, а не при создании.
+    """
+
+    # Кэш экземпляров: id(родителя) -> диалог (свой у каждого подкласса)
+    _instances: Dict[int, '_ReusableDialog'] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __init__(self, parent=None) -> None:
+        """Инициализирует диалог.
+
+        Args:
+            parent: Родительский виджет.
+        """
+        super().__init__(parent)
+        self._language = CURRENT_LANGUAGE
+        self._styled = False
+
+    def showEvent(self, event) -> None:
+        """Применяет стили при первом показе диалога.
+
+        Args:
+            event: Событие показа.
+        """
+        if not self._styled:
+            self.apply_styles()
+            self._styled = True
+        super().showEvent(event)
+
+    def apply_styles(self) -> None:
+        """Применяет стили к элементам диалога."""
+        install_app_styles()
+
+    @classmethod
+    def get_instance(cls, parent=None, **kwargs) -> '_ReusableDialog':
+        """Возвращает закэшированный диалог, подготовленный к показу.
+
+        Диалог, созданный на другом языке, пересоздаётся.
+
+        Args:
+            parent: Родительский виджет.
+            **kwargs: Параметры конструктора и reset() подкласса.
+
+        Returns:
+            Экземпляр диалога.
+        """
+        key = id(parent)
+        dialog = cls._instances.get(key)
+        if dialog is not None:
+            if dialog._language == CURRENT_LANGUAGE:
+                dialog.reset(**kwargs)
+                return dialog
+            dialog.deleteLater()
+        elif parent is not None:
+            # Вместе с родителем уничтожается и диалог
+            parent.destroyed.connect(lambda *_: cls._instances.pop(key, None))
+
+        dialog = cls._instances[key] = cls(parent=parent, **kwargs)
+        return dialog
+
+    def reset(self, **kwargs) -> None:
+        """Заполняет поля диалога перед очередным показом."""
+
+
+@dataclass(frozen=True)
+class GodotImportOptions:
+    """Опции фильтрации ресурсов при импорте Godot проекта.
+
+    Attributes:
+        exclude_textures: Исключить текстуры.
+        exclude_audio: Исключить аудио.
+        exclude_fonts: Исключить шрифты.
+    """
+    __slots__ = ('exclude_textures', 'exclude_audio', 'exclude_fonts')
+
+    exclude_textures: bool
+    exclude_audio: bool
+    exclude_fonts: bool
+
+
+class GodotImportDialog(_ReusableDialog):
     """Диалог настройки импорта Godot проекта.
 
     Позволяет выбрать, какие типы ресурсов исключить из импорта.
@@ -1187,83 +1549,35 @@ class GodotImportDialog(QDialog):
             parent: Родительский виджет.
         """
         super().__init__(parent)
+        self.setObjectName("godotImportDialog")
         self.setWindowTitle(tr('godot_import_options'))
-        self.setMinimumWidth(350)
         self.setup_ui()
-        self.apply_styles()
-
-    def apply_styles(self) -> None:
-        """Применяет стили к элементам диалога."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-            }
-            QCheckBox {
-                color: #212529;
-                font-size: 11pt;
-                padding: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-            }
-            QCheckBox::indicator:unchecked {
-                border: 2px solid #DEE2E6;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                border: 2px solid #007BFF;
-                border-radius: 4px;
-                background-color: #007BFF;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 10pt;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-            QPushButton[text="Отмена"], QPushButton[text="Cancel"] {
-                background-color: #6C757D;
-            }
-            QPushButton[text="Отмена"]:hover, QPushButton[text="Cancel"]:hover {
-                background-color: #5a6268;
-            }
-        """)
 
     def setup_ui(self) -> None:
         """Настраивает элементы интерфейса диалога."""
+        # Откладываем перерисовку до окончания построения интерфейса
+        self.setUpdatesEnabled(False)
+
         layout = QVBoxLayout()
         layout.setSpacing(15)
 
         # Заголовок
         title_label = QLabel(f"<b>{tr('godot_import_options')}</b>")
-        title_label.setStyleSheet("font-size: 12pt; color: #212529; padding: 10px;")
+        title_label.setObjectName("titleLabel")
         layout.addWidget(title_label)
 
         # Чекбоксы фильтрации
         self.textures_cb = QCheckBox(tr('exclude_textures'))
-        self.textures_cb.setChecked(True)
         layout.addWidget(self.textures_cb)
 
         self.audio_cb = QCheckBox(tr('exclude_audio'))
-        self.audio_cb.setChecked(False)
         layout.addWidget(self.audio_cb)
 
         self.fonts_cb = QCheckBox(tr('exclude_fonts'))
-        self.fonts_cb.setChecked(False)
         layout.addWidget(self.fonts_cb)
 
+        self.reset()
+
         layout.addSpacing(10)
 
         # Кнопки
@@ -1272,6 +1586,8 @@ class GodotImportDialog(QDialog):
 
         self.import_btn = QPushButton(tr('btn_import'))
         self.cancel_btn = QPushButton(tr('btn_cancel'))
+        # Стиль кнопки задаётся селектором по objectName, а не по тексту
+        self.cancel_btn.setObjectName("cancelBtn")
 
         self.import_btn.clicked.connect(self.accept)
         self.cancel_btn.clicked.connect(self.reject)
@@ -1281,21 +1597,29 @@ class GodotImportDialog(QDialog):
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
+        self.setMinimumWidth(350)
+        self.setUpdatesEnabled(True)
+
+    def reset(self) -> None:
+        """Возвращает флажки к значениям по умолчанию."""
+        self.textures_cb.setChecked(True)
+        self.audio_cb.setChecked(False)
+        self.fonts_cb.setChecked(False)
 
-    def get_options(self) -> Dict[str, bool]:
+    def get_options(self) -> GodotImportOptions:
         """Возвращает выбранные опции фильтрации.
 
         Returns:
-            Словарь с флагами исключения типов ресурсов.
+            Флаги исключения типов ресурсов.
         """
-        return {
-            'exclude_textures': self.textures_cb.isChecked(),
-            'exclude_audio': self.audio_cb.isChecked(),
-            'exclude_fonts': self.fonts_cb.isChecked()
-        }
+        return GodotImportOptions(
+            exclude_textures=self.textures_cb.isChecked(),
+            exclude_audio=self.audio_cb.isChecked(),
+            exclude_fonts=self.fonts_cb.isChecked()
+        )
 
 
-class LayoutDialog(QDialog):
+class LayoutDialog(_ReusableDialog):
     """Диалог выбора алгоритма компоновки графа.
 
     Позволяет выбрать алгоритм расположения узлов на графе.
@@ -1321,67 +1645,16 @@ class LayoutDialog(QDialog):
             current_layout: Текущий выбранный алгоритм.
         """
         super().__init__(parent)
+        self.setObjectName("layoutDialog")
         self.selected_layout = current_layout
         self.setWindowTitle(tr('layout_dialog'))
-        self.setMinimumWidth(300)
         self.setup_ui()
-        self.apply_styles()
-
-    def apply_styles(self) -> None:
-        """Применяет стили к элементам диалога."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-            }
-            QLabel {
-                color: #212529;
-                font-size: 11pt;
-                padding: 5px;
-            }
-            QListWidget {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                background-color: #F8F9FA;
-                padding: 5px;
-                font-size: 11pt;
-            }
-            QListWidget::item {
-                padding: 10px;
-                border-radius: 4px;
-                margin: 2px;
-                color: #212529;
-            }
-            QListWidget::item:selected {
-                background-color: #007BFF;
-                color: white;
-            }
-            QListWidget::item:hover:!selected {
-                background-color: #E9ECEF;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #0056b3;
-                color: white;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 10pt;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
 
     def setup_ui(self) -> None:
         """Настраивает элементы интерфейса диалога."""
+        # Откладываем перерисовку до окончания построения интерфейса
+        self.setUpdatesEnabled(False)
+
         layout = QVBoxLayout()
         layout.setSpacing(10)
 
@@ -1391,14 +1664,18 @@ class LayoutDialog(QDialog):
 
         # Список алгоритмов
         self.layout_list = QListWidget()
-        for layout_key, label_key in self.LAYOUTS.items():
-            item = QListWidgetItem(tr(label_key))
-            item.setData(Qt.UserRole, layout_key)
-            self.layout_list.addItem(item)
-            if layout_key == self.selected_layout:
-                self.layout_list.setCurrentItem(item)
-
-        self.layout_list.itemDoubleClicked.connect(self.accept)
+        self.layout_list.setUpdatesEnabled(False)
+        # Подписи добавляются одним вызовом, затем к строкам
+        # привязываются идентификаторы алгоритмов
+        self.layout_list.addItems([tr(label_key) for label_key in self.LAYOUTS.values()])
+        for row, layout_key in enumerate(self.LAYOUTS):
+            self.layout_list.item(row).setData(Qt.UserRole, layout_key)
+        self.layout_list.setUpdatesEnabled(True)
+        self.reset(self.selected_layout)
+
+        # Закрытие откладывается до следующей итерации цикла событий,
+        # чтобы не прерывать обработку двойного клика списком
+        self.layout_list.itemDoubleClicked.connect(self.accept, Qt.QueuedConnection)
         layout.addWidget(self.layout_list)
 
         # Кнопки
@@ -1416,6 +1693,21 @@ class LayoutDialog(QDialog):
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
+        self.setMinimumWidth(300)
+        self.setUpdatesEnabled(True)
+
+    def reset(self, current_layout: str = 'spring') -> None:
+        """Выделяет в списке указанный алгоритм компоновки.
+
+        Args:
+            current_layout: Идентификатор алгоритма.
+        """
+        self.selected_layout = layout_key = current_layout
+        for row in range(self.layout_list.count()):
+            item = self.layout_list.item(row)
+            if item.data(Qt.UserRole) == layout_key:
+                self.layout_list.setCurrentItem(item)
+                return
 
     def get_layout(self) -> str:
         """Возвращает выбранный алгоритм компоновки.
@@ -1429,7 +1721,7 @@ class LayoutDialog(QDialog):
         return 'spring'
 
 
-class ObjectDialog(QDialog):
+class ObjectDialog(_ReusableDialog):
     """Диалог создания и редактирования объекта.
 
     Позволяет задать ID, тип, название и описание объекта.
@@ -1438,6 +1730,9 @@ class ObjectDialog(QDialog):
         edit_obj: Редактируемый объект или None для создания нового.
     """
 
+    # Позиция типа в выпадающем списке (порядок VALID_TYPES)
+    _TYPE_INDEX = {t: i for i, t in enumerate(InfraObject.VALID_TYPES)}
+
     def __init__(self, parent=None, edit_obj: InfraObject = None) -> None:
         """Инициализирует диалог объекта.
 
@@ -1446,103 +1741,46 @@ class ObjectDialog(QDialog):
             edit_obj: Объект для редактирования или None для создания.
         """
         super().__init__(parent)
-        self.edit_obj = edit_obj
-        self.setWindowTitle(tr('dialog_edit_object') if edit_obj else tr('dialog_add_object'))
-        self.setMinimumWidth(400)
+        self.setObjectName("objectDialog")
         self.setup_ui()
-        self.apply_styles()
-
-    def apply_styles(self) -> None:
-        """Применяет стили к элементам диалога."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-            }
-            QLabel {
-                color: #212529;
-                font-size: 10pt;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: white;
-                font-size: 10pt;
-                color: #212529;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border-color: #007BFF;
-            }
-            QComboBox {
-                padding-right: 20px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: white;
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                selection-background-color: #007BFF;
-                selection-color: white;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
+        self.reset(edit_obj)
 
     def setup_ui(self) -> None:
         """Настраивает элементы интерфейса диалога."""
+        # Откладываем перерисовку до окончания построения интерфейса
+        self.setUpdatesEnabled(False)
+
         layout = QVBoxLayout()
         layout.setSpacing(10)
 
+        # Поля формы: подпись и поле добавляются одной строкой,
+        # подпись располагается над полем
+        form = QFormLayout()
+        form.setRowWrapPolicy(QFormLayout.WrapAllRows)
+        form.setSpacing(10)
+
         # Поле ID
-        layout.addWidget(QLabel(tr('object_id')))
         self.id_input = QLineEdit()
         self.id_input.setPlaceholderText(tr('placeholder_id'))
-        if self.edit_obj:
-            self.id_input.setText(self.edit_obj.id)
-        layout.addWidget(self.id_input)
+        form.addRow(tr('object_id'), self.id_input)
 
         # Выбор типа
-        layout.addWidget(QLabel(tr('object_type')))
         self.type_combo = QComboBox()
         self.type_combo.addItems(InfraObject.VALID_TYPES)
-        if self.edit_obj:
-            index = self.type_combo.findText(self.edit_obj.type)
-            if index >= 0:
-                self.type_combo.setCurrentIndex(index)
-        layout.addWidget(self.type_combo)
+        form.addRow(tr('object_type'), self.type_combo)
 
         # Поле названия
-        layout.addWidget(QLabel(tr('object_name')))
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText(tr('placeholder_name'))
-        if self.edit_obj:
-            self.name_input.setText(self.edit_obj.name)
-        layout.addWidget(self.name_input)
+        form.addRow(tr('object_name'), self.name_input)
 
         # Поле описания
-        layout.addWidget(QLabel(tr('object_description')))
-        self.description_input = QTextEdit()
+        self.description_input = QPlainTextEdit()
         self.description_input.setMaximumHeight(80)
         self.description_input.setPlaceholderText(tr('placeholder_desc'))
-        if self.edit_obj and 'description' in self.edit_obj.properties:
-            self.description_input.setPlainText(self.edit_obj.properties['description'])
-        layout.addWidget(self.description_input)
+        form.addRow(tr('object_description'), self.description_input)
+
+        layout.addLayout(form)
 
         # Кнопки
         button_layout = QHBoxLayout()
@@ -1559,15 +1797,38 @@ class ObjectDialog(QDialog):
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
+        self.setMinimumWidth(400)
+        self.setUpdatesEnabled(True)
 
-    def get_object(self) -> Optional[InfraObject]:
-        """Создаёт объект из введённых данных.
+    def reset(self, edit_obj: InfraObject = None) -> None:
+        """Заполняет поля данными объекта или очищает их.
 
-        Returns:
-            Новый InfraObject или None при ошибке валидации.
+        Args:
+            edit_obj: Объект для редактирования или None для создания.
         """
-        obj_id = self.id_input.text().strip()
-        obj_type = self.type_combo.currentText()
+        self.edit_obj = edit_obj
+        self.setWindowTitle(tr('dialog_edit_object') if edit_obj else tr('dialog_add_object'))
+
+        if edit_obj:
+            self.id_input.setText(edit_obj.id)
+            self.type_combo.setCurrentIndex(self._TYPE_INDEX.get(edit_obj.type, 0))
+            self.name_input.setText(edit_obj.name)
+            self.description_input.setPlainText(edit_obj.properties.get('description', ''))
+        else:
+            self.id_input.clear()
+            self.type_combo.setCurrentIndex(0)
+            self.name_input.clear()
+            self.description_input.clear()
+        self.id_input.setFocus()
+
+    def get_object(self) -> Optional[InfraObject]:
+        """Создаёт объект из введённых данных.
+
+        Returns:
+            Новый InfraObject или None при ошибке валидации.
+        """
+        obj_id = self.id_input.text().strip()
+        obj_type = self.type_combo.currentText()
         name = self.name_input.text().strip()
         description = self.description_input.toPlainText().strip()
 
@@ -1591,7 +1852,7 @@ class ObjectDialog(QDialog):
             return None
 
 
-class RelationshipDialog(QDialog):
+class RelationshipDialog(_ReusableDialog):
     """Диалог создания и редактирования связи.
 
     Позволяет выбрать исходный и целевой объекты, тип связи и описание.
@@ -1601,6 +1862,9 @@ class RelationshipDialog(QDialog):
         edit_rel: Редактируемая связь или None для создания новой.
     """
 
+    # Позиция типа в выпадающем списке (порядок VALID_TYPES)
+    _TYPE_INDEX = {t: i for i, t in enumerate(Relationship.VALID_TYPES)}
+
     def __init__(self, objects: Dict[str, InfraObject], parent=None,
                  edit_rel: Relationship = None) -> None:
         """Инициализирует диалог связи.
@@ -1611,106 +1875,48 @@ class RelationshipDialog(QDialog):
             edit_rel: Связь для редактирования или None.
         """
         super().__init__(parent)
-        self.objects = objects
-        self.edit_rel = edit_rel
-        self.setWindowTitle(tr('dialog_edit_relationship') if edit_rel else tr('dialog_add_relationship'))
-        self.setMinimumWidth(400)
+        self.setObjectName("relationshipDialog")
         self.setup_ui()
-        self.apply_styles()
-
-    def apply_styles(self) -> None:
-        """Применяет стили к элементам диалога."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-            }
-            QLabel {
-                color: #212529;
-                font-size: 10pt;
-            }
-            QComboBox, QTextEdit {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: white;
-                font-size: 10pt;
-                color: #212529;
-            }
-            QComboBox:focus, QTextEdit:focus {
-                border-color: #007BFF;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: white;
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                selection-background-color: #007BFF;
-                selection-color: white;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-        """)
+        self.reset(objects, edit_rel)
 
     def setup_ui(self) -> None:
         """Настраивает элементы интерфейса диалога."""
+        # Откладываем перерисовку до окончания построения интерфейса
+        self.setUpdatesEnabled(False)
+
         layout = QVBoxLayout()
         layout.setSpacing(10)
 
+        # Общая модель объектов для обоих выпадающих списков,
+        # заполняется в reset()
+        self.objects_model = QStandardItemModel(self)
+
+        # Поля формы: подпись располагается над полем
+        form = QFormLayout()
+        form.setRowWrapPolicy(QFormLayout.WrapAllRows)
+        form.setSpacing(10)
+
         # Выбор исходного объекта
-        layout.addWidget(QLabel(tr('rel_source')))
         self.source_combo = QComboBox()
-        for obj in self.objects.values():
-            self.source_combo.addItem(f"{obj.name} ({obj.id})", obj.id)
-        if self.edit_rel:
-            index = self.source_combo.findData(self.edit_rel.source_id)
-            if index >= 0:
-                self.source_combo.setCurrentIndex(index)
-        layout.addWidget(self.source_combo)
+        self.source_combo.setModel(self.objects_model)
+        form.addRow(tr('rel_source'), self.source_combo)
 
         # Выбор типа связи
-        layout.addWidget(QLabel(tr('rel_type')))
         self.type_combo = QComboBox()
         self.type_combo.addItems(Relationship.VALID_TYPES)
-        if self.edit_rel:
-            index = self.type_combo.findText(self.edit_rel.type)
-            if index >= 0:
-                self.type_combo.setCurrentIndex(index)
-        layout.addWidget(self.type_combo)
+        form.addRow(tr('rel_type'), self.type_combo)
 
         # Выбор целевого объекта
-        layout.addWidget(QLabel(tr('rel_target')))
         self.target_combo = QComboBox()
-        for obj in self.objects.values():
-            self.target_combo.addItem(f"{obj.name} ({obj.id})", obj.id)
-        if self.edit_rel:
-            index = self.target_combo.findData(self.edit_rel.target_id)
-            if index >= 0:
-                self.target_combo.setCurrentIndex(index)
-        layout.addWidget(self.target_combo)
+        self.target_combo.setModel(self.objects_model)
+        form.addRow(tr('rel_target'), self.target_combo)
 
         # Поле описания
-        layout.addWidget(QLabel(tr('rel_description')))
-        self.description_input = QTextEdit()
+        self.description_input = QPlainTextEdit()
         self.description_input.setMaximumHeight(60)
-        if self.edit_rel:
-            self.description_input.setPlainText(self.edit_rel.description)
-        layout.addWidget(self.description_input)
+        form.addRow(tr('rel_description'), self.description_input)
+
+        layout.addLayout(form)
 
         # Кнопки
         button_layout = QHBoxLayout()
@@ -1727,6 +1933,44 @@ class RelationshipDialog(QDialog):
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
+        self.setMinimumWidth(400)
+        self.setUpdatesEnabled(True)
+
+    def reset(self, objects: Dict[str, InfraObject],
+              edit_rel: Relationship = None) -> None:
+        """Перезаполняет списки объектов и поля данными связи.
+
+        Args:
+            objects: Словарь объектов для выбора.
+            edit_rel: Связь для редактирования или None.
+        """
+        self.objects = objects
+        self.edit_rel = edit_rel
+        self.setWindowTitle(tr('dialog_edit_relationship') if edit_rel else tr('dialog_add_relationship'))
+
+        # Элементы создаются один раз для обоих списков
+        # и вставляются в модель одним вызовом; попутно запоминаем
+        # позицию каждого объекта, чтобы не искать её через findData()
+        items = []
+        id_to_index = {}
+        for index, obj in enumerate(objects.values()):
+            item = QStandardItem(obj.display_label)
+            item.setData(obj.id, Qt.UserRole)
+            items.append(item)
+            id_to_index[obj.id] = index
+        self.objects_model.clear()
+        self.objects_model.appendColumn(items)
+
+        if edit_rel:
+            self.source_combo.setCurrentIndex(id_to_index.get(edit_rel.source_id, 0))
+            self.type_combo.setCurrentIndex(self._TYPE_INDEX.get(edit_rel.type, 0))
+            self.target_combo.setCurrentIndex(id_to_index.get(edit_rel.target_id, 0))
+            self.description_input.setPlainText(edit_rel.description)
+        else:
+            self.source_combo.setCurrentIndex(0)
+            self.type_combo.setCurrentIndex(0)
+            self.target_combo.setCurrentIndex(0)
+            self.description_input.clear()
 
     def get_relationship(self) -> Optional[Relationship]:
         """Создаёт связь из введённых данных.
@@ -1754,6 +1998,205 @@ class RelationshipDialog(QDialog):
 # ХОЛСТ ГРАФА
 # =============================================================================
 
+# Начиная с этого размера отталкивание дальних узлов считается приближённо
+APPROX_REPULSION_NODES = 1000
+
+
+def _grid_repulsion(pos: np.ndarray, k_squared: float) -> np.ndarray:
+    """Приближённо вычисляет силы отталкивания между всеми узлами.
+
+    Узлы раскладываются по квадратной сетке из ~3*sqrt(N) ячеек.
+    Отталкивание от узлов своей и соседних ячеек считается точно,
+    от остальных ячеек - как от одной точки в центре масс ячейки
+    (одноуровневый вариант Barnes-Hut). Вместо N^2 пар получается
+    порядка N^1.5 взаимодействий.
+
+    Args:
+        pos: Массив позиций формы (N, 2).
+        k_squared: Квадрат оптимального расстояния между узлами.
+
+    Returns:
+        Массив смещений от отталкивания формы (N, 2).
+    """
+    n = len(pos)
+    size = max(2, int(np.sqrt(3 * np.sqrt(n))))
+
+    # Ячейка каждого узла
+    low = pos.min(axis=0)
+    span = np.maximum(pos.max(axis=0) - low, 1e-6)
+    cell_xy = np.minimum(((pos - low) / span * size).astype(np.int64), size - 1)
+    cell = cell_xy[:, 0] * size + cell_xy[:, 1]
+    cell_count = size * size
+    counts = np.bincount(cell, minlength=cell_count)
+
+    # Дальнее поле: центры масс занятых ячеек, кроме соседних
+    occupied = np.nonzero(counts)[0]
+    mass = counts[occupied].astype(pos.dtype)
+    centroids = np.column_stack((
+        np.bincount(cell, pos[:, 0], cell_count)[occupied],
+        np.bincount(cell, pos[:, 1], cell_count)[occupied],
+    )) / mass[:, None]
+    far = ((np.abs(occupied // size - cell_xy[:, 0, None]) > 1) |
+           (np.abs(occupied % size - cell_xy[:, 1, None]) > 1))
+    dx = pos[:, 0, None] - centroids[None, :, 0]
+    dy = pos[:, 1, None] - centroids[None, :, 1]
+    dist = np.sqrt(dx * dx + dy * dy)
+    np.clip(dist, 0.01, None, out=dist)
+    force = np.where(far, mass * k_squared / (dist * dist), 0)
+    displacement = np.column_stack(((dx * force).sum(axis=1),
+                                    (dy * force).sum(axis=1)))
+
+    # Ближнее поле: точные пары с узлами своей и восьми соседних ячеек
+    order = np.argsort(cell, kind='stable')
+    starts = np.cumsum(counts) - counts
+    nodes = np.arange(n)
+    for off_x in (-1, 0, 1):
+        for off_y in (-1, 0, 1):
+            near_x = cell_xy[:, 0] + off_x
+            near_y = cell_xy[:, 1] + off_y
+            valid = (near_x >= 0) & (near_x < size) & (near_y >= 0) & (near_y < size)
+            near_cell = np.where(valid, near_x * size + near_y, 0)
+            near_count = np.where(valid, counts[near_cell], 0)
+            total = near_count.sum()
+            if total == 0:
+                continue
+
+            # Все пары (узел, узел соседней ячейки) без циклов Python
+            i = np.repeat(nodes, near_count)
+            within = np.arange(total) - np.repeat(np.cumsum(near_count) - near_count, near_count)
+            j = order[np.repeat(starts[near_cell], near_count) + within]
+
+            pair_dx = pos[i, 0] - pos[j, 0]
+            pair_dy = pos[i, 1] - pos[j, 1]
+            pair_dist = np.sqrt(pair_dx * pair_dx + pair_dy * pair_dy)
+            np.clip(pair_dist, 0.01, None, out=pair_dist)
+            pair_force = k_squared / (pair_dist * pair_dist)
+            displacement[:, 0] += np.bincount(i, pair_dx * pair_force, n)
+            displacement[:, 1] += np.bincount(i, pair_dy * pair_force, n)
+
+    return displacement
+
+
+def spring_layout_numpy(G: nx.Graph, k: float = 3.0, iterations: int = 50,
+                        seed: int = 42, threshold: float = 1e-4) -> Dict:
+    """Силовая компоновка Фрюхтермана-Рейнгольда на NumPy.
+
+    Повторяет плотный вариант nx.spring_layout, но считает в float32
+    и без трёхмерных промежуточных массивов. В отличие от networkx
+    не требует SciPy, которому networkx передаёт графы от 500 узлов.
+    Для графов больше APPROX_REPULSION_NODES отталкивание считается
+    приближённо через _grid_repulsion(), а притяжение - только по рёбрам.
+
+    Args:
+        G: Граф NetworkX.
+        k: Оптимальное расстояние между узлами.
+        iterations: Максимальное число итераций.
+        seed: Зерно начальных случайных позиций.
+        threshold: Порог среднего смещения для досрочной остановки.
+
+    Returns:
+        Словарь позиций {node_id: (x, y)}, масштабированных в [-1, 1].
+    """
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.zeros(2)}
+
+    pos = np.random.RandomState(seed).rand(n, 2).astype(np.float32)
+    approximate = n > APPROX_REPULSION_NODES
+    if approximate:
+        index = {node: i for i, node in enumerate(nodes)}
+        edge_src = np.fromiter((index[u] for u, _ in G.edges()), np.int64, G.number_of_edges())
+        edge_dst = np.fromiter((index[v] for _, v in G.edges()), np.int64, G.number_of_edges())
+    else:
+        adjacency = nx.to_numpy_array(G, nodelist=nodes, dtype=np.float32)
+
+    # Начальная "температура" - наибольший допустимый шаг, линейно убывает
+    t = max(np.ptp(pos[:, 0]), np.ptp(pos[:, 1])) * 0.1
+    dt = t / (iterations + 1)
+    k_squared = np.float32(k * k)
+    inv_k = np.float32(1.0 / k)
+
+    for _ in range(iterations):
+        if approximate:
+            displacement = _grid_repulsion(pos, k_squared)
+
+            # Притяжение исходного узла каждого ребра к целевому
+            edge_delta = pos[edge_src] - pos[edge_dst]
+            edge_dist = np.hypot(edge_delta[:, 0], edge_delta[:, 1])
+            np.clip(edge_dist, 0.01, None, out=edge_dist)
+            pull = edge_delta * (edge_dist * inv_k)[:, None]
+            displacement[:, 0] -= np.bincount(edge_src, pull[:, 0], n)
+            displacement[:, 1] -= np.bincount(edge_src, pull[:, 1], n)
+        else:
+            dx = pos[:, 0, None] - pos[None, :, 0]
+            dy = pos[:, 1, None] - pos[None, :, 1]
+            dist = np.sqrt(dx * dx + dy * dy)
+            np.clip(dist, 0.01, None, out=dist)
+
+            # Отталкивание всех пар и притяжение смежных узлов
+            force = k_squared / (dist * dist) - adjacency * dist * inv_k
+            displacement = np.column_stack(((dx * force).sum(axis=1),
+                                            (dy * force).sum(axis=1)))
+
+        length = np.hypot(displacement[:, 0], displacement[:, 1])
+        np.clip(length, 0.01, None, out=length)
+        delta_pos = displacement * (t / length)[:, None]
+        pos += delta_pos
+        t -= dt
+        if np.linalg.norm(delta_pos) / n < threshold:
+            break
+
+    pos = nx.rescale_layout(pos.astype(float), scale=1)
+    return dict(zip(nodes, pos))
+
+
+class _LayoutWorker(QThread):
+    """Поток для расчёта компоновки графа в фоне.
+
+    Signals:
+        layout_ready: Сигнал с ключом кэша и словарём позиций
+            {node_id: (x, y)} по окончании расчёта.
+    """
+
+    layout_ready = pyqtSignal(object, object)
+
+    # Запущенные потоки: ссылка держится до завершения расчёта,
+    # даже если холст, запустивший поток, уже закрыт
+    _active = set()
+
+    def __init__(self, compute, G: nx.Graph, algorithm: str, key) -> None:
+        """Инициализирует поток расчёта.
+
+        Args:
+            compute: Функция compute(G, algorithm), возвращающая позиции.
+            G: Копия графа, не изменяемая во время расчёта.
+            algorithm: Идентификатор алгоритма компоновки.
+            key: Ключ кэша компоновок для результата.
+        """
+        super().__init__()
+        self._compute = compute
+        self._graph = G
+        self._algorithm = algorithm
+        self._key = key
+
+        _LayoutWorker._active.add(self)
+        self.finished.connect(self._release)
+        # При выходе из приложения дожидаемся расчёта, иначе Qt аварийно
+        # завершит процесс при уничтожении работающего потока
+        QApplication.instance().aboutToQuit.connect(self.wait)
+
+    def run(self) -> None:
+        """Выполняет расчёт и отправляет результат."""
+        self.layout_ready.emit(self._key, self._compute(self._graph, self._algorithm))
+
+    def _release(self) -> None:
+        """Освобождает ссылку на завершившийся поток."""
+        _LayoutWorker._active.discard(self)
+
+
 class GraphCanvas(FigureCanvas):
     """Холст для отрисовки графа зависимостей.
 
@@ -1776,6 +2219,31 @@ class GraphCanvas(FigureCanvas):
     # Минимальное расстояние для различия клика и перетаскивания
     DRAG_THRESHOLD = 5
 
+    # Сколько последних компоновок хранить в кэше
+    LAYOUT_CACHE_SIZE = 8
+
+    # Начиная с этого размера компоновка считается в фоновом потоке
+    ASYNC_LAYOUT_NODES = 200
+
+    # Задержка перерисовки при панорамировании и масштабировании (~60 FPS)
+    REDRAW_DELAY_MS = 16
+
+    # Минимальный экранный радиус узла (в пикселях), при котором ещё
+    # показываются подписи узлов и подписи связей
+    NODE_LABEL_MIN_PX = 8
+    EDGE_LABEL_MIN_PX = 14
+
+    # Запас вокруг видимой области, за которым подписи и стрелки не
+    # рисуются: размер текста (в пикселях) плюс смещение подписи от узла
+    VIEW_CULL_MARGIN_PX = 100
+
+    # Начиная с этого размера силовая компоновка считается spring_layout_numpy()
+    LARGE_GRAPH_NODES = 200
+
+    # Оформление рёбер: (цвет, толщина, прозрачность)
+    EDGE_STYLE = ('#495057', 1.8, 0.6)
+    EDGE_HIGHLIGHT_STYLE = ('#E63946', 3.0, 1.0)
+
     def __init__(self, parent=None) -> None:
         """Инициализирует холст графа.
 
@@ -1797,11 +2265,27 @@ class GraphCanvas(FigureCanvas):
         self.edge_positions = {}
         self.node_radius = 0.15
 
+        # Кэш компоновок: (алгоритм, узлы, рёбра) -> позиции
+        self._layout_cache = OrderedDict()
+        # Ключ компоновки, которая сейчас считается в фоне
+        self._pending_layout = None
+
         # Хранение графических элементов для инкрементального обновления
         self.node_patches = {}      # {node_id: [list of patches]}
+        self.node_patch_index = {}  # {node_id: [(collection, index), ...]}
         self.node_texts = {}        # {node_id: [list of text objects]}
         self.edge_patches = {}      # {(src, tgt): arrow_patch}
         self.edge_labels = {}       # {(src, tgt): text object}
+        self._incident_edges = {}   # {node_id: [строки таблицы рёбер]}
+
+        # Таблица нарисованных рёбер для векторного пересчёта при
+        # перетаскивании: ключи рёбер и индексы их концов в _pos_arr
+        self._node_index = {}
+        self._node_ids = []
+        self._pos_arr = np.empty((0, 2))
+        self._edge_keys = []
+        self._edge_src = np.empty(0, dtype=np.intp)
+        self._edge_tgt = np.empty(0, dtype=np.intp)
 
         # Состояние панорамирования
         self.pan_active = False
@@ -1817,6 +2301,27 @@ class GraphCanvas(FigureCanvas):
         self.mouse_press_pos = None
         self.is_dragging = False
 
+        # Блиттинг при перетаскивании: фон без подвижных элементов,
+        # сами подвижные элементы и рёбра перетаскиваемого узла
+        self._drag_background = None
+        self._drag_artists = []
+        self._drag_edges = []
+        self._drag_rows = np.empty(0, dtype=np.intp)
+
+        # Видимость подписей (узлов, связей) при текущем масштабе и
+        # маски узлов и рёбер, попадающих в видимую область
+        self._label_visibility = None
+        self._nodes_in_view = None
+        self._edges_in_view = None
+
+        # Сообщение на пустом холсте: (текст matplotlib, ключ перевода)
+        self._message = None
+
+        # Отложенная перерисовка: серия событий мыши даёт одну перерисовку
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._redraw)
+
         # Подключаем обработчики событий
         self.mpl_connect('button_press_event', self.on_mouse_press)
         self.mpl_connect('button_release_event', self.on_mouse_release)
@@ -1869,15 +2374,16 @@ class GraphCanvas(FigureCanvas):
             return
 
         # Проверяем клик по узлу (ЛКМ без модификаторов)
-        if event.button == 1 and not self.pan_mode_enabled and self.pos:
+        if event.button == 1 and not self.pan_mode_enabled and len(self._pos_arr):
             click_x, click_y = event.xdata, event.ydata
 
-            for node_id, (x, y) in self.pos.items():
-                distance = ((click_x - x) ** 2 + (click_y - y) ** 2) ** 0.5
-                if distance < self.node_radius:
-                    self.dragging_node = node_id
-                    self.drag_start_pos = (click_x, click_y)
-                    return
+            # Ближайший к точке клика узел - одним проходом по массиву позиций
+            distances = np.hypot(self._pos_arr[:, 0] - click_x,
+                                 self._pos_arr[:, 1] - click_y)
+            nearest = int(distances.argmin())
+            if distances[nearest] < self.node_radius:
+                self.dragging_node = self._node_ids[nearest]
+                self.drag_start_pos = (click_x, click_y)
 
     def on_mouse_release(self, event) -> None:
         """Обработчик отпускания кнопки мыши.
@@ -1905,6 +2411,8 @@ class GraphCanvas(FigureCanvas):
             if not self.is_dragging and self.mouse_press_pos:
                 # Это был клик - показываем информацию
                 self.node_clicked.emit(self.dragging_node)
+            elif self.is_dragging:
+                self._end_drag_blit()
 
             self.dragging_node = None
             self.drag_start_pos = None
@@ -1920,6 +2428,8 @@ class GraphCanvas(FigureCanvas):
         Args:
             event: Событие matplotlib.
         """
+        if not self.pan_active and not self.dragging_node:
+            return
         if event.inaxes != self.ax:
             return
 
@@ -1935,7 +2445,7 @@ class GraphCanvas(FigureCanvas):
 
             self.ax.set_xlim(new_xlim)
             self.ax.set_ylim(new_ylim)
-            self.draw_idle()  # Используем draw_idle для плавности
+            self._schedule_redraw()
             return
 
         # Перетаскивание узла
@@ -1947,6 +2457,7 @@ class GraphCanvas(FigureCanvas):
                 if dx > self.DRAG_THRESHOLD or dy > self.DRAG_THRESHOLD:
                     self.is_dragging = True
                     self.setCursor(QCursor(Qt.ClosedHandCursor))
+                    self._begin_drag_blit(self.dragging_node)
 
             # Если перетаскивание активно, обновляем позицию (оптимизировано)
             if self.is_dragging:
@@ -1992,34 +2503,66 @@ class GraphCanvas(FigureCanvas):
 
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.draw_idle()
+        self._apply_lod()
+        self._schedule_redraw()
 
     def highlight_edge(self, source_id: str, target_id: str) -> None:
         """Подсвечивает указанное ребро графа.
 
+        Меняет оформление уже нарисованных стрелок, не перестраивая граф.
+
         Args:
             source_id: ID исходного узла.
             target_id: ID целевого узла.
         """
+        if self.highlighted_edge == (source_id, target_id):
+            return
+        self._set_edge_style(self.highlighted_edge, self.EDGE_STYLE)
         self.highlighted_edge = (source_id, target_id)
-        self.plot_graph(self.manager)
+        self._set_edge_style(self.highlighted_edge, self.EDGE_HIGHLIGHT_STYLE)
+        self.draw_idle()
 
     def clear_highlight(self) -> None:
         """Снимает подсветку с ребра."""
+        if self.highlighted_edge is None:
+            return
+        self._set_edge_style(self.highlighted_edge, self.EDGE_STYLE)
         self.highlighted_edge = None
-        self.plot_graph(self.manager)
+        self.draw_idle()
 
-    def export_to_png(self, filename: str) -> bool:
+    def _set_edge_style(self, edge: Optional[Tuple[str, str]],
+                        style: Tuple[str, float, float]) -> None:
+        """Применяет оформление к нарисованной стрелке ребра.
+
+        Args:
+            edge: Ключ ребра (source_id, target_id) или None.
+            style: Кортеж (цвет, толщина, прозрачность).
+        """
+        arrow = self.edge_patches.get(edge)
+        if arrow is None:
+            return
+        color, width, alpha = style
+        arrow.set_color(color)
+        arrow.set_linewidth(width)
+        arrow.set_alpha(alpha)
+
+    def export_to_png(self, filename: str, dpi: int = 150,
+                      tight: bool = True) -> bool:
         """Экспортирует граф в PNG-файл.
 
         Args:
             filename: Путь к файлу для сохранения.
+            dpi: Разрешение изображения.
+            tight: Обрезать поля по содержимому. Поля считаются отдельным
+                проходом по элементам графа без растеризации (около 10%
+                времени экспорта), поэтому отключается для быстрого экспорта.
 
         Returns:
             True если экспорт успешен, False при ошибке.
         """
         try:
-            self.figure.savefig(filename, dpi=300, bbox_inches='tight',
+            self.figure.savefig(filename, dpi=dpi,
+                              bbox_inches='tight' if tight else None,
                               facecolor='white', edgecolor='none')
             return True
         except Exception as e:
@@ -2028,14 +2571,111 @@ class GraphCanvas(FigureCanvas):
 
     def reset_view(self) -> None:
         """Сбрасывает масштаб и центрирует граф."""
-        if self.pos and len(self.pos) > 0:
-            x_values = [pos[0] for pos in self.pos.values()]
-            y_values = [pos[1] for pos in self.pos.values()]
+        if self.pos and len(self._pos_arr) > 0:
+            low = self._pos_arr.min(axis=0)
+            high = self._pos_arr.max(axis=0)
             margin = 0.3
-            self.ax.set_xlim(min(x_values) - margin, max(x_values) + margin)
-            self.ax.set_ylim(min(y_values) - margin, max(y_values) + margin)
+            self.ax.set_xlim(low[0] - margin, high[0] + margin)
+            self.ax.set_ylim(low[1] - margin, high[1] + margin)
+            self._apply_lod()
+            self._apply_view_cull()
             self.draw_idle()
 
+    def _apply_lod(self) -> None:
+        """Скрывает подписи, которые при текущем масштабе нечитаемы.
+
+        По экранному радиусу узла решается, показывать ли названия
+        узлов и подписи связей. Текст - самый медленный элемент
+        matplotlib, поэтому при сильном отдалении он не рисуется.
+        Меняются только флаги видимости уже созданных подписей; размеры
+        одинаковых строк matplotlib и так кэширует между перерисовками.
+        """
+        (x0, y0), (x1, y1) = self.ax.transData.transform([(0, 0), (1, 1)])
+        node_px = float(min(abs(x1 - x0), abs(y1 - y0))) * self.node_radius
+        visibility = (node_px >= self.NODE_LABEL_MIN_PX,
+                      node_px >= self.EDGE_LABEL_MIN_PX)
+        if visibility == self._label_visibility:
+            return
+        self._label_visibility = visibility
+
+        show_nodes, show_edges = visibility
+        for texts in self.node_texts.values():
+            for text_obj in texts:
+                text_obj.set_visible(show_nodes)
+        for edge_label in self.edge_labels.values():
+            edge_label.set_visible(show_edges)
+
+        # Заново скрываем всё, что вне видимой области
+        self._nodes_in_view = None
+        self._edges_in_view = None
+        self._apply_view_cull()
+
+    def _apply_view_cull(self) -> None:
+        """Скрывает подписи узлов и стрелки за пределами видимой области.
+
+        Попадание узлов и рёбер (по ограничивающему прямоугольнику)
+        в область осей с запасом на размер подписей определяется одним
+        векторным проходом по массиву позиций. Флаги видимости меняются
+        только у элементов, которые вошли в область или покинули её.
+        """
+        if self._label_visibility is None or not len(self._pos_arr):
+            return
+        show_nodes, show_edges = self._label_visibility
+
+        (x0, y0), (x1, y1) = self.ax.transData.transform([(0, 0), (1, 1)])
+        pixels_per_unit = max(min(abs(x1 - x0), abs(y1 - y0)), 1e-9)
+        margin = self.VIEW_CULL_MARGIN_PX / pixels_per_unit + 2 * self.node_radius
+        x_min, x_max = sorted(self.ax.get_xlim())
+        y_min, y_max = sorted(self.ax.get_ylim())
+        x_min, y_min = x_min - margin, y_min - margin
+        x_max, y_max = x_max + margin, y_max + margin
+
+        x = self._pos_arr[:, 0]
+        y = self._pos_arr[:, 1]
+        nodes_in_view = (x >= x_min) & (x <= x_max) & (y >= y_min) & (y <= y_max)
+
+        src = self._pos_arr[self._edge_src]
+        tgt = self._pos_arr[self._edge_tgt]
+        edges_in_view = (
+            (np.minimum(src[:, 0], tgt[:, 0]) <= x_max) &
+            (np.maximum(src[:, 0], tgt[:, 0]) >= x_min) &
+            (np.minimum(src[:, 1], tgt[:, 1]) <= y_max) &
+            (np.maximum(src[:, 1], tgt[:, 1]) >= y_min)
+        )
+
+        if self._nodes_in_view is None:
+            changed_nodes = range(len(nodes_in_view))
+            changed_edges = range(len(edges_in_view))
+        else:
+            changed_nodes = np.nonzero(nodes_in_view != self._nodes_in_view)[0].tolist()
+            changed_edges = np.nonzero(edges_in_view != self._edges_in_view)[0].tolist()
+        self._nodes_in_view = nodes_in_view
+        self._edges_in_view = edges_in_view
+
+        for i in changed_nodes:
+            visible = show_nodes and bool(nodes_in_view[i])
+            for text_obj in self.node_texts.get(self._node_ids[i], ()):
+                text_obj.set_visible(visible)
+        for row in changed_edges:
+            edge_key = self._edge_keys[row]
+            visible = bool(edges_in_view[row])
+            self.edge_patches[edge_key].set_visible(visible)
+            if edge_key in self.edge_labels:
+                self.edge_labels[edge_key].set_visible(show_edges and visible)
+
+    def _redraw(self) -> None:
+        """Отложенная перерисовка после панорамирования или масштабирования."""
+        self._apply_view_cull()
+        self.draw_idle()
+
+    def _schedule_redraw(self) -> None:
+        """Планирует перерисовку через REDRAW_DELAY_MS.
+
+        Повторный вызов до срабатывания таймера перезапускает его,
+        поэтому частые события мыши дают одну перерисовку.
+        """
+        self._redraw_timer.start(self.REDRAW_DELAY_MS)
+
     def zoom_by_factor(self, factor: float) -> None:
         """Изменяет масштаб на указанный коэффициент.
 
@@ -2056,7 +2696,8 @@ class GraphCanvas(FigureCanvas):
 
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.draw_idle()
+        self._apply_lod()
+        self._schedule_redraw()
 
     def set_pan_mode(self, enabled: bool) -> None:
         """Включает или отключает режим панорамирования.
@@ -2070,6 +2711,84 @@ class GraphCanvas(FigureCanvas):
         else:
             self.setCursor(QCursor(Qt.ArrowCursor))
 
+    def _begin_drag_blit(self, node_id: str) -> None:
+        """Готовит блиттинг для перетаскивания узла.
+
+        Элементы узла и его рёбер помечаются как анимированные, граф
+        один раз перерисовывается без них, и полученный фон сохраняется.
+        Каждый кадр перетаскивания затем восстанавливает фон и рисует
+        поверх него только подвижные элементы.
+
+        Args:
+            node_id: ID перетаскиваемого узла.
+        """
+        rows = self._incident_edges.get(node_id, [])
+        self._drag_rows = np.array(rows, dtype=np.intp)
+        self._drag_edges = [self._edge_keys[row] for row in rows]
+
+        # Рёбра узла могут войти в видимую область по ходу перетаскивания
+        show_edges = self._label_visibility is not None and self._label_visibility[1]
+        for edge in self._drag_edges:
+            self.edge_patches[edge].set_visible(True)
+            if edge in self.edge_labels:
+                self.edge_labels[edge].set_visible(show_edges)
+        if self._edges_in_view is not None:
+            self._edges_in_view[self._drag_rows] = True
+        self._detach_node_patches(node_id)
+
+        artists = list(self.node_patches.get(node_id, ()))
+        artists.extend(self.node_texts.get(node_id, ()))
+        for edge in self._drag_edges:
+            artists.append(self.edge_patches[edge])
+            if edge in self.edge_labels:
+                artists.append(self.edge_labels[edge])
+        self._drag_artists = artists
+
+        for artist in artists:
+            artist.set_animated(True)
+        self.draw()
+        self._drag_background = self.copy_from_bbox(self.figure.bbox)
+
+    def _detach_node_patches(self, node_id: str) -> None:
+        """Выносит фигуры узла из общих коллекций на оси.
+
+        Пока узел перетаскивается, его место в коллекции занимает пустой
+        путь, а сами фигуры рисуются отдельно и могут двигаться.
+
+        Args:
+            node_id: ID узла.
+        """
+        for collection, index in self.node_patch_index.get(node_id, ()):
+            collection.get_paths()[index] = Path(np.empty((0, 2)))
+            collection.stale = True
+        for patch in self.node_patches.get(node_id, ()):
+            self.ax.add_patch(patch)
+
+    def _attach_node_patches(self, node_id: str) -> None:
+        """Возвращает фигуры узла в общие коллекции на новом месте.
+
+        Args:
+            node_id: ID узла.
+        """
+        patches = self.node_patches.get(node_id, ())
+        for (collection, index), patch in zip(self.node_patch_index.get(node_id, ()), patches):
+            collection.get_paths()[index] = patch.get_patch_transform().transform_path(patch.get_path())
+            collection.stale = True
+            patch.remove()
+
+    def _end_drag_blit(self) -> None:
+        """Возвращает подвижные элементы в обычную отрисовку."""
+        for artist in self._drag_artists:
+            artist.set_animated(False)
+        if self.dragging_node:
+            self._attach_node_patches(self.dragging_node)
+        self._drag_background = None
+        self._drag_artists = []
+        self._drag_edges = []
+        self._drag_rows = np.empty(0, dtype=np.intp)
+        self._apply_view_cull()
+        self.draw_idle()
+
     def _update_dragged_node_fast(self, node_id: str, new_x: float, new_y: float) -> None:
         """Быстрое обновление позиции перетаскиваемого узла.
 
@@ -2081,7 +2800,7 @@ class GraphCanvas(FigureCanvas):
             new_x: Новая X-координата.
             new_y: Новая Y-координата.
         """
-        if not self.manager or node_id not in self.pos:
+        if not self.manager or not self.pos or node_id not in self.pos:
             return
 
         old_x, old_y = self.pos[node_id]
@@ -2111,79 +2830,171 @@ class GraphCanvas(FigureCanvas):
                 pos = text_obj.get_position()
                 text_obj.set_position((pos[0] + dx, pos[1] + dy))
 
-        # Обновляем связанные рёбра
-        G = self.manager.graph
-        for rel in self.manager.relationships:
-            edge_key = (rel.source_id, rel.target_id)
-
-            # Проверяем, связано ли ребро с перемещаемым узлом
-            if rel.source_id == node_id or rel.target_id == node_id:
-                if edge_key in self.edge_patches and G.has_edge(*edge_key):
-                    # Пересчитываем позиции ребра
-                    x1, y1 = self.pos[rel.source_id]
-                    x2, y2 = self.pos[rel.target_id]
-
-                    ddx = x2 - x1
-                    ddy = y2 - y1
-                    dist = (ddx**2 + ddy**2) ** 0.5
-
-                    if dist > 0:
-                        dx_norm = ddx / dist
-                        dy_norm = ddy / dist
-
-                        start_x = x1 + dx_norm * self.node_radius
-                        start_y = y1 + dy_norm * self.node_radius
-                        end_x = x2 - dx_norm * self.node_radius
-                        end_y = y2 - dy_norm * self.node_radius
-
-                        # Обновляем позицию стрелки
-                        arrow = self.edge_patches[edge_key]
-                        arrow.set_positions((start_x, start_y), (end_x, end_y))
-
-                        # Обновляем позицию метки ребра
-                        if edge_key in self.edge_labels:
-                            mid_x = (start_x + end_x) / 2
-                            mid_y = (start_y + end_y) / 2
-
-                            # Смещение перпендикулярно линии
-                            perp_x = -ddy / dist * 0.05
-                            perp_y = ddx / dist * 0.05
-
-                            self.edge_labels[edge_key].set_position(
-                                (mid_x + perp_x, mid_y + perp_y)
-                            )
+        # Обновляем связанные рёбра: геометрия считается одним векторным
+        # проходом по строкам таблицы рёбер, собранным в начале перетаскивания
+        self._pos_arr[self._node_index[node_id]] = (new_x, new_y)
+        if self._drag_edges:
+            has_length, starts, ends, _, label_positions = self._edge_geometry(
+                self._pos_arr[self._edge_src[self._drag_rows]],
+                self._pos_arr[self._edge_tgt[self._drag_rows]]
+            )
+            for edge_key, visible, start, end, label_pos in zip(
+                    self._drag_edges, has_length.tolist(), starts.tolist(),
+                    ends.tolist(), label_positions.tolist()):
+                if not visible:
+                    continue
+                self.edge_patches[edge_key].set_positions(tuple(start), tuple(end))
+                if edge_key in self.edge_labels:
+                    self.edge_labels[edge_key].set_position(tuple(label_pos))
+
+        # Восстанавливаем фон и дорисовываем только подвижные элементы
+        if self._drag_background is not None:
+            self.restore_region(self._drag_background)
+            for artist in self._drag_artists:
+                self.ax.draw_artist(artist)
+            self.blit(self.figure.bbox)
+        else:
+            self.draw_idle()
 
-        # Обновляем отображение без полной перерисовки
-        self.draw_idle()
 
+    def _edge_geometry(self, src: np.ndarray, tgt: np.ndarray) -> Tuple:
+        """Вычисляет геометрию стрелок для массивов концов рёбер.
+
+        Начало и конец стрелки смещены от центров узлов на радиус узла,
+        подпись - от середины перпендикулярно линии связи.
+
+        Args:
+            src: Позиции исходных узлов формы (E, 2).
+            tgt: Позиции целевых узлов формы (E, 2).
+
+        Returns:
+            Кортеж (has_length, starts, ends, mids, label_positions),
+            где has_length - маска рёбер между несовпадающими узлами.
+        """
+        delta = tgt - src
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        has_length = dist > 0
+
+        # Единичные направления (нулевые для совпадающих узлов)
+        unit = np.zeros_like(delta)
+        unit[has_length] = delta[has_length] / dist[has_length, None]
+
+        starts = src + unit * self.node_radius
+        ends = tgt - unit * self.node_radius
+        mids = (src + tgt) / 2
+        label_positions = mids + np.column_stack((-unit[:, 1], unit[:, 0])) * 0.05
+        return has_length, starts, ends, mids, label_positions
+
+    def _calculate_layout(self, G: nx.Graph) -> Optional[Dict]:
+        """Возвращает позиции узлов по выбранному алгоритму.
 
-    def _calculate_layout(self, G: nx.Graph) -> Dict:
-        """Вычисляет позиции узлов по выбранному алгоритму.
+        Результат кэшируется по алгоритму и составу графа, поэтому
+        повторный расчёт для неизменного графа не выполняется. Графы
+        больше ASYNC_LAYOUT_NODES считаются в фоновом потоке, чтобы
+        не блокировать интерфейс; по готовности граф перерисовывается.
 
         Args:
             G: Граф NetworkX.
 
         Returns:
-            Словарь позиций {node_id: (x, y)}.
+            Словарь позиций {node_id: (x, y)} или None, если расчёт
+            запущен в фоне.
         """
         if len(G.nodes()) == 0:
             return {}
 
+        key = (self.layout_algorithm, frozenset(G.nodes()), frozenset(G.edges()))
+        cached = self._layout_cache.get(key)
+        if cached is not None:
+            self._layout_cache.move_to_end(key)
+            return dict(cached)
+
+        if len(G) > self.ASYNC_LAYOUT_NODES:
+            # Предыдущий расчёт не прерывается, его результат лишь
+            # попадёт в кэш без перерисовки
+            if key != self._pending_layout:
+                self._pending_layout = key
+                worker = _LayoutWorker(self._compute_layout, G.copy(),
+                                       self.layout_algorithm, key)
+                worker.layout_ready.connect(self._on_layout_ready)
+                worker.start()
+            return None
+
+        pos = self._compute_layout(G, self.layout_algorithm)
+        self._store_layout(key, pos)
+        # Вызывающий код меняет позиции при перетаскивании - отдаём копию
+        return dict(pos)
+
+    def _store_layout(self, key: Tuple, pos: Dict) -> None:
+        """Сохраняет компоновку в кэш, вытесняя самую старую.
+
+        Args:
+            key: Ключ (алгоритм, узлы, рёбра).
+            pos: Словарь позиций {node_id: (x, y)}.
+        """
+        self._layout_cache[key] = pos
+        if len(self._layout_cache) > self.LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+
+    def _on_layout_ready(self, key: Tuple, pos: Dict) -> None:
+        """Принимает компоновку из фонового потока.
+
+        Args:
+            key: Ключ (алгоритм, узлы, рёбра).
+            pos: Словарь позиций {node_id: (x, y)}.
+        """
+        self._store_layout(key, pos)
+        if key != self._pending_layout:
+            return
+        self._pending_layout = None
+        if self.manager is not None:
+            self.plot_graph(self.manager)
+
+    def _spring_layout(self, G: nx.Graph) -> Dict:
+        """Вычисляет силовую компоновку.
+
+        Большие графы считаются собственной реализацией на NumPy:
+        она быстрее и не зависит от SciPy.
+
+        Args:
+            G: Граф NetworkX.
+
+        Returns:
+            Словарь позиций {node_id: (x, y)}.
+        """
+        if len(G) > self.LARGE_GRAPH_NODES:
+            return spring_layout_numpy(G, k=3, iterations=50, seed=42)
+        return nx.spring_layout(G, k=3, iterations=50, seed=42)
+
+    def _compute_layout(self, G: nx.Graph, algorithm: str) -> Dict:
+        """Вычисляет позиции узлов по указанному алгоритму.
+
+        Может выполняться в фоновом потоке, поэтому не обращается
+        к изменяемому состоянию холста.
+
+        Args:
+            G: Непустой граф NetworkX.
+            algorithm: Идентификатор алгоритма компоновки.
+
+        Returns:
+            Словарь позиций {node_id: (x, y)}.
+        """
+
         try:
-            if self.layout_algorithm == 'spring':
-                return nx.spring_layout(G, k=3, iterations=50, seed=42)
-            elif self.layout_algorithm == 'circular':
+            if algorithm == 'spring':
+                return self._spring_layout(G)
+            elif algorithm == 'circular':
                 return nx.circular_layout(G)
-            elif self.layout_algorithm == 'kamada_kawai':
+            elif algorithm == 'kamada_kawai':
                 return nx.kamada_kawai_layout(G)
-            elif self.layout_algorithm == 'spectral':
+            elif algorithm == 'spectral':
                 if len(G.nodes()) > 2:
                     return nx.spectral_layout(G)
                 else:
-                    return nx.spring_layout(G, k=3, iterations=50, seed=42)
-            elif self.layout_algorithm == 'shell':
+                    return self._spring_layout(G)
+            elif algorithm == 'shell':
                 return nx.shell_layout(G)
-            elif self.layout_algorithm == 'hierarchical':
+            elif algorithm == 'hierarchical':
                 # Иерархическая компоновка на основе топологической сортировки
                 try:
                     # Пытаемся получить слои по топологической сортировке
@@ -2198,12 +3009,40 @@ class GraphCanvas(FigureCanvas):
                     return pos
                 except nx.NetworkXError:
                     # Если граф циклический, используем spring layout
-                    return nx.spring_layout(G, k=3, iterations=50, seed=42)
+                    return self._spring_layout(G)
             else:
-                return nx.spring_layout(G, k=3, iterations=50, seed=42)
+                return self._spring_layout(G)
         except Exception:
             return nx.circular_layout(G)
 
+    def _show_message(self, key: str) -> None:
+        """Показывает на пустом холсте текстовое сообщение.
+
+        Args:
+            key: Ключ перевода текста сообщения.
+        """
+        text = self.ax.text(0.5, 0.5, tr(key),
+                    ha='center', va='center', fontsize=14, color='#6C757D')
+        self._message = (text, key)
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
+        self.ax.axis('off')
+        self.ax.set_facecolor('#F8F9FA')
+        self.draw_idle()
+
+    def retranslate(self) -> None:
+        """Обновляет переводимые надписи холста без перерисовки графа.
+
+        Из текстов графа переводятся только заголовок и сообщение на
+        пустом холсте, поэтому смена языка не требует новой компоновки.
+        """
+        if self._message is not None:
+            text, key = self._message
+            text.set_text(tr(key))
+        elif self.ax.get_title():
+            self.ax.title.set_text(tr('graph_title'))
+        self.draw_idle()
+
     def plot_graph(self, manager: DependencyManager) -> None:
         """Отрисовывает граф зависимостей.
 
@@ -2219,74 +3058,108 @@ class GraphCanvas(FigureCanvas):
 
         # Очищаем хранилища графических элементов
         self.node_patches.clear()
+        self.node_patch_index.clear()
         self.node_texts.clear()
         self.edge_patches.clear()
         self.edge_labels.clear()
+        self._incident_edges.clear()
+        self._label_visibility = None
+        self._message = None
+
+        # Сбрасываем таблицы узлов и рёбер: пока компоновка считается
+        # в фоне, масштабирование и перетаскивание не должны видеть
+        # данные предыдущего графа
+        self._node_ids = []
+        self._node_index = {}
+        self._pos_arr = np.empty((0, 2))
+        self._edge_keys = []
+        self._edge_src = np.empty(0, dtype=np.intp)
+        self._edge_tgt = np.empty(0, dtype=np.intp)
+        self._nodes_in_view = None
+        self._edges_in_view = None
 
         # Проверяем наличие объектов
         if len(manager.objects) == 0:
-            self.ax.text(0.5, 0.5, tr('no_objects'),
-                        ha='center', va='center', fontsize=14, color='#6C757D')
-            self.ax.set_xlim(0, 1)
-            self.ax.set_ylim(0, 1)
-            self.ax.axis('off')
-            self.ax.set_facecolor('#F8F9FA')
-            self.draw_idle()
+            self._show_message('no_objects')
             return
 
         G = manager.graph
-        color_map = COLOR_SCHEMES[self.color_scheme]
 
-        # Вычисляем позиции узлов (сохраняем при перетаскивании)
-        if self.pos is None or len(self.pos) != len(G.nodes()):
+        # Вычисляем позиции узлов (сохраняем при перетаскивании); состав
+        # узлов сравнивается целиком, т.к. ID объекта может измениться
+        if self.pos is None or self.pos.keys() != set(G.nodes()):
             self.pos = self._calculate_layout(G)
+            if self.pos is None:
+                # Компоновка считается в фоне, граф дорисуется по готовности
+                self._show_message('layout_computing')
+                return
+        self._node_ids = list(self.pos)
+        self._node_index = {node: i for i, node in enumerate(self._node_ids)}
+        self._pos_arr = np.array(list(self.pos.values()), dtype=float).reshape(-1, 2)
+
+        # === Геометрия рёбер: один векторный проход NumPy для всех связей ===
+        edges = [(rel.source_id, rel.target_id, rel.type)
+                 for rel in manager.relationships
+                 if G.has_edge(rel.source_id, rel.target_id)]
+        if edges:
+            has_length, starts, ends, mids, label_positions = self._edge_geometry(
+                np.array([self.pos[source_id] for source_id, _, _ in edges], dtype=float),
+                np.array([self.pos[target_id] for _, target_id, _ in edges], dtype=float)
+            )
+            has_length = has_length.tolist()
+            starts = starts.tolist()
+            ends = ends.tolist()
+            mids = mids.tolist()
+            label_positions = label_positions.tolist()
 
         # === Рисуем стрелки связей ===
-        for rel in manager.relationships:
-            edge = (rel.source_id, rel.target_id)
-            if G.has_edge(*edge):
-                x1, y1 = self.pos[rel.source_id]
-                x2, y2 = self.pos[rel.target_id]
-
-                dx = x2 - x1
-                dy = y2 - y1
-                dist = np.sqrt(dx**2 + dy**2)
-
-                if dist > 0:
-                    dx_norm = dx / dist
-                    dy_norm = dy / dist
-
-                    # Смещаем начало и конец от центров узлов
-                    start_x = x1 + dx_norm * self.node_radius
-                    start_y = y1 + dy_norm * self.node_radius
-                    end_x = x2 - dx_norm * self.node_radius
-                    end_y = y2 - dy_norm * self.node_radius
-
-                    # Настройки подсвеченного/обычного ребра
-                    color = '#E63946' if self.highlighted_edge == edge else '#495057'
-                    width = 3.0 if self.highlighted_edge == edge else 1.8
-                    alpha = 1.0 if self.highlighted_edge == edge else 0.6
-
-                    arrow = FancyArrowPatch(
-                        (start_x, start_y), (end_x, end_y),
-                        arrowstyle='->', mutation_scale=25,
-                        color=color, linewidth=width, alpha=alpha,
-                        connectionstyle="arc3,rad=0.1", zorder=1
-                    )
-                    self.ax.add_patch(arrow)
-
-                    # Сохраняем ссылку на стрелку для быстрого обновления
-                    self.edge_patches[(rel.source_id, rel.target_id)] = arrow
-
-                    # Сохраняем позицию для подписи
-                    mid_x = (start_x + end_x) / 2
-                    mid_y = (start_y + end_y) / 2
-                    self.edge_positions[(rel.source_id, rel.target_id)] = (mid_x, mid_y)
+        for i, (source_id, target_id, _) in enumerate(edges):
+            if not has_length[i]:
+                continue
+            edge = (source_id, target_id)
+
+            # Настройки подсвеченного/обычного ребра
+            color, width, alpha = (
+                self.EDGE_HIGHLIGHT_STYLE if self.highlighted_edge == edge
+                else self.EDGE_STYLE
+            )
+
+            arrow = FancyArrowPatch(
+                tuple(starts[i]), tuple(ends[i]),
+                arrowstyle='->', mutation_scale=25,
+                color=color, linewidth=width, alpha=alpha,
+                connectionstyle="arc3,rad=0.1", zorder=1
+            )
+            self.ax.add_patch(arrow)
+
+            # Сохраняем ссылку на стрелку для быстрого обновления
+            self.edge_patches[edge] = arrow
+            row = len(self._edge_keys)
+            self._edge_keys.append(edge)
+            self._incident_edges.setdefault(source_id, []).append(row)
+            if target_id != source_id:
+                self._incident_edges.setdefault(target_id, []).append(row)
+
+            # Сохраняем позицию для подписи
+            self.edge_positions[edge] = tuple(mids[i])
+
+        self._edge_src = np.array([self._node_index[source_id] for source_id, _ in self._edge_keys],
+                                  dtype=np.intp)
+        self._edge_tgt = np.array([self._node_index[target_id] for _, target_id in self._edge_keys],
+                                  dtype=np.intp)
+
+        # === Цвета узлов: индекс типа в RGBA-таблице текущей схемы ===
+        type_ids, rgba_table = COLOR_TABLES[self.color_scheme]
+        default_id = len(rgba_table) - 1
+        objects = [manager.objects.get(node) for node in self._node_ids]
+        node_colors = rgba_table[np.fromiter(
+            (type_ids.get(obj.type, default_id) if obj else default_id for obj in objects),
+            dtype=np.intp, count=len(objects)
+        )].tolist()
 
         # === Рисуем узлы с разными формами ===
-        for node, (x, y) in self.pos.items():
-            obj = manager.objects.get(node)
-            color = color_map.get(obj.type, '#ADB5BD') if obj else '#ADB5BD'
+        for (x, y), node, obj, color in zip(self._pos_arr.tolist(), self._node_ids,
+                                            objects, node_colors):
 
             if obj:
                 if obj.type in ['file', 'godot_script']:
@@ -2297,17 +3170,14 @@ class GraphCanvas(FigureCanvas):
                         color=color, ec='#212529', linewidth=2.5,
                         alpha=0.9, zorder=3
                     )
-                    self.ax.add_patch(rect)
                     self.node_patches[node] = [rect]
                 elif obj.type in ['database', 'godot_resource']:
                     # Эллипс для баз данных и ресурсов
-                    from matplotlib.patches import Ellipse
                     ellipse = Ellipse(
                         (x, y), self.node_radius * 2, self.node_radius * 2.5,
                         color=color, ec='#212529', linewidth=2.5,
                         alpha=0.9, zorder=3
                     )
-                    self.ax.add_patch(ellipse)
                     self.node_patches[node] = [ellipse]
                 elif obj.type in ['router', 'switch']:
                     # Ромб для сетевого оборудования
@@ -2317,7 +3187,6 @@ class GraphCanvas(FigureCanvas):
                         color=color, ec='#212529', linewidth=2.5,
                         alpha=0.9, zorder=3
                     )
-                    self.ax.add_patch(diamond)
                     self.node_patches[node] = [diamond]
                 elif obj.type in ['server', 'godot_autoload']:
                     # Скруглённый прямоугольник для серверов и autoload
@@ -2328,7 +3197,6 @@ class GraphCanvas(FigureCanvas):
                         color=color, ec='#212529', linewidth=2.5,
                         alpha=0.9, zorder=3
                     )
-                    self.ax.add_patch(rect)
                     self.node_patches[node] = [rect]
                 elif obj.type == 'godot_scene':
                     # Круг с внутренним кругом для сцен
@@ -2337,13 +3205,11 @@ class GraphCanvas(FigureCanvas):
                         color=color, ec='#212529', linewidth=2.5,
                         alpha=0.9, zorder=3
                     )
-                    self.ax.add_patch(circle_outer)
                     circle_inner = Circle(
                         (x, y), self.node_radius * 0.5,
                         color='white', ec='#212529', linewidth=1.5,
                         alpha=0.9, zorder=4
                     )
-                    self.ax.add_patch(circle_inner)
                     self.node_patches[node] = [circle_outer, circle_inner]
                 else:
                     # Круг по умолчанию (контейнеры)
@@ -2352,9 +3218,28 @@ class GraphCanvas(FigureCanvas):
                         color=color, ec='#212529', linewidth=2.5,
                         alpha=0.9, zorder=3
                     )
-                    self.ax.add_patch(circle)
                     self.node_patches[node] = [circle]
 
+        # Фигуры собираются в коллекции по слоям (zorder), чтобы matplotlib
+        # рисовал каждый слой одним вызовом, сохраняя порядок наложения.
+        # При экспорте в векторный формат коллекции растрируются, а подписи
+        # и стрелки остаются векторными.
+        # Маркеры scatter здесь не подходят: их размер задаётся в пунктах
+        # экрана, а узлы должны масштабироваться вместе с графом и рёбрами
+        layers = {}
+        for node, patches in self.node_patches.items():
+            for patch in patches:
+                layers.setdefault(patch.get_zorder(), []).append((node, patch))
+        for zorder in sorted(layers):
+            collection = PatchCollection(
+                [patch for _, patch in layers[zorder]],
+                match_original=True, joinstyle='miter', zorder=zorder,
+                rasterized=True
+            )
+            self.ax.add_collection(collection, autolim=False)
+            for i, (node, _) in enumerate(layers[zorder]):
+                self.node_patch_index.setdefault(node, []).append((collection, i))
+
         # === Рисуем иконки и названия узлов ===
         for node, (x, y) in self.pos.items():
             obj = manager.objects.get(node)
@@ -2375,35 +3260,16 @@ class GraphCanvas(FigureCanvas):
                 self.node_texts[node] = [icon_text, name_text]
 
         # === Рисуем подписи связей ===
-        for rel in manager.relationships:
-            if G.has_edge(rel.source_id, rel.target_id):
-                x1, y1 = self.pos[rel.source_id]
-                x2, y2 = self.pos[rel.target_id]
-
-                # Позиция подписи на середине ребра со смещением
-                label_x = x1 + (x2 - x1) * 0.5
-                label_y = y1 + (y2 - y1) * 0.5
-
-                dx = x2 - x1
-                dy = y2 - y1
-                dist = np.sqrt(dx**2 + dy**2)
+        for i, (source_id, target_id, rel_type) in enumerate(edges):
+            label_x, label_y = label_positions[i]
+            edge_label = self.ax.text(label_x, label_y, rel_type, fontsize=7,
+                       bbox=dict(boxstyle='round,pad=0.25', facecolor='#FFFFEB',
+                               edgecolor='#999999', alpha=0.9, linewidth=0.8),
+                       ha='center', va='center', zorder=5,
+                       color='#212529', fontweight='600')
 
-                if dist > 0:
-                    # Смещение перпендикулярно линии связи
-                    perp_x = -dy / dist * 0.05
-                    perp_y = dx / dist * 0.05
-
-                    label_x += perp_x
-                    label_y += perp_y
-
-                edge_label = self.ax.text(label_x, label_y, rel.type, fontsize=7,
-                           bbox=dict(boxstyle='round,pad=0.25', facecolor='#FFFFEB',
-                                   edgecolor='#999999', alpha=0.9, linewidth=0.8),
-                           ha='center', va='center', zorder=5,
-                           color='#212529', fontweight='600')
-
-                # Сохраняем ссылку на метку ребра
-                self.edge_labels[(rel.source_id, rel.target_id)] = edge_label
+            # Сохраняем ссылку на метку ребра
+            self.edge_labels[(source_id, target_id)] = edge_label
 
         # Настройки осей
         self.ax.set_title(tr('graph_title'), fontsize=18, fontweight='bold',
@@ -2413,16 +3279,150 @@ class GraphCanvas(FigureCanvas):
 
         # Устанавливаем границы с отступом
         if self.pos:
-            x_values = [pos[0] for pos in self.pos.values()]
-            y_values = [pos[1] for pos in self.pos.values()]
+            low = self._pos_arr.min(axis=0)
+            high = self._pos_arr.max(axis=0)
             margin = 0.5
-            self.ax.set_xlim(min(x_values) - margin, max(x_values) + margin)
-            self.ax.set_ylim(min(y_values) - margin, max(y_values) + margin)
+            self.ax.set_xlim(low[0] - margin, high[0] + margin)
+            self.ax.set_ylim(low[1] - margin, high[1] + margin)
 
         self.figure.tight_layout()
+        self._apply_lod()
         self.draw_idle()
 
 
+# =============================================================================
+# МОДЕЛИ СПИСКОВ
+# =============================================================================
+
+class _KeyListModel(QAbstractListModel):
+    """Базовая модель списка, читающая строки прямо из менеджера.
+
+    Модель хранит только ключи строк, а текст строит в data() по
+    запросу представления, то есть лишь для видимых строк. Подклассы
+    задают ключи и текст строки.
+    """
+
+    def __init__(self, manager: DependencyManager, parent=None) -> None:
+        """Инициализирует модель.
+
+        Args:
+            manager: Менеджер зависимостей с данными.
+            parent: Родительский объект Qt.
+        """
+        super().__init__(parent)
+        self.manager = manager
+        self._keys = []
+        self._rows = {}
+
+    def _current_keys(self) -> List:
+        """Возвращает ключи строк в порядке отображения."""
+        raise NotImplementedError
+
+    def _text(self, key) -> str:
+        """Возвращает текст строки по ключу."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _removed_row(old: List, new: List) -> Optional[int]:
+        """Возвращает номер строки, если new - это old без одной строки."""
+        row = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), len(new))
+        return row if new[row:] == old[row + 1:] else None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Возвращает число строк."""
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Возвращает текст (DisplayRole) или ключ (UserRole) строки."""
+        if not index.isValid():
+            return None
+        key = self._keys[index.row()]
+        if role == Qt.DisplayRole:
+            return self._text(key)
+        if role == Qt.UserRole:
+            return key
+        return None
+
+    def row_of(self, key) -> Optional[int]:
+        """Возвращает номер строки по ключу или None."""
+        return self._rows.get(key)
+
+    def refresh(self) -> None:
+        """Сверяет строки модели с менеджером.
+
+        Добавление в конец и удаление одной строки сообщаются
+        представлению точечно, сохраняя выделение; если ключи не
+        изменились, обновляются только тексты видимых строк.
+        """
+        old = self._keys
+        new = self._current_keys()
+        count = len(old)
+
+        if new == old:
+            if count:
+                self.dataChanged.emit(self.index(0), self.index(count - 1), [Qt.DisplayRole])
+        elif len(new) > count and new[:count] == old:
+            self.beginInsertRows(QModelIndex(), count, len(new) - 1)
+            self._keys = new
+            self.endInsertRows()
+        elif len(new) == count - 1 and self._removed_row(old, new) is not None:
+            row = self._removed_row(old, new)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._keys = new
+            self.endRemoveRows()
+        else:
+            self.beginResetModel()
+            self._keys = new
+            self.endResetModel()
+
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+
+
+class ObjectsModel(_KeyListModel):
+    """Модель списка объектов; ключ строки - ID объекта."""
+
+    def _current_keys(self) -> List[str]:
+        """Возвращает ID объектов в порядке добавления."""
+        return list(self.manager.objects)
+
+    def _text(self, key: str) -> str:
+        """Возвращает подпись объекта с иконкой и типом."""
+        obj = self.manager.objects[key]
+        return get_type_prefix(obj.type) + obj.name
+
+
+class RelationshipsModel(_KeyListModel):
+    """Модель списка связей; ключ строки - (source_id, target_id, type)."""
+
+    def __init__(self, manager: DependencyManager, parent=None) -> None:
+        """Инициализирует модель.
+
+        Args:
+            manager: Менеджер зависимостей с данными.
+            parent: Родительский объект Qt.
+        """
+        super().__init__(manager, parent)
+        self._relationships: Dict[Tuple[str, str, str], Relationship] = {}
+
+    def _current_keys(self) -> List[Tuple[str, str, str]]:
+        """Возвращает ключи связей в порядке добавления."""
+        self._relationships = {
+            (rel.source_id, rel.target_id, rel.type): rel
+            for rel in self.manager.relationships
+        }
+        return list(self._relationships)
+
+    def relationship(self, key: Tuple[str, str, str]) -> Optional[Relationship]:
+        """Возвращает связь по ключу строки или None."""
+        return self._relationships.get(key)
+
+    def _text(self, key: Tuple[str, str, str]) -> str:
+        """Возвращает подпись связи: источник → [тип] → цель."""
+        source_id, target_id, rel_type = key
+        objects = self.manager.objects
+        return f"{objects[source_id].name} → [{rel_type}] → {objects[target_id].name}"
+
+
 # =============================================================================
 # ОКНО ПРОЕКТА
 # =============================================================================
@@ -2438,13 +3438,16 @@ class ProjectWindow(QWidget):
     Attributes:
         manager: DependencyManager с данными проекта.
         current_file: Путь к файлу проекта или None.
+        file_name: Имя файла проекта без каталога или None.
         modified: Флаг наличия несохранённых изменений.
 
     Signals:
         language_changed: Сигнал при смене языка интерфейса.
+        modified_changed: Сигнал при смене флага modified (новое значение).
     """
 
     language_changed = pyqtSignal()
+    modified_changed = pyqtSignal(bool)
 
     def __init__(self, manager: DependencyManager = None,
                  filename: str = None) -> None:
@@ -2458,104 +3461,37 @@ class ProjectWindow(QWidget):
         self.manager = manager or DependencyManager()
         self.current_file = filename
         self.modified = False
+        # Модели списков
+        self.objects_model = ObjectsModel(self.manager, self)
+        self.relationships_model = RelationshipsModel(self.manager, self)
+        # Отрисованная версия данных и запланированная перерисовка графа
+        self._plotted_revision = None
+        self._graph_pending = False
+        # Информационное окно объекта/связи, создаётся при первом показе
+        self._info_box = None
+        # Перевод интерфейса отложен до активации окна
+        self._retranslate_pending = False
+        self.setObjectName("projectWindow")
         self.setup_ui()
         self.apply_styles()
         self.update_ui()
 
-        if filename:
-            self.setWindowTitle(f"{tr('project')}: {os.path.basename(filename)}")
-        else:
-            self.setWindowTitle(tr('new_project'))
+        self.update_title()
+
+    @property
+    def current_file(self) -> Optional[str]:
+        """Путь к файлу проекта или None."""
+        return self._current_file
+
+    @current_file.setter
+    def current_file(self, path: Optional[str]) -> None:
+        """Задаёт путь к файлу проекта и запоминает имя файла."""
+        self._current_file = path
+        self.file_name = os.path.basename(path) if path else None
 
     def apply_styles(self) -> None:
         """Применяет стили к элементам интерфейса."""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #FFFFFF;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 10pt;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 9pt;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-            QPushButton:disabled {
-                background-color: #CED4DA;
-                color: #6C757D;
-            }
-            QPushButton:checked {
-                background-color: #28A745;
-            }
-            QListWidget {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                background-color: #F8F9FA;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 4px;
-                margin: 2px;
-                color: #212529;
-            }
-            QListWidget::item:selected {
-                background-color: #007BFF;
-                color: white;
-            }
-            QListWidget::item:hover:!selected {
-                background-color: #E9ECEF;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #0056b3;
-                color: white;
-            }
-            QLabel {
-                color: #212529;
-                font-size: 10pt;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                padding: 6px;
-                background-color: white;
-                color: #212529;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border-color: #007BFF;
-            }
-            QTabWidget::pane {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #E9ECEF;
-                color: #495057;
-                padding: 10px 20px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                margin-right: 2px;
-                font-weight: 600;
-            }
-            QTabBar::tab:selected {
-                background-color: #007BFF;
-                color: white;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #DEE2E6;
-            }
-        """)
+        install_app_styles()
 
     def setup_ui(self) -> None:
         """Настраивает элементы интерфейса окна."""
@@ -2571,20 +3507,21 @@ class ProjectWindow(QWidget):
         objects_tab = QWidget()
         objects_layout = QVBoxLayout(objects_tab)
 
-        self.objects_label = QLabel(f"<b>{tr('objects_title')}</b>")
+        self.objects_label = QLabel()
         objects_layout.addWidget(self.objects_label)
 
-        self.objects_list = QListWidget()
-        self.objects_list.itemClicked.connect(self.on_object_selected)
-        self.objects_list.itemDoubleClicked.connect(self.view_object)
+        self.objects_list = QListView()
+        self.objects_list.setModel(self.objects_model)
+        self.objects_list.clicked.connect(self.on_object_selected)
+        self.objects_list.doubleClicked.connect(self.view_object)
         objects_layout.addWidget(self.objects_list)
 
         # Кнопки управления объектами
         obj_buttons = QHBoxLayout()
-        self.add_obj_btn = QPushButton(tr('btn_add'))
-        self.edit_obj_btn = QPushButton(tr('btn_edit'))
-        self.remove_obj_btn = QPushButton(tr('btn_remove'))
-        self.view_obj_btn = QPushButton(tr('btn_view'))
+        self.add_obj_btn = QPushButton()
+        self.edit_obj_btn = QPushButton()
+        self.remove_obj_btn = QPushButton()
+        self.view_obj_btn = QPushButton()
 
         self.add_obj_btn.clicked.connect(self.add_object)
         self.edit_obj_btn.clicked.connect(self.edit_object)
@@ -2597,26 +3534,27 @@ class ProjectWindow(QWidget):
         obj_buttons.addWidget(self.view_obj_btn)
         objects_layout.addLayout(obj_buttons)
 
-        self.tabs.addTab(objects_tab, tr('tab_objects'))
+        self.tabs.addTab(objects_tab, '')
 
         # Вкладка связей
         relations_tab = QWidget()
         relations_layout = QVBoxLayout(relations_tab)
 
-        self.relationships_label = QLabel(f"<b>{tr('relationships_title')}</b>")
+        self.relationships_label = QLabel()
         relations_layout.addWidget(self.relationships_label)
 
-        self.relationships_list = QListWidget()
-        self.relationships_list.itemClicked.connect(self.on_relationship_selected)
-        self.relationships_list.itemDoubleClicked.connect(self.view_relationship)
+        self.relationships_list = QListView()
+        self.relationships_list.setModel(self.relationships_model)
+        self.relationships_list.clicked.connect(self.on_relationship_selected)
+        self.relationships_list.doubleClicked.connect(self.view_relationship)
         relations_layout.addWidget(self.relationships_list)
 
         # Кнопки управления связями
         rel_buttons = QHBoxLayout()
-        self.add_rel_btn = QPushButton(tr('btn_add'))
-        self.edit_rel_btn = QPushButton(tr('btn_edit'))
-        self.remove_rel_btn = QPushButton(tr('btn_remove'))
-        self.view_rel_btn = QPushButton(tr('btn_view'))
+        self.add_rel_btn = QPushButton()
+        self.edit_rel_btn = QPushButton()
+        self.remove_rel_btn = QPushButton()
+        self.view_rel_btn = QPushButton()
 
         self.add_rel_btn.clicked.connect(self.add_relationship)
         self.edit_rel_btn.clicked.connect(self.edit_relationship)
@@ -2629,7 +3567,7 @@ class ProjectWindow(QWidget):
         rel_buttons.addWidget(self.view_rel_btn)
         relations_layout.addLayout(rel_buttons)
 
-        self.tabs.addTab(relations_tab, tr('tab_relationships'))
+        self.tabs.addTab(relations_tab, '')
 
         left_layout.addWidget(self.tabs)
         left_panel.setMaximumWidth(400)
@@ -2638,7 +3576,7 @@ class ProjectWindow(QWidget):
         right_panel = QWidget()
         right_layout = QVBoxLayout(right_panel)
 
-        self.visualization_label = QLabel(f"<b>{tr('visualization_title')}</b>")
+        self.visualization_label = QLabel()
         right_layout.addWidget(self.visualization_label)
 
         # Холст графа
@@ -2651,27 +3589,27 @@ class ProjectWindow(QWidget):
         nav_layout = QHBoxLayout(nav_toolbar)
         nav_layout.setContentsMargins(5, 5, 5, 5)
 
-        self.zoom_in_btn = QPushButton(tr('btn_zoom_in'))
+        self.zoom_in_btn = QPushButton()
         self.zoom_in_btn.setFixedHeight(35)
         self.zoom_in_btn.setToolTip(tr('hint_zoom_in'))
         self.zoom_in_btn.clicked.connect(self.zoom_in)
 
-        self.zoom_out_btn = QPushButton(tr('btn_zoom_out'))
+        self.zoom_out_btn = QPushButton()
         self.zoom_out_btn.setFixedHeight(35)
         self.zoom_out_btn.setToolTip(tr('hint_zoom_out'))
         self.zoom_out_btn.clicked.connect(self.zoom_out)
 
-        self.pan_btn = QPushButton(tr('btn_pan'))
+        self.pan_btn = QPushButton()
         self.pan_btn.setFixedHeight(35)
         self.pan_btn.setToolTip(tr('hint_pan'))
         self.pan_btn.setCheckable(True)
         self.pan_btn.toggled.connect(self.toggle_pan_mode)
 
-        self.layout_btn = QPushButton(tr('btn_layout'))
+        self.layout_btn = QPushButton()
         self.layout_btn.setFixedHeight(35)
         self.layout_btn.clicked.connect(self.change_layout)
 
-        self.nav_label = QLabel(f"{tr('navigation')}")
+        self.nav_label = QLabel()
         nav_layout.addWidget(self.nav_label)
         nav_layout.addWidget(self.zoom_in_btn)
         nav_layout.addWidget(self.zoom_out_btn)
@@ -2689,16 +3627,16 @@ class ProjectWindow(QWidget):
         right_layout.addWidget(graph_container)
 
         # Подсказка по управлению
-        self.info_label = QLabel(f"<i>{tr('hint_controls')}</i>")
+        self.info_label = QLabel()
         self.info_label.setStyleSheet("color: #6C757D; font-size: 9px;")
         right_layout.addWidget(self.info_label)
 
         # Кнопки управления графом
         graph_buttons = QHBoxLayout()
-        self.refresh_btn = QPushButton(tr('btn_refresh'))
-        self.reset_zoom_btn = QPushButton(tr('btn_reset_zoom'))
-        self.color_btn = QPushButton(tr('btn_color'))
-        self.export_btn = QPushButton(tr('btn_export'))
+        self.refresh_btn = QPushButton()
+        self.reset_zoom_btn = QPushButton()
+        self.color_btn = QPushButton()
+        self.export_btn = QPushButton()
 
         self.refresh_btn.clicked.connect(self.refresh_graph)
         self.reset_zoom_btn.clicked.connect(self.reset_zoom)
@@ -2719,70 +3657,87 @@ class ProjectWindow(QWidget):
 
         main_layout.addWidget(splitter)
 
+        # Ключи перевода текстов виджетов; rich text задаётся шаблоном
+        self._tr_texts = [
+            (self.add_obj_btn, 'btn_add'),
+            (self.edit_obj_btn, 'btn_edit'),
+            (self.remove_obj_btn, 'btn_remove'),
+            (self.view_obj_btn, 'btn_view'),
+            (self.add_rel_btn, 'btn_add'),
+            (self.edit_rel_btn, 'btn_edit'),
+            (self.remove_rel_btn, 'btn_remove'),
+            (self.view_rel_btn, 'btn_view'),
+            (self.zoom_in_btn, 'btn_zoom_in'),
+            (self.zoom_out_btn, 'btn_zoom_out'),
+            (self.pan_btn, 'btn_pan'),
+            (self.layout_btn, 'btn_layout'),
+            (self.refresh_btn, 'btn_refresh'),
+            (self.reset_zoom_btn, 'btn_reset_zoom'),
+            (self.color_btn, 'btn_color'),
+            (self.export_btn, 'btn_export'),
+            (self.nav_label, 'navigation'),
+        ]
+        self._tr_html = [
+            (self.objects_label, 'objects_title', '<b>{}</b>'),
+            (self.relationships_label, 'relationships_title', '<b>{}</b>'),
+            (self.visualization_label, 'visualization_title', '<b>{}</b>'),
+            (self.info_label, 'hint_controls', '<i>{}</i>'),
+        ]
+        self._tr_tabs = ['tab_objects', 'tab_relationships']
+        self._apply_translations()
+
+    def _apply_translations(self) -> None:
+        """Задаёт тексты зарегистрированных виджетов на текущем языке."""
+        for widget, key in self._tr_texts:
+            widget.setText(tr(key))
+        for widget, key, fmt in self._tr_html:
+            widget.setText(fmt.format(tr(key)))
+        for index, key in enumerate(self._tr_tabs):
+            self.tabs.setTabText(index, tr(key))
+
     def retranslate_ui(self) -> None:
         """Обновляет тексты интерфейса при смене языка."""
-        # Вкладки
-        self.tabs.setTabText(0, tr('tab_objects'))
-        self.tabs.setTabText(1, tr('tab_relationships'))
-
-        # Заголовки
-        self.objects_label.setText(f"<b>{tr('objects_title')}</b>")
-        self.relationships_label.setText(f"<b>{tr('relationships_title')}</b>")
-        self.visualization_label.setText(f"<b>{tr('visualization_title')}</b>")
-        self.nav_label.setText(f"{tr('navigation')}")
-        self.info_label.setText(f"<i>{tr('hint_controls')}</i>")
-
-        # Кнопки объектов
-        self.add_obj_btn.setText(tr('btn_add'))
-        self.edit_obj_btn.setText(tr('btn_edit'))
-        self.remove_obj_btn.setText(tr('btn_remove'))
-        self.view_obj_btn.setText(tr('btn_view'))
-
-        # Кнопки связей
-        self.add_rel_btn.setText(tr('btn_add'))
-        self.edit_rel_btn.setText(tr('btn_edit'))
-        self.remove_rel_btn.setText(tr('btn_remove'))
-        self.view_rel_btn.setText(tr('btn_view'))
-
-        # Кнопки навигации и графа
-        self.zoom_in_btn.setText(tr('btn_zoom_in'))
-        self.zoom_out_btn.setText(tr('btn_zoom_out'))
-        self.pan_btn.setText(tr('btn_pan'))
-        self.layout_btn.setText(tr('btn_layout'))
-        self.refresh_btn.setText(tr('btn_refresh'))
-        self.reset_zoom_btn.setText(tr('btn_reset_zoom'))
-        self.color_btn.setText(tr('btn_color'))
-        self.export_btn.setText(tr('btn_export'))
-
-        # Заголовок окна
-        if self.current_file:
-            self.setWindowTitle(f"{tr('project')}: {os.path.basename(self.current_file)}")
-        else:
-            self.setWindowTitle(tr('new_project'))
+        self._retranslate_pending = False
+        self._apply_translations()
+        self.update_title()
 
-        # Обновляем списки
+        # Списки и надписи холста; компоновка графа не меняется
+        self.graph_canvas.retranslate()
         self.update_ui()
 
+    def defer_retranslate(self) -> None:
+        """Откладывает перевод интерфейса до активации окна.
+
+        Заголовок виден и у свёрнутого окна, поэтому обновляется сразу.
+        """
+        self._retranslate_pending = True
+        self.update_title()
+
+    def apply_pending_retranslate(self) -> None:
+        """Выполняет отложенный перевод интерфейса, если он есть."""
+        if self._retranslate_pending:
+            self.retranslate_ui()
+
+    def update_title(self) -> None:
+        """Задаёт заголовок окна по файлу проекта на текущем языке."""
+        if self.file_name:
+            title = f"{tr('project')}: {self.file_name}"
+        else:
+            title = tr('new_project')
+        if self.modified:
+            title += ' *'
+        self.setWindowTitle(title)
+
     def update_ui(self) -> None:
-        """Обновляет списки объектов и связей."""
-        # Список объектов
-        self.objects_list.clear()
-        for obj in self.manager.objects.values():
-            label = get_node_label(obj.type)
-            icon = NODE_ICONS.get(obj.type, '◉')
-            item = QListWidgetItem(f"{icon} {label}: {obj.name}")
-            item.setData(Qt.UserRole, obj.id)
-            self.objects_list.addItem(item)
-
-        # Список связей
-        self.relationships_list.clear()
-        for rel in self.manager.relationships:
-            source_name = self.manager.objects[rel.source_id].name
-            target_name = self.manager.objects[rel.target_id].name
-            text = f"{source_name} → [{rel.type}] → {target_name}"
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, (rel.source_id, rel.target_id, rel.type))
-            self.relationships_list.addItem(item)
+        """Обновляет списки объектов и связей.
+
+        Модели списков сверяют ключи строк с менеджером, а тексты
+        строятся представлением только для видимых строк. Граф
+        перерисовывается, только если с прошлой отрисовки менялись
+        объекты или связи.
+        """
+        self.objects_model.refresh()
+        self.relationships_model.refresh()
 
         # Доступность кнопок
         has_objects = len(self.manager.objects) > 0
@@ -2795,18 +3750,23 @@ class ProjectWindow(QWidget):
         self.view_rel_btn.setEnabled(len(self.manager.relationships) > 0)
         self.export_btn.setEnabled(has_objects)
 
-        self.refresh_graph()
+        if self._plotted_revision != (id(self.manager), self.manager.revision):
+            self.refresh_graph()
 
     def mark_modified(self) -> None:
         """Отмечает проект как изменённый."""
-        self.modified = True
+        if not self.modified:
+            self.modified = True
+            self.modified_changed.emit(True)
         title = self.windowTitle()
         if not title.endswith('*'):
             self.setWindowTitle(title + ' *')
 
     def mark_saved(self) -> None:
         """Отмечает проект как сохранённый."""
-        self.modified = False
+        if self.modified:
+            self.modified = False
+            self.modified_changed.emit(False)
         title = self.windowTitle()
         if title.endswith(' *'):
             self.setWindowTitle(title[:-2])
@@ -2815,7 +3775,7 @@ class ProjectWindow(QWidget):
 
     def add_object(self) -> None:
         """Открывает диалог добавления нового объекта."""
-        dialog = ObjectDialog(self)
+        dialog = ObjectDialog.get_instance(self)
         if dialog.exec_() == QDialog.Accepted:
             obj = dialog.get_object()
             if obj and self.manager.add_object(obj):
@@ -2824,15 +3784,15 @@ class ProjectWindow(QWidget):
 
     def edit_object(self) -> None:
         """Открывает диалог редактирования выбранного объекта."""
-        current_item = self.objects_list.currentItem()
-        if not current_item:
+        current = self.objects_list.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, tr('error'), tr('select_object'))
             return
 
-        obj_id = current_item.data(Qt.UserRole)
+        obj_id = current.data(Qt.UserRole)
         obj = self.manager.objects.get(obj_id)
 
-        dialog = ObjectDialog(self, edit_obj=obj)
+        dialog = ObjectDialog.get_instance(self, edit_obj=obj)
         if dialog.exec_() == QDialog.Accepted:
             new_obj = dialog.get_object()
             if new_obj and self.manager.update_object(obj_id, new_obj):
@@ -2841,11 +3801,11 @@ class ProjectWindow(QWidget):
 
     def remove_object(self) -> None:
         """Удаляет выбранный объект после подтверждения."""
-        current_item = self.objects_list.currentItem()
-        if not current_item:
+        current = self.objects_list.currentIndex()
+        if not current.isValid():
             return
 
-        obj_id = current_item.data(Qt.UserRole)
+        obj_id = current.data(Qt.UserRole)
         obj = self.manager.objects.get(obj_id)
 
         reply = QMessageBox.question(
@@ -2860,11 +3820,11 @@ class ProjectWindow(QWidget):
 
     def view_object(self) -> None:
         """Показывает информацию о выбранном объекте."""
-        current_item = self.objects_list.currentItem()
-        if not current_item:
+        current = self.objects_list.currentIndex()
+        if not current.isValid():
             return
 
-        obj_id = current_item.data(Qt.UserRole)
+        obj_id = current.data(Qt.UserRole)
         self.show_object_info(obj_id)
 
     def show_object_info(self, obj_id: str) -> None:
@@ -2880,58 +3840,52 @@ class ProjectWindow(QWidget):
         dependencies = self.manager.get_dependencies(obj_id)
         dependents = self.manager.get_dependents(obj_id)
 
-        label = get_node_label(obj.type)
-        icon = NODE_ICONS.get(obj.type, '◉')
+        objects = self.manager.objects
 
-        info = f"<h3>{icon} {label}: {tr('info_object')}</h3>"
-        info += f"<b>{tr('info_id')}</b> {obj.id}<br>"
-        info += f"<b>{tr('info_type')}</b> {obj.type}<br>"
-        info += f"<b>{tr('info_name')}</b> {obj.name}<br>"
-        info += f"<b>{tr('info_created')}</b> {obj.created_at[:19].replace('T', '  ')}<br>"
+        # Фрагменты HTML собираются в список и склеиваются один раз
+        parts = [
+            f"<h3>{get_type_prefix(obj.type)}{tr('info_object')}</h3>",
+            f"<b>{tr('info_id')}</b> {obj.id}<br>",
+            f"<b>{tr('info_type')}</b> {obj.type}<br>",
+            f"<b>{tr('info_name')}</b> {obj.name}<br>",
+            f"<b>{tr('info_created')}</b> {obj.created_at[:19].replace('T', '  ')}<br>",
+        ]
 
         if obj.properties:
-            info += f"<br><b>{tr('info_properties')}</b><br>"
-            for key, value in obj.properties.items():
-                info += f"&nbsp;&nbsp;• {key}: {value}<br>"
+            parts.append(f"<br><b>{tr('info_properties')}</b><br>")
+            parts.extend(f"&nbsp;&nbsp;• {key}: {value}<br>"
+                         for key, value in obj.properties.items())
 
         if dependencies:
-            info += f"<br><b>{tr('info_depends_on')} ({len(dependencies)}):</b><br>"
-            for dep_id in dependencies:
-                dep = self.manager.objects[dep_id]
-                info += f"&nbsp;&nbsp;• {dep.name}<br>"
+            parts.append(f"<br><b>{tr('info_depends_on')} ({len(dependencies)}):</b><br>")
+            parts.extend(f"&nbsp;&nbsp;• {objects[dep_id].name}<br>"
+                         for dep_id in dependencies)
 
         if dependents:
-            info += f"<br><b>{tr('info_dependents')} ({len(dependents)}):</b><br>"
-            for dep_id in dependents:
-                dep = self.manager.objects[dep_id]
-                info += f"&nbsp;&nbsp;• {dep.name}<br>"
-
-        msg = QMessageBox(self)
-        msg.setWindowTitle(tr('info_object'))
-        msg.setTextFormat(Qt.RichText)
-        msg.setText(info)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #FFFFFF;
-            }
-            QLabel {
-                color: #212529;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
-        msg.exec_()
+            parts.append(f"<br><b>{tr('info_dependents')} ({len(dependents)}):</b><br>")
+            parts.extend(f"&nbsp;&nbsp;• {objects[dep_id].name}<br>"
+                         for dep_id in dependents)
+
+        self._show_info(tr('info_object'), ''.join(parts))
+
+    def _show_info(self, title: str, html: str) -> None:
+        """Показывает информационное окно с HTML-текстом.
+
+        Окно создаётся при первом вызове и переиспользуется.
 
-    def on_object_selected(self, item) -> None:
+        Args:
+            title: Заголовок окна.
+            html: Текст в формате HTML.
+        """
+        if self._info_box is None:
+            self._info_box = QMessageBox(self)
+            self._info_box.setTextFormat(Qt.RichText)
+            self._info_box.setObjectName("infoMessageBox")
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(html)
+        self._info_box.exec_()
+
+    def on_object_selected(self, index: QModelIndex) -> None:
         """Обработчик выбора объекта в списке."""
         pass
 
@@ -2943,7 +3897,7 @@ class ProjectWindow(QWidget):
             QMessageBox.warning(self, tr('error'), tr('need_2_objects'))
             return
 
-        dialog = RelationshipDialog(self.manager.objects, self)
+        dialog = RelationshipDialog.get_instance(self, objects=self.manager.objects)
         if dialog.exec_() == QDialog.Accepted:
             rel = dialog.get_relationship()
             if rel and self.manager.add_relationship(rel):
@@ -2952,39 +3906,34 @@ class ProjectWindow(QWidget):
 
     def edit_relationship(self) -> None:
         """Открывает диалог редактирования выбранной связи."""
-        current_item = self.relationships_list.currentItem()
-        if not current_item:
+        current = self.relationships_list.currentIndex()
+        if not current.isValid():
             QMessageBox.warning(self, tr('error'), tr('select_relationship'))
             return
 
-        source_id, target_id, rel_type = current_item.data(Qt.UserRole)
-
-        rel = None
-        for r in self.manager.relationships:
-            if (r.source_id == source_id and r.target_id == target_id and
-                r.type == rel_type):
-                rel = r
-                break
+        old_rel = current.data(Qt.UserRole)
+        rel = self.relationships_model.relationship(old_rel)
 
         if not rel:
             return
 
-        dialog = RelationshipDialog(self.manager.objects, self, edit_rel=rel)
+        dialog = RelationshipDialog.get_instance(
+            self, objects=self.manager.objects, edit_rel=rel
+        )
         if dialog.exec_() == QDialog.Accepted:
             new_rel = dialog.get_relationship()
             if new_rel:
-                old_rel = (source_id, target_id, rel_type)
                 if self.manager.update_relationship(old_rel, new_rel):
                     self.mark_modified()
                     self.update_ui()
 
     def remove_relationship(self) -> None:
         """Удаляет выбранную связь после подтверждения."""
-        current_item = self.relationships_list.currentItem()
-        if not current_item:
+        current = self.relationships_list.currentIndex()
+        if not current.isValid():
             return
 
-        source_id, target_id, rel_type = current_item.data(Qt.UserRole)
+        source_id, target_id, rel_type = current.data(Qt.UserRole)
 
         reply = QMessageBox.question(
             self, tr('confirm'),
@@ -3000,18 +3949,11 @@ class ProjectWindow(QWidget):
 
     def view_relationship(self) -> None:
         """Показывает информацию о выбранной связи."""
-        current_item = self.relationships_list.currentItem()
-        if not current_item:
+        current = self.relationships_list.currentIndex()
+        if not current.isValid():
             return
 
-        source_id, target_id, rel_type = current_item.data(Qt.UserRole)
-
-        rel = None
-        for r in self.manager.relationships:
-            if (r.source_id == source_id and r.target_id == target_id and
-                r.type == rel_type):
-                rel = r
-                break
+        rel = self.relationships_model.relationship(current.data(Qt.UserRole))
 
         if not rel:
             return
@@ -3019,43 +3961,22 @@ class ProjectWindow(QWidget):
         source = self.manager.objects[rel.source_id]
         target = self.manager.objects[rel.target_id]
 
-        info = f"<h3>{tr('info_relationship')}</h3>"
-        info += f"<b>{tr('info_source_obj')}</b> {source.name} ({source.id})<br>"
-        info += f"<b>{tr('info_rel_type')}</b> {rel.type}<br>"
-        info += f"<b>{tr('info_target_obj')}</b> {target.name} ({target.id})<br>"
-        info += f"<b>{tr('info_created_at')}</b> {rel.created_at[:19].replace('T', '  ')}<br>"
+        parts = [
+            f"<h3>{tr('info_relationship')}</h3>",
+            f"<b>{tr('info_source_obj')}</b> {source.name} ({source.id})<br>",
+            f"<b>{tr('info_rel_type')}</b> {rel.type}<br>",
+            f"<b>{tr('info_target_obj')}</b> {target.name} ({target.id})<br>",
+            f"<b>{tr('info_created_at')}</b> {rel.created_at[:19].replace('T', '  ')}<br>",
+        ]
 
         if rel.description:
-            info += f"<br><b>{tr('info_description')}</b><br>{rel.description}"
-
-        msg = QMessageBox(self)
-        msg.setWindowTitle(tr('info_relationship'))
-        msg.setTextFormat(Qt.RichText)
-        msg.setText(info)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #FFFFFF;
-            }
-            QLabel {
-                color: #212529;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
-        msg.exec_()
+            parts.append(f"<br><b>{tr('info_description')}</b><br>{rel.description}")
 
-    def on_relationship_selected(self, item) -> None:
+        self._show_info(tr('info_relationship'), ''.join(parts))
+
+    def on_relationship_selected(self, index: QModelIndex) -> None:
         """Обработчик выбора связи в списке."""
-        source_id, target_id, _ = item.data(Qt.UserRole)
+        source_id, target_id, _ = index.data(Qt.UserRole)
         self.graph_canvas.highlight_edge(source_id, target_id)
 
     # === Обработчики событий графа ===
@@ -3067,18 +3988,27 @@ class ProjectWindow(QWidget):
     def on_graph_edge_clicked(self, source_id: str, target_id: str,
                               rel_type: str) -> None:
         """Обработчик клика на ребро графа."""
-        for i in range(self.relationships_list.count()):
-            item = self.relationships_list.item(i)
-            s, t, r = item.data(Qt.UserRole)
-            if s == source_id and t == target_id and r == rel_type:
-                self.relationships_list.setCurrentItem(item)
-                self.graph_canvas.highlight_edge(source_id, target_id)
-                break
+        row = self.relationships_model.row_of((source_id, target_id, rel_type))
+        if row is not None:
+            self.relationships_list.setCurrentIndex(self.relationships_model.index(row))
+            self.graph_canvas.highlight_edge(source_id, target_id)
 
     # === Методы управления графом ===
 
     def refresh_graph(self) -> None:
-        """Перерисовывает граф."""
+        """Планирует перерисовку графа.
+
+        Граф рисуется на следующей итерации цикла событий, поэтому
+        несколько изменений подряд дают одну перерисовку.
+        """
+        if not self._graph_pending:
+            self._graph_pending = True
+            QTimer.singleShot(0, self._do_refresh_graph)
+
+    def _do_refresh_graph(self) -> None:
+        """Перерисовывает граф по текущему состоянию менеджера."""
+        self._graph_pending = False
+        self._plotted_revision = (id(self.manager), self.manager.revision)
         self.graph_canvas.plot_graph(self.manager)
 
     def reset_zoom(self) -> None:
@@ -3103,7 +4033,10 @@ class ProjectWindow(QWidget):
 
     def change_layout(self) -> None:
         """Открывает диалог выбора алгоритма компоновки."""
-        dialog = LayoutDialog(self, self.graph_canvas.layout_algorithm)
+        dialog = LayoutDialog.get_instance(
+            self, current_layout=self.graph_canvas.layout_algorithm
+        )
+
         if dialog.exec_() == QDialog.Accepted:
             new_layout = dialog.get_layout()
             self.graph_canvas.set_layout_algorithm(new_layout)
@@ -3115,54 +4048,9 @@ class ProjectWindow(QWidget):
 
         # Создаём кастомный диалог вместо QInputDialog
         dialog = QDialog(self)
+        dialog.setObjectName("colorSchemeDialog")
         dialog.setWindowTitle(tr('scheme_dialog'))
         dialog.setMinimumWidth(300)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #FFFFFF;
-            }
-            QLabel {
-                color: #212529;
-                font-size: 11pt;
-                padding: 5px;
-            }
-            QListWidget {
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                background-color: #F8F9FA;
-                padding: 5px;
-                font-size: 11pt;
-            }
-            QListWidget::item {
-                padding: 10px;
-                border-radius: 4px;
-                margin: 2px;
-                color: #212529;
-            }
-            QListWidget::item:selected {
-                background-color: #007BFF;
-                color: white;
-            }
-            QListWidget::item:hover:!selected {
-                background-color: #E9ECEF;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #0056b3;
-                color: white;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
 
         layout = QVBoxLayout(dialog)
         layout.addWidget(QLabel(tr('scheme_select')))
@@ -3222,58 +4110,28 @@ class MainWindow(QMainWindow):
         - Строку состояния
     """
 
+    # Фильтры диалогов выбора файлов
+    JSON_FILTER = "JSON Files (*.json)"
+    YAML_FILTER = "YAML Files (*.yml *.yaml)"
+
     def __init__(self) -> None:
         """Инициализирует главное окно."""
         super().__init__()
+        # Проекты с несохранёнными изменениями: {окно проекта: вложенное окно}
+        self._unsaved_projects: Dict[ProjectWindow, QMdiSubWindow] = {}
+        # Диалоги выбора файлов по (режиму, фильтру), создаются при первом вызове
+        self._file_dialogs: Dict[Tuple[str, str], QFileDialog] = {}
+        self.setObjectName("mainWindow")
         self.setup_ui()
         self.apply_styles()
-        self.new_project()
+
+        # Первый проект создаётся после показа окна, чтобы не задерживать
+        # первую отрисовку
+        QTimer.singleShot(0, self.new_project)
 
     def apply_styles(self) -> None:
         """Применяет стили к элементам интерфейса."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #F8F9FA;
-            }
-            QMenuBar {
-                background-color: #FFFFFF;
-                color: #212529;
-                border-bottom: 2px solid #DEE2E6;
-                padding: 5px;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 8px 15px;
-                border-radius: 4px;
-            }
-            QMenuBar::item:selected {
-                background-color: #007BFF;
-                color: white;
-            }
-            QMenu {
-                background-color: #FFFFFF;
-                border: 2px solid #DEE2E6;
-                border-radius: 6px;
-                padding: 5px;
-            }
-            QMenu::item {
-                padding: 8px 25px;
-                border-radius: 4px;
-                color: #212529;
-            }
-            QMenu::item:selected {
-                background-color: #007BFF;
-                color: white;
-            }
-            QStatusBar {
-                background-color: #F8F9FA;
-                color: #495057;
-                border-top: 2px solid #DEE2E6;
-            }
-            QMdiArea {
-                background-color: #E9ECEF;
-            }
-        """)
+        install_app_styles()
 
     def setup_ui(self) -> None:
         """Настраивает элементы интерфейса."""
@@ -3281,6 +4139,7 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1400, 800)
 
         self.mdi = QMdiArea()
+        self.mdi.subWindowActivated.connect(self._on_subwindow_activated)
         self.setCentralWidget(self.mdi)
 
         self.create_menus()
@@ -3288,80 +4147,111 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(tr('ready'))
 
     def create_menus(self) -> None:
-        """Создаёт меню приложения."""
+        """Создаёт меню приложения.
+
+        Меню создаются один раз; при смене языка retranslate_menus()
+        меняет только тексты пунктов. Команды, открывающие окна проектов,
+        подключены через очередь: меню закрывается и перерисовывается до
+        построения нового окна.
+        """
         menubar = self.menuBar()
-        menubar.clear()
 
-        # Меню Файл
-        file_menu = menubar.addMenu(tr('menu_file'))
+        def separator() -> QAction:
+            action = QAction(self)
+            action.setSeparator(True)
+            return action
 
+        # Меню Файл
         new_action = QAction(tr('menu_new'), self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.new_project)
-        file_menu.addAction(new_action)
+        new_action.setShortcut(QKeySequence.New)
+        new_action.triggered.connect(self.new_project, Qt.QueuedConnection)
 
         open_action = QAction(tr('menu_open'), self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.open_project)
-        file_menu.addAction(open_action)
-
-        file_menu.addSeparator()
+        open_action.setShortcut(QKeySequence.Open)
+        open_action.triggered.connect(self.open_project, Qt.QueuedConnection)
 
         # Подменю Импорт
-        import_menu = file_menu.addMenu(tr('menu_import'))
-
         import_compose = QAction(tr('menu_docker'), self)
-        import_compose.triggered.connect(self.import_docker_compose)
-        import_menu.addAction(import_compose)
+        import_compose.triggered.connect(self.import_docker_compose, Qt.QueuedConnection)
 
         import_k8s = QAction(tr('menu_k8s'), self)
-        import_k8s.triggered.connect(self.import_kubernetes)
-        import_menu.addAction(import_k8s)
+        import_k8s.triggered.connect(self.import_kubernetes, Qt.QueuedConnection)
 
         import_godot = QAction(tr('menu_godot'), self)
-        import_godot.triggered.connect(self.import_godot_project)
-        import_menu.addAction(import_godot)
+        import_godot.triggered.connect(self.import_godot_project, Qt.QueuedConnection)
 
-        file_menu.addSeparator()
+        import_menu = QMenu(tr('menu_import'), self)
+        import_menu.addActions([import_compose, import_k8s, import_godot])
 
         save_action = QAction(tr('menu_save'), self)
-        save_action.setShortcut("Ctrl+S")
+        save_action.setShortcut(QKeySequence.Save)
         save_action.triggered.connect(self.save_project)
-        file_menu.addAction(save_action)
 
+        # У «Сохранить как» и «Выход» нет стандартных клавиш во всех ОС
+        # (в Windows они пустые), поэтому сочетания заданы явно
         save_as_action = QAction(tr('menu_save_as'), self)
         save_as_action.setShortcut("Ctrl+Shift+S")
         save_as_action.triggered.connect(self.save_project_as)
-        file_menu.addAction(save_as_action)
-
-        file_menu.addSeparator()
 
         exit_action = QAction(tr('menu_exit'), self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
 
-        # Меню Окна
-        window_menu = menubar.addMenu(tr('menu_windows'))
+        file_menu = menubar.addMenu(tr('menu_file'))
+        file_menu.addActions([
+            new_action, open_action,
+            separator(),
+            import_menu.menuAction(),
+            separator(),
+            save_action, save_as_action,
+            separator(),
+            exit_action,
+        ])
 
+        # Меню Окна
         cascade_action = QAction(tr('menu_cascade'), self)
         cascade_action.triggered.connect(self.mdi.cascadeSubWindows)
-        window_menu.addAction(cascade_action)
 
         tile_action = QAction(tr('menu_tile'), self)
         tile_action.triggered.connect(self.mdi.tileSubWindows)
-        window_menu.addAction(tile_action)
 
-        # Меню Язык
-        language_menu = menubar.addMenu(tr('menu_language'))
+        window_menu = menubar.addMenu(tr('menu_windows'))
+        window_menu.addActions([cascade_action, tile_action])
 
+        # Меню Язык
         russian_action = QAction(tr('menu_russian'), self)
-        russian_action.triggered.connect(lambda: self.change_language('ru'))
-        language_menu.addAction(russian_action)
+        russian_action.triggered.connect(partial(self.change_language, 'ru'))
 
         english_action = QAction(tr('menu_english'), self)
-        english_action.triggered.connect(lambda: self.change_language('en'))
-        language_menu.addAction(english_action)
+        english_action.triggered.connect(partial(self.change_language, 'en'))
+
+        language_menu = menubar.addMenu(tr('menu_language'))
+        language_menu.addActions([russian_action, english_action])
+
+        # Ключи перевода пунктов; заголовок меню - текст его menuAction
+        self._tr_actions = [
+            (file_menu.menuAction(), 'menu_file'),
+            (new_action, 'menu_new'),
+            (open_action, 'menu_open'),
+            (import_menu.menuAction(), 'menu_import'),
+            (import_compose, 'menu_docker'),
+            (import_k8s, 'menu_k8s'),
+            (import_godot, 'menu_godot'),
+            (save_action, 'menu_save'),
+            (save_as_action, 'menu_save_as'),
+            (exit_action, 'menu_exit'),
+            (window_menu.menuAction(), 'menu_windows'),
+            (cascade_action, 'menu_cascade'),
+            (tile_action, 'menu_tile'),
+            (language_menu.menuAction(), 'menu_language'),
+            (russian_action, 'menu_russian'),
+            (english_action, 'menu_english'),
+        ]
+
+    def retranslate_menus(self) -> None:
+        """Обновляет тексты меню на текущем языке."""
+        for action, key in self._tr_actions:
+            action.setText(tr(key))
 
     def change_language(self, lang: str) -> None:
         """Меняет язык интерфейса.
@@ -3371,73 +4261,69 @@ class MainWindow(QMainWindow):
         """
         set_language(lang)
 
-        self.create_menus()
+        self.retranslate_menus()
         self.setWindowTitle(tr('app_title'))
         self.statusBar().showMessage(tr('ready'))
 
-        # Обновляем все открытые окна проектов
+        # Видимые окна проектов переводятся сразу, свёрнутые и скрытые -
+        # при активации
+        active = self.mdi.activeSubWindow()
         for window in self.mdi.subWindowList():
             project = window.widget()
-            if isinstance(project, ProjectWindow):
+            if not isinstance(project, ProjectWindow):
+                continue
+            if window is active or (window.isVisible() and not window.isMinimized()):
                 project.retranslate_ui()
+            else:
+                project.defer_retranslate()
+
+    def _on_subwindow_activated(self, window: Optional[QMdiSubWindow]) -> None:
+        """Применяет отложенный перевод при активации окна проекта.
+
+        Args:
+            window: Активированное вложенное окно или None.
+        """
+        if window is not None and isinstance(window.widget(), ProjectWindow):
+            window.widget().apply_pending_retranslate()
 
     def closeEvent(self, event) -> None:
         """Обработчик закрытия приложения.
 
-        Проверяет несохранённые изменения во всех проектах.
+        Проверяет несохранённые изменения во всех проектах. Если таких
+        проектов несколько, сначала показывается общий запрос со списком;
+        окна проектов по очереди активируются только при выборе
+        «Просмотреть каждый».
 
         Args:
             event: Событие закрытия.
         """
-        unsaved_projects = []
-
-        for window in self.mdi.subWindowList():
-            project = window.widget()
-            if isinstance(project, ProjectWindow) and project.modified:
-                unsaved_projects.append((window, project))
-
-        if not unsaved_projects:
+        if not self._unsaved_projects:
             event.accept()
             return
 
-        for window, project in unsaved_projects:
-            self.mdi.setActiveSubWindow(window)
-
-            project_name = project.current_file if project.current_file else tr('new_project')
-            if project.current_file:
-                project_name = os.path.basename(project_name)
+        new_project_name = tr('new_project')
+        unsaved = [
+            (project, window, project.file_name or new_project_name)
+            for project, window in self._unsaved_projects.items()
+        ]
 
+        if len(unsaved) > 1:
             msg = QMessageBox(self)
             msg.setIcon(QMessageBox.Question)
             msg.setWindowTitle(tr('unsaved_title'))
-            msg.setText(f"{tr('project')} '{project_name}' {tr('unsaved_text')}")
+            msg.setText('\n'.join(
+                [tr('unsaved_many_text')] + [f"  • {name}" for _, _, name in unsaved]
+            ))
             msg.setInformativeText(tr('unsaved_question'))
-            msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #FFFFFF;
-                }
-                QLabel {
-                    color: #212529;
-                }
-                QPushButton {
-                    background-color: #007BFF;
-                    color: white;
-                    border: none;
-                    padding: 8px 20px;
-                    border-radius: 6px;
-                    font-weight: 600;
-                    min-width: 100px;
-                }
-                QPushButton:hover {
-                    background-color: #0056b3;
-                }
-            """)
+            msg.setObjectName("unsavedMessageBox")
 
-            save_btn = msg.addButton(tr('btn_save_changes'), QMessageBox.AcceptRole)
-            dont_save_btn = msg.addButton(tr('btn_dont_save'), QMessageBox.DestructiveRole)
+            save_all_btn = msg.addButton(tr('btn_save_all'), QMessageBox.AcceptRole)
+            discard_all_btn = msg.addButton(tr('btn_discard_all'),
+                                            QMessageBox.DestructiveRole)
             cancel_btn = msg.addButton(tr('btn_cancel'), QMessageBox.RejectRole)
+            msg.addButton(tr('btn_review_each'), QMessageBox.ActionRole)
 
-            msg.setDefaultButton(save_btn)
+            msg.setDefaultButton(save_all_btn)
             msg.exec_()
 
             clicked = msg.clickedButton()
@@ -3445,69 +4331,187 @@ class MainWindow(QMainWindow):
             if clicked == cancel_btn:
                 event.ignore()
                 return
-            elif clicked == save_btn:
-                if project.current_file:
-                    if not project.manager.save_to_file(project.current_file):
-                        QMessageBox.critical(
-                            self, tr('error'),
-                            f"{tr('save_error')} '{project_name}'"
-                        )
+            elif clicked == discard_all_btn:
+                event.accept()
+                return
+            elif clicked == save_all_btn:
+                for project, window, project_name in unsaved:
+                    if not self._save_on_close(project, window, project_name):
                         event.ignore()
                         return
-                else:
-                    filename, _ = QFileDialog.getSaveFileName(
-                        self, tr('save_project'),
-                        "infrastructure.json",
-                        "JSON Files (*.json)"
-                    )
+                event.accept()
+                return
 
-                    if filename:
-                        if not project.manager.save_to_file(filename):
-                            QMessageBox.critical(self, tr('error'), tr('save_error'))
-                            event.ignore()
-                            return
-                    else:
-                        event.ignore()
-                        return
+        # Тексты запроса одинаковы для всех проектов
+        title = tr('unsaved_title')
+        text_prefix = tr('project')
+        text_suffix = tr('unsaved_text')
+        question = tr('unsaved_question')
+        save_text = tr('btn_save_changes')
+        dont_save_text = tr('btn_dont_save')
+        cancel_text = tr('btn_cancel')
+
+        for project, window, project_name in unsaved:
+            self.mdi.setActiveSubWindow(window)
+
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Question)
+            msg.setWindowTitle(title)
+            msg.setText(f"{text_prefix} '{project_name}' {text_suffix}")
+            msg.setInformativeText(question)
+            msg.setObjectName("unsavedMessageBox")
+
+            save_btn = msg.addButton(save_text, QMessageBox.AcceptRole)
+            msg.addButton(dont_save_text, QMessageBox.DestructiveRole)
+            cancel_btn = msg.addButton(cancel_text, QMessageBox.RejectRole)
+
+            msg.setDefaultButton(save_btn)
+            msg.exec_()
+
+            clicked = msg.clickedButton()
+
+            if clicked == cancel_btn:
+                event.ignore()
+                return
+            elif clicked == save_btn:
+                if not self._save_on_close(project, window, project_name):
+                    event.ignore()
+                    return
 
         event.accept()
 
-    def new_project(self) -> None:
-        """Создаёт новый пустой проект."""
-        project = ProjectWindow()
+    def _save_on_close(self, project: ProjectWindow, window: QMdiSubWindow,
+                       project_name: str) -> bool:
+        """Сохраняет проект при закрытии приложения.
+
+        Проект без файла активируется, и для него запрашивается имя файла.
+
+        Args:
+            project: Окно проекта.
+            window: Подокно MDI с проектом.
+            project_name: Отображаемое имя проекта.
+
+        Returns:
+            True, если проект сохранён; False при ошибке или отмене.
+        """
+        if project.current_file:
+            if not project.manager.save_to_file(project.current_file):
+                QMessageBox.critical(
+                    self, tr('error'),
+                    f"{tr('save_error')} '{project_name}'"
+                )
+                return False
+            return True
+
+        self.mdi.setActiveSubWindow(window)
+        filename = self._choose_file(
+            'save', tr('save_project'), self.JSON_FILTER,
+            "infrastructure.json"
+        )
+
+        if not filename:
+            return False
+
+        if not project.manager.save_to_file(filename):
+            QMessageBox.critical(self, tr('error'), tr('save_error'))
+            return False
+        return True
+
+    def _choose_file(self, mode: str, caption: str, name_filter: str = '',
+                     selected: str = '') -> str:
+        """Показывает диалог выбора файла или папки.
+
+        Для каждого сочетания режима и фильтра создаётся один диалог,
+        который затем переиспользуется и помнит последний выбор.
+
+        Args:
+            mode: 'open' - существующий файл, 'save' - файл для
+                сохранения, 'folder' - папка.
+            caption: Заголовок диалога.
+            name_filter: Фильтр имён файлов.
+            selected: Предлагаемое имя или путь файла.
+
+        Returns:
+            Выбранный путь или пустая строка при отмене.
+        """
+        dialog = self._file_dialogs.get((mode, name_filter))
+        if dialog is None:
+            dialog = QFileDialog(self)
+            dialog.setNameFilter(name_filter)
+            if mode == 'save':
+                dialog.setAcceptMode(QFileDialog.AcceptSave)
+                dialog.setFileMode(QFileDialog.AnyFile)
+            elif mode == 'folder':
+                dialog.setFileMode(QFileDialog.Directory)
+                dialog.setOption(QFileDialog.ShowDirsOnly)
+            else:
+                dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialogs[(mode, name_filter)] = dialog
+
+        dialog.setWindowTitle(caption)
+        if selected:
+            dialog.selectFile(selected)
+        if dialog.exec_() != QDialog.Accepted:
+            return ''
+        return dialog.selectedFiles()[0]
+
+    def _add_project_window(self, project: ProjectWindow) -> QMdiSubWindow:
+        """Открывает окно проекта во вложенном окне MDI-области.
+
+        Args:
+            project: Окно проекта.
+
+        Returns:
+            Созданное вложенное окно.
+        """
         sub = QMdiSubWindow()
         sub.setWidget(project)
         sub.setAttribute(Qt.WA_DeleteOnClose)
         self.mdi.addSubWindow(sub)
         sub.show()
+
+        project.modified_changed.connect(
+            lambda modified: self._set_unsaved(project, sub, modified)
+        )
+        sub.destroyed.connect(lambda: self._set_unsaved(project, sub, False))
+        return sub
+
+    def _set_unsaved(self, project: ProjectWindow, sub: QMdiSubWindow,
+                     unsaved: bool) -> None:
+        """Учитывает, есть ли в проекте несохранённые изменения.
+
+        Args:
+            project: Окно проекта.
+            sub: Вложенное окно проекта.
+            unsaved: True, если есть несохранённые изменения.
+        """
+        if unsaved:
+            self._unsaved_projects[project] = sub
+        else:
+            self._unsaved_projects.pop(project, None)
+
+    def new_project(self) -> None:
+        """Создаёт новый пустой проект."""
+        project = ProjectWindow()
+        self._add_project_window(project)
         self.statusBar().showMessage(tr('new_project_created'), 3000)
 
     def open_project(self) -> None:
         """Открывает проект из файла."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, tr('open_project'), "",
-            "JSON Files (*.json)"
-        )
+        filename = self._choose_file('open', tr('open_project'), self.JSON_FILTER)
 
         if filename:
             manager = DependencyManager()
             if manager.load_from_file(filename):
                 project = ProjectWindow(manager, filename)
-                sub = QMdiSubWindow()
-                sub.setWidget(project)
-                sub.setAttribute(Qt.WA_DeleteOnClose)
-                self.mdi.addSubWindow(sub)
-                sub.show()
+                self._add_project_window(project)
                 self.statusBar().showMessage(f"{tr('loaded')}: {filename}", 3000)
             else:
                 QMessageBox.critical(self, tr('error'), tr('load_error'))
 
     def import_docker_compose(self) -> None:
         """Импортирует Docker Compose файл."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, tr('menu_docker'), "",
-            "YAML Files (*.yml *.yaml)"
-        )
+        filename = self._choose_file('open', tr('menu_docker'), self.YAML_FILTER)
 
         if filename:
             manager = DependencyManager()
@@ -3516,11 +4520,7 @@ class MainWindow(QMainWindow):
             if added_obj > 0:
                 project = ProjectWindow(manager, None)
                 project.setWindowTitle(f"{tr('import_prefix')} {os.path.basename(filename)}")
-                sub = QMdiSubWindow()
-                sub.setWidget(project)
-                sub.setAttribute(Qt.WA_DeleteOnClose)
-                self.mdi.addSubWindow(sub)
-                sub.show()
+                self._add_project_window(project)
 
                 QMessageBox.information(
                     self, tr('import_complete'),
@@ -3533,10 +4533,7 @@ class MainWindow(QMainWindow):
 
     def import_kubernetes(self) -> None:
         """Импортирует Kubernetes манифест."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, tr('menu_k8s'), "",
-            "YAML Files (*.yml *.yaml)"
-        )
+        filename = self._choose_file('open', tr('menu_k8s'), self.YAML_FILTER)
 
         if filename:
             manager = DependencyManager()
@@ -3545,11 +4542,7 @@ class MainWindow(QMainWindow):
             if added_obj > 0:
                 project = ProjectWindow(manager, None)
                 project.setWindowTitle(f"{tr('import_k8s_prefix')} {os.path.basename(filename)}")
-                sub = QMdiSubWindow()
-                sub.setWidget(project)
-                sub.setAttribute(Qt.WA_DeleteOnClose)
-                self.mdi.addSubWindow(sub)
-                sub.show()
+                self._add_project_window(project)
 
                 QMessageBox.information(
                     self, tr('import_complete'),
@@ -3563,19 +4556,15 @@ class MainWindow(QMainWindow):
     def import_godot_project(self) -> None:
         """Импортирует Godot проект с диалогом настройки фильтров."""
         # Сначала показываем диалог настройки импорта
-        options_dialog = GodotImportDialog(self)
+        options_dialog = GodotImportDialog.get_instance(self)
+
         if options_dialog.exec_() != QDialog.Accepted:
             return
 
         options = options_dialog.get_options()
 
         # Затем выбираем папку проекта
-        folder = QFileDialog.getExistingDirectory(
-            self,
-            tr('select_godot_folder'),
-            "",
-            QFileDialog.ShowDirsOnly
-        )
+        folder = self._choose_file('folder', tr('select_godot_folder'))
 
         if folder:
             try:
@@ -3583,9 +4572,9 @@ class MainWindow(QMainWindow):
 
                 analyzer = GodotDependencyAnalyzer(
                     folder,
-                    exclude_textures=options['exclude_textures'],
-                    exclude_audio=options['exclude_audio'],
-                    exclude_fonts=options['exclude_fonts']
+                    exclude_textures=options.exclude_textures,
+                    exclude_audio=options.exclude_audio,
+                    exclude_fonts=options.exclude_fonts
                 )
                 analyzer.analyze()
 
@@ -3597,35 +4586,32 @@ class MainWindow(QMainWindow):
 
                     project = ProjectWindow(manager, None)
                     project.setWindowTitle(f"{tr('import_godot_prefix')} {stats['project_name']}")
-                    sub = QMdiSubWindow()
-                    sub.setWidget(project)
-                    sub.setAttribute(Qt.WA_DeleteOnClose)
-                    self.mdi.addSubWindow(sub)
-                    sub.show()
+                    self._add_project_window(project)
 
                     # Формируем статистику
-                    stats_text = f"Проект: {stats['project_name']}\n\n"
-                    stats_text += f"Ресурсов: {added_obj}\n"
-                    stats_text += f"Зависимостей: {added_rel}\n\n"
-                    stats_text += "По типам:\n"
-                    for type_name, count in sorted(stats['by_type'].items()):
-                        stats_text += f"  • {type_name}: {count}\n"
+                    parts = [
+                        f"Проект: {stats['project_name']}\n\n",
+                        f"Ресурсов: {added_obj}\n",
+                        f"Зависимостей: {added_rel}\n\n",
+                        "По типам:\n",
+                    ]
+                    parts.extend(f"  • {type_name}: {count}\n"
+                                 for type_name, count in sorted(stats['by_type'].items()))
 
                     if stats['autoloads']:
-                        stats_text += f"\nAutoload: {', '.join(stats['autoloads'])}"
+                        parts.append(f"\nAutoload: {', '.join(stats['autoloads'])}")
 
                     # Показываем активные фильтры
-                    filters = []
-                    if stats['filters']['exclude_textures']:
-                        filters.append('текстуры')
-                    if stats['filters']['exclude_audio']:
-                        filters.append('аудио')
-                    if stats['filters']['exclude_fonts']:
-                        filters.append('шрифты')
+                    filters = ', '.join(
+                        name for key, name in (('exclude_textures', 'текстуры'),
+                                               ('exclude_audio', 'аудио'),
+                                               ('exclude_fonts', 'шрифты'))
+                        if stats['filters'][key]
+                    )
                     if filters:
-                        stats_text += f"\n\n(Исключены: {', '.join(filters)})"
+                        parts.append(f"\n\n(Исключены: {filters})")
 
-                    QMessageBox.information(self, tr('godot_import_stats'), stats_text)
+                    QMessageBox.information(self, tr('godot_import_stats'), ''.join(parts))
                 else:
                     QMessageBox.warning(self, tr('error'), tr('import_error'))
 
@@ -3665,17 +4651,16 @@ class MainWindow(QMainWindow):
 
         project = window.widget()
 
-        filename, _ = QFileDialog.getSaveFileName(
-            self, tr('save_project'),
-            project.current_file or "infrastructure.json",
-            "JSON Files (*.json)"
+        filename = self._choose_file(
+            'save', tr('save_project'), self.JSON_FILTER,
+            project.current_file or "infrastructure.json"
         )
 
         if filename:
             if project.manager.save_to_file(filename):
                 project.current_file = filename
                 project.mark_saved()
-                window.setWindowTitle(f"{tr('project')}: {os.path.basename(filename)}")
+                window.setWindowTitle(f"{tr('project')}: {project.file_name}")
                 self.statusBar().showMessage(f"{tr('saved')}: {filename}", 3000)
             else:
                 QMessageBox.critical(self, tr('error'), tr('save_error'))
@@ -3685,6 +4670,22 @@ class MainWindow(QMainWindow):
 # ТОЧКА ВХОДА
 # =============================================================================
 
+def _preload_optional_modules() -> None:
+    """Импортирует в фоновом потоке модули, нужные только отдельным командам.
+
+    Анализатор Godot импортируется при первом импорте проекта; загрузка
+    заранее избавляет этот клик от задержки. Ошибки импорта здесь не
+    показываются - их сообщит сама команда.
+    """
+    def load() -> None:
+        try:
+            import godot_analyzer  # noqa: F401
+        except Exception:
+            pass
+
+    threading.Thread(target=load, name='preload', daemon=True).start()
+
+
 def main() -> None:
     """Главная функция запуска приложения."""
     app = QApplication(sys.argv)
@@ -3696,6 +4697,9 @@ def main() -> None:
     window = MainWindow()
     window.show()
 
+    # Фоновая загрузка стартует, когда окно уже показано
+    QTimer.singleShot(0, _preload_optional_modules)
+
     sys.exit(app.exec_())
 
 
@@ -19,12 +19,21 @@
     >>> print(f"Найдено ресурсов: {stats['total_resources']}")
 """
 
+import json
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+
+# Замена спецсимволов пути при построении ID за один проход
+_ID_TRANS = str.maketrans('/.-', '___')
 
 
 class GodotResourceType(Enum):
@@ -64,12 +73,18 @@ class GodotResource:
         name: Отображаемое имя ресурса.
         file_path: Абсолютный путь к файлу на диске.
         properties: Дополнительные свойства ресурса.
+        type_str: Строковое значение type (заполняется автоматически).
     """
     path: str
     type: GodotResourceType
     name: str
     file_path: str
     properties: Dict = field(default_factory=dict)
+    type_str: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Запоминает строковое значение типа, чтобы не обращаться к Enum."""
+        self.type_str = self.type.value
 
     @property
     def id(self) -> str:
@@ -78,14 +93,15 @@ class GodotResource:
         Returns:
             Строка ID без спецсимволов (для использования в DependencyManager).
         """
-        return self.path.replace("res://", "").replace("/", "_").replace(".", "_").replace("-", "_")
+        return self.path.replace("res://", "").translate(_ID_TRANS)
 
 
-@dataclass
-class GodotDependency:
+class GodotDependency(NamedTuple):
     """Зависимость между ресурсами Godot.
 
     Представляет направленную связь от одного ресурса к другому.
+    Зависимостей в проекте может быть очень много, поэтому это
+    неизменяемый NamedTuple без словаря атрибутов у каждого экземпляра.
 
     Attributes:
         source: Путь res:// исходного ресурса.
@@ -99,6 +115,78 @@ class GodotDependency:
     context: str = ""
 
 
+# Размер буфера чтения: файлы проекта всегда читаются целиком
+READ_BUFFER_SIZE = 1 << 17
+
+
+def _read_text(path: str) -> str:
+    """Читает файл целиком и декодирует его как UTF-8.
+
+    Args:
+        path: Путь к файлу.
+
+    Returns:
+        Содержимое файла.
+
+    Raises:
+        OSError: Если файл не удалось открыть или прочитать.
+        UnicodeDecodeError: Если файл не в кодировке UTF-8.
+    """
+    with open(path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        return f.read().decode('utf-8')
+
+
+def _to_res_path(file_path: str, project_root: Path) -> str:
+    """Преобразует абсолютный путь в формат res://.
+
+    Args:
+        file_path: Путь к файлу.
+        project_root: Корневая директория Godot проекта.
+
+    Returns:
+        Путь в формате res://.
+    """
+    try:
+        rel_path = Path(file_path).relative_to(project_root)
+        return f"res://{rel_path.as_posix()}"
+    except ValueError:
+        return f"res://{Path(file_path).name}"
+
+
+@lru_cache(maxsize=1 << 16)
+def _path_to_godot_id(path: str) -> str:
+    """Преобразует путь res:// в ID объекта DependencyManager.
+
+    Одни и те же пути встречаются во многих зависимостях, поэтому
+    результат кэшируется.
+
+    Args:
+        path: Путь в формате res://.
+
+    Returns:
+        ID вида godot_<путь без спецсимволов>.
+    """
+    return "godot_" + path.replace("res://", "").translate(_ID_TRANS)
+
+
+def _export_properties(resource: GodotResource) -> Dict:
+    """Собирает свойства объекта DependencyManager для ресурса.
+
+    Копия через dict.copy() с последующими присваиваниями быстрее,
+    чем распаковка {**resource.properties, ...}.
+
+    Args:
+        resource: Ресурс Godot.
+
+    Returns:
+        Новый словарь свойств с godot_type и res_path.
+    """
+    properties = resource.properties.copy()
+    properties['godot_type'] = resource.type_str
+    properties['res_path'] = resource.path
+    return properties
+
+
 class GodotSceneParser:
     """Парсер файлов сцен Godot (.tscn).
 
@@ -110,6 +198,7 @@ class GodotSceneParser:
     Attributes:
         file_path: Путь к файлу сцены.
         project_root: Корневая директория проекта.
+        res_path: Путь сцены в формате res://.
         ext_resources: Словарь внешних ресурсов {id: (type, path)}.
         nodes: Список узлов сцены.
         connections: Список сигнальных соединений.
@@ -141,15 +230,49 @@ class GodotSceneParser:
         r'\[connection\s+signal="([^"]+)"\s+from="([^"]+)"\s+to="([^"]+)"\s+method="([^"]+)"\]'
     )
 
-    def __init__(self, file_path: str, project_root: Path) -> None:
+    # Маппинг типов ресурсов Godot на типы зависимостей
+    TYPE_MAP = {
+        'PackedScene': 'uses_scene',
+        'Script': 'uses_script',
+        'GDScript': 'uses_script',
+        'CSharpScript': 'uses_script',
+        'Texture2D': 'uses_texture',
+        'CompressedTexture2D': 'uses_texture',
+        'ImageTexture': 'uses_texture',
+        'AtlasTexture': 'uses_texture',
+        'AudioStream': 'uses_audio',
+        'AudioStreamMP3': 'uses_audio',
+        'AudioStreamOggVorbis': 'uses_audio',
+        'AudioStreamWAV': 'uses_audio',
+        'Material': 'uses_material',
+        'ShaderMaterial': 'uses_shader',
+        'StandardMaterial3D': 'uses_material',
+        'Shader': 'uses_shader',
+        'Font': 'uses_font',
+        'FontFile': 'uses_font',
+        'SystemFont': 'uses_font',
+        'Theme': 'uses_resource',
+        'Resource': 'uses_resource',
+        'Animation': 'uses_resource',
+        'AnimationLibrary': 'uses_resource',
+        'SpriteFrames': 'uses_resource',
+        'TileSet': 'uses_resource',
+        'Environment': 'uses_resource',
+    }
+
+    def __init__(self, file_path: str, project_root: Path,
+                 res_path: Optional[str] = None) -> None:
         """Инициализирует парсер сцены.
 
         Args:
             file_path: Путь к .tscn файлу.
             project_root: Корневая директория Godot проекта.
+            res_path: Уже вычисленный путь res:// (если не задан,
+                вычисляется из file_path).
         """
         self.file_path = file_path
         self.project_root = project_root
+        self.res_path = res_path or _to_res_path(file_path, project_root)
         self.ext_resources: Dict[str, Tuple[str, str]] = {}
         self.nodes: List[Dict] = []
         self.connections: List[Dict] = []
@@ -168,57 +291,96 @@ class GodotSceneParser:
             Список зависимостей GodotDependency.
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(self.file_path)
         except Exception as e:
             print(f"Ошибка чтения {self.file_path}: {e}")
             return []
 
-        scene_path = self._get_res_path()
+        return self.parse_text(content)
 
-        # Парсим внешние ресурсы (формат Godot 4.x)
-        for match in self.EXT_RESOURCE_PATTERN.finditer(content):
-            res_type, res_path, res_id = match.groups()
-            self.ext_resources[res_id] = (res_type, res_path)
+    def parse_text(self, content: str) -> List[GodotDependency]:
+        """Парсит уже прочитанное содержимое сцены.
 
-            dep_type = self._classify_dependency(res_type)
-            self.dependencies.append(GodotDependency(
-                source=scene_path,
-                target=res_path,
-                dep_type=dep_type,
-                context=f"ext_resource: {res_type}"
-            ))
+        Args:
+            content: Текст .tscn файла.
 
-        # Парсим внешние ресурсы (альтернативный формат)
-        for match in self.EXT_RESOURCE_ALT_PATTERN.finditer(content):
-            res_path, res_type, res_id = match.groups()
-            self.ext_resources[res_id] = (res_type, res_path)
-
-            dep_type = self._classify_dependency(res_type)
-            self.dependencies.append(GodotDependency(
-                source=scene_path,
-                target=res_path,
-                dep_type=dep_type,
-                context=f"ext_resource: {res_type}"
-            ))
+        Returns:
+            Список зависимостей GodotDependency.
+        """
+        scene_path = self.res_path
+
+        # Один проход по строкам: регулярные выражения запускаются только
+        # для строк с подходящим префиксом. Совпадения раскладываются по
+        # видам, чтобы зависимости шли в прежнем порядке, а ссылки на
+        # ExtResource разрешались после чтения всех внешних ресурсов
+        ext_deps: List[GodotDependency] = []
+        ext_alt_deps: List[GodotDependency] = []
+        instances: List[Tuple[str, str]] = []
+        script_ids: List[str] = []
+
+        for line in content.splitlines():
+            if line.startswith('[ext_resource'):
+                # Внешние ресурсы (форматы Godot 4.x и альтернативный)
+                match = self.EXT_RESOURCE_PATTERN.match(line)
+                if match:
+                    res_type, res_path, res_id = match.groups()
+                    target_list = ext_deps
+                else:
+                    match = self.EXT_RESOURCE_ALT_PATTERN.match(line)
+                    if not match:
+                        continue
+                    res_path, res_type, res_id = match.groups()
+                    target_list = ext_alt_deps
+                self.ext_resources[res_id] = (res_type, res_path)
 
-        # Парсим узлы (для инстансов сцен)
-        for match in self.NODE_PATTERN.finditer(content):
-            name, node_type, parent, instance_id = match.groups()
-            if instance_id:
-                instance_id = instance_id.strip('"\'')
-                if instance_id in self.ext_resources:
-                    _, instance_path = self.ext_resources[instance_id]
-                    self.dependencies.append(GodotDependency(
-                        source=scene_path,
-                        target=instance_path,
-                        dep_type="instances",
-                        context=f"node instance: {name}"
-                    ))
+                dep_type = self._classify_dependency(res_type)
+                target_list.append(GodotDependency(
+                    source=scene_path,
+                    target=res_path,
+                    dep_type=dep_type,
+                    context=f"ext_resource: {res_type}"
+                ))
+
+            elif line.startswith('[node'):
+                # Узлы (для инстансов сцен)
+                match = self.NODE_PATTERN.match(line)
+                if match:
+                    name, node_type, parent, instance_id = match.groups()
+                    if instance_id:
+                        instances.append((name, instance_id.strip('"\'')))
+
+            elif line.startswith('[connection'):
+                # Сигнальные соединения
+                match = self.CONNECTION_PATTERN.match(line)
+                if match:
+                    signal_name, from_node, to_node, method = match.groups()
+                    self.connections.append({
+                        'signal': signal_name,
+                        'from': from_node,
+                        'to': to_node,
+                        'method': method
+                    })
+
+            elif 'ExtResource(' in line:
+                # Привязки скриптов
+                match = self.SCRIPT_ASSIGN_PATTERN.search(line)
+                if match:
+                    script_ids.append(match.group(1).strip('"\''))
 
-        # Парсим привязки скриптов
-        for match in self.SCRIPT_ASSIGN_PATTERN.finditer(content):
-            script_id = match.group(1).strip('"\'')
+        self.dependencies.extend(ext_deps)
+        self.dependencies.extend(ext_alt_deps)
+
+        for name, instance_id in instances:
+            if instance_id in self.ext_resources:
+                _, instance_path = self.ext_resources[instance_id]
+                self.dependencies.append(GodotDependency(
+                    source=scene_path,
+                    target=instance_path,
+                    dep_type="instances",
+                    context=f"node instance: {name}"
+                ))
+
+        for script_id in script_ids:
             if script_id in self.ext_resources:
                 _, script_path = self.ext_resources[script_id]
                 self.dependencies.append(GodotDependency(
@@ -228,68 +390,23 @@ class GodotSceneParser:
                     context="attached script"
                 ))
 
-        # Парсим сигнальные соединения
-        for match in self.CONNECTION_PATTERN.finditer(content):
-            signal_name, from_node, to_node, method = match.groups()
-            self.connections.append({
-                'signal': signal_name,
-                'from': from_node,
-                'to': to_node,
-                'method': method
-            })
-
         return self.dependencies
 
-    def _get_res_path(self) -> str:
-        """Преобразует абсолютный путь в формат res://.
-
-        Returns:
-            Путь в формате res://.
-        """
-        try:
-            rel_path = Path(self.file_path).relative_to(self.project_root)
-            return f"res://{rel_path.as_posix()}"
-        except ValueError:
-            return f"res://{Path(self.file_path).name}"
-
-    def _classify_dependency(self, godot_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _classify_dependency(godot_type: str) -> str:
         """Классифицирует тип зависимости по типу Godot ресурса.
 
+        Результат кэшируется: различных типов ресурсов немного,
+        а вызывается метод для каждого ext_resource.
+
         Args:
             godot_type: Тип ресурса из Godot (PackedScene, Script и т.д.).
 
         Returns:
             Строка типа зависимости для DependencyManager.
         """
-        type_map = {
-            'PackedScene': 'uses_scene',
-            'Script': 'uses_script',
-            'GDScript': 'uses_script',
-            'CSharpScript': 'uses_script',
-            'Texture2D': 'uses_texture',
-            'CompressedTexture2D': 'uses_texture',
-            'ImageTexture': 'uses_texture',
-            'AtlasTexture': 'uses_texture',
-            'AudioStream': 'uses_audio',
-            'AudioStreamMP3': 'uses_audio',
-            'AudioStreamOggVorbis': 'uses_audio',
-            'AudioStreamWAV': 'uses_audio',
-            'Material': 'uses_material',
-            'ShaderMaterial': 'uses_shader',
-            'StandardMaterial3D': 'uses_material',
-            'Shader': 'uses_shader',
-            'Font': 'uses_font',
-            'FontFile': 'uses_font',
-            'SystemFont': 'uses_font',
-            'Theme': 'uses_resource',
-            'Resource': 'uses_resource',
-            'Animation': 'uses_resource',
-            'AnimationLibrary': 'uses_resource',
-            'SpriteFrames': 'uses_resource',
-            'TileSet': 'uses_resource',
-            'Environment': 'uses_resource',
-        }
-        return type_map.get(godot_type, 'uses')
+        return GodotSceneParser.TYPE_MAP.get(godot_type, 'uses')
 
 
 class GodotScriptParser:
@@ -304,16 +421,18 @@ class GodotScriptParser:
     Attributes:
         file_path: Путь к .gd файлу.
         project_root: Корневая директория проекта.
+        res_path: Путь скрипта в формате res://.
         class_name: Имя класса (class_name).
         extends: Родительский класс/файл.
         signals: Список определённых сигналов.
         dependencies: Список найденных зависимостей.
     """
 
-    # Регулярные выражения для парсинга GDScript
-    EXTENDS_PATTERN = re.compile(r'^extends\s+["\']([^"\']+)["\']', re.MULTILINE)
-    EXTENDS_CLASS_PATTERN = re.compile(r'^extends\s+(\w+)', re.MULTILINE)
-    CLASS_NAME_PATTERN = re.compile(r'^class_name\s+(\w+)', re.MULTILINE)
+    # Регулярные выражения для парсинга GDScript.
+    # Паттерны объявлений применяются к отдельным строкам через match()
+    EXTENDS_PATTERN = re.compile(r'extends\s+["\']([^"\']+)["\']')
+    EXTENDS_CLASS_PATTERN = re.compile(r'extends\s+(\w+)')
+    CLASS_NAME_PATTERN = re.compile(r'class_name\s+(\w+)')
     PRELOAD_PATTERN = re.compile(r'preload\s*\(\s*["\']([^"\']+)["\']\s*\)')
     LOAD_PATTERN = re.compile(r'(?<!pre)load\s*\(\s*["\']([^"\']+)["\']\s*\)')
     CONST_SCENE_PATTERN = re.compile(
@@ -321,18 +440,22 @@ class GodotScriptParser:
     )
     GET_NODE_PATTERN = re.compile(r'get_node\s*\(\s*["\']([^"\']+)["\']\s*\)')
     ONREADY_PATTERN = re.compile(r'@onready\s+var\s+(\w+)\s*[=:]\s*\$([^\s\n]+)')
-    SIGNAL_PATTERN = re.compile(r'^signal\s+(\w+)', re.MULTILINE)
+    SIGNAL_PATTERN = re.compile(r'signal\s+(\w+)')
     CONNECT_PATTERN = re.compile(r'\.connect\s*\(\s*["\'](\w+)["\']')
 
-    def __init__(self, file_path: str, project_root: Path) -> None:
+    def __init__(self, file_path: str, project_root: Path,
+                 res_path: Optional[str] = None) -> None:
         """Инициализирует парсер скрипта.
 
         Args:
             file_path: Путь к .gd файлу.
             project_root: Корневая директория Godot проекта.
+            res_path: Уже вычисленный путь res:// (если не задан,
+                вычисляется из file_path).
         """
         self.file_path = file_path
         self.project_root = project_root
+        self.res_path = res_path or _to_res_path(file_path, project_root)
         self.class_name: Optional[str] = None
         self.extends: Optional[str] = None
         self.signals: List[str] = []
@@ -350,45 +473,69 @@ class GodotScriptParser:
             Список зависимостей GodotDependency.
         """
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(self.file_path)
         except Exception as e:
             print(f"Ошибка чтения {self.file_path}: {e}")
             return []
 
-        script_path = self._get_res_path()
-
-        # Парсим extends с путём к файлу
-        extends_match = self.EXTENDS_PATTERN.search(content)
-        if extends_match:
-            extends_value = extends_match.group(1)
-            target = extends_value if extends_value.startswith("res://") else f"res://{extends_value}"
-            self.dependencies.append(GodotDependency(
-                source=script_path,
-                target=target,
-                dep_type="extends",
-                context=f"extends {extends_value}"
-            ))
-            self.extends = extends_value
+        return self.parse_text(content)
 
-        # Парсим class_name
-        class_match = self.CLASS_NAME_PATTERN.search(content)
-        if class_match:
-            self.class_name = class_match.group(1)
+    def parse_text(self, content: str) -> List[GodotDependency]:
+        """Парсит уже прочитанное содержимое скрипта.
 
-        # Парсим preload
-        for match in self.PRELOAD_PATTERN.finditer(content):
-            res_path = match.group(1)
-            if res_path.startswith("res://"):
-                dep_type = "preloads_scene" if res_path.endswith(".tscn") else "preloads"
-                self.dependencies.append(GodotDependency(
-                    source=script_path,
-                    target=res_path,
-                    dep_type=dep_type,
-                    context=f"preload({res_path})"
-                ))
+        Args:
+            content: Текст .gd файла.
+
+        Returns:
+            Список зависимостей GodotDependency.
+        """
+        script_path = self.res_path
+
+        # Объявления ищутся построчно, только в строках с нужным началом
+        for line in content.splitlines():
+            if line.startswith('extends'):
+                # extends с путём к файлу (учитывается первое объявление)
+                if self.extends is None:
+                    extends_match = self.EXTENDS_PATTERN.match(line)
+                    if extends_match:
+                        extends_value = extends_match.group(1)
+                        target = extends_value if extends_value.startswith("res://") else f"res://{extends_value}"
+                        self.dependencies.append(GodotDependency(
+                            source=script_path,
+                            target=target,
+                            dep_type="extends",
+                            context=f"extends {extends_value}"
+                        ))
+                        self.extends = extends_value
+
+            elif line.startswith('class_name'):
+                if self.class_name is None:
+                    class_match = self.CLASS_NAME_PATTERN.match(line)
+                    if class_match:
+                        self.class_name = class_match.group(1)
+
+            elif line.startswith('signal'):
+                signal_match = self.SIGNAL_PATTERN.match(line)
+                if signal_match:
+                    self.signals.append(signal_match.group(1))
+
+        # preload и load ищутся по всему тексту: в скриптах вызов может
+        # быть разбит на несколько строк
+        if 'load' not in content:
+            return self.dependencies
+
+        if 'preload' in content:
+            for match in self.PRELOAD_PATTERN.finditer(content):
+                res_path = match.group(1)
+                if res_path.startswith("res://"):
+                    dep_type = "preloads_scene" if res_path.endswith(".tscn") else "preloads"
+                    self.dependencies.append(GodotDependency(
+                        source=script_path,
+                        target=res_path,
+                        dep_type=dep_type,
+                        context=f"preload({res_path})"
+                    ))
 
-        # Парсим load (runtime загрузка)
         for match in self.LOAD_PATTERN.finditer(content):
             res_path = match.group(1)
             if res_path.startswith("res://"):
@@ -400,23 +547,122 @@ class GodotScriptParser:
                     context=f"load({res_path})"
                 ))
 
-        # Парсим сигналы
-        for match in self.SIGNAL_PATTERN.finditer(content):
-            self.signals.append(match.group(1))
-
         return self.dependencies
 
-    def _get_res_path(self) -> str:
-        """Преобразует абсолютный путь в формат res://.
+
+def _parse_file(task: Tuple[type, str, Path, str, Optional[str]]) -> List[GodotDependency]:
+    """Парсит одну сцену или скрипт (в том числе в дочернем процессе).
+
+    Функция объявлена на уровне модуля, чтобы её можно было
+    передать в ProcessPoolExecutor.
+
+    Args:
+        task: Кортеж (класс парсера, путь к файлу, корень проекта,
+            путь res://, содержимое файла или None, если его нужно
+            прочитать).
+
+    Returns:
+        Список зависимостей GodotDependency.
+    """
+    parser_class, file_path, project_root, res_path, content = task
+    parser = parser_class(file_path, project_root, res_path)
+    if content is None:
+        return parser.parse()
+    return parser.parse_text(content)
+
+
+class _ParseCache:
+    """Постоянный кэш результатов парсинга сцен и скриптов.
+
+    Хранится в JSON-файле внутри проекта. Запись о файле действительна,
+    пока не изменились его время модификации и размер, поэтому при
+    повторном анализе неизменённые файлы не разбираются заново.
+    JSON вместо pickle выбран намеренно: файл лежит в чужом проекте,
+    и его загрузка не должна выполнять произвольный код.
+
+    Attributes:
+        cache_path: Путь к файлу кэша.
+    """
+
+    # Версия формата; при изменении парсеров старый кэш отбрасывается
+    VERSION = 2
+
+    def __init__(self, cache_path: Path) -> None:
+        """Инициализирует кэш.
+
+        Args:
+            cache_path: Путь к файлу кэша.
+        """
+        self.cache_path = cache_path
+        self._entries: Dict[str, list] = {}
+        self._modified = False
+
+    def load(self) -> None:
+        """Загружает кэш с диска; повреждённый или устаревший кэш игнорируется."""
+        try:
+            data = json.loads(_read_text(str(self.cache_path)))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self._entries = data.get('files', {})
+
+    def get(self, res_path: str,
+            stamp: Tuple[int, int]) -> Optional[List[GodotDependency]]:
+        """Возвращает сохранённые зависимости файла.
+
+        Args:
+            res_path: Путь файла в формате res://.
+            stamp: Кортеж (время модификации в нс, размер).
 
         Returns:
-            Путь в формате res://.
+            Список зависимостей или None, если записи нет или она устарела.
+        """
+        entry = self._entries.get(res_path)
+        if entry is None or entry[0] != stamp[0] or entry[1] != stamp[1]:
+            return None
+        # Типы зависимостей интернируются, как и строковые литералы
+        # парсеров, чтобы сравнения и поиск в словарях шли по указателю
+        return [
+            GodotDependency(source, target, sys.intern(dep_type), context)
+            for source, target, dep_type, context in entry[2]
+        ]
+
+    def put(self, res_path: str, stamp: Tuple[int, int],
+            deps: List[GodotDependency]) -> None:
+        """Сохраняет зависимости файла.
+
+        Args:
+            res_path: Путь файла в формате res://.
+            stamp: Кортеж (время модификации в нс, размер).
+            deps: Найденные зависимости.
+        """
+        self._entries[res_path] = [
+            stamp[0], stamp[1],
+            [[dep.source, dep.target, dep.dep_type, dep.context] for dep in deps]
+        ]
+        self._modified = True
+
+    def save(self, res_paths: set) -> None:
+        """Записывает кэш на диск, удаляя записи об исчезнувших файлах.
+
+        Args:
+            res_paths: Множество путей res:// файлов, которые есть в проекте.
         """
+        stale = self._entries.keys() - res_paths
+        for res_path in stale:
+            del self._entries[res_path]
+        if not (self._modified or stale):
+            return
+
         try:
-            rel_path = Path(self.file_path).relative_to(self.project_root)
-            return f"res://{rel_path.as_posix()}"
-        except ValueError:
-            return f"res://{Path(self.file_path).name}"
+            self.cache_path.parent.mkdir(exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'files': self._entries}, f)
+            os.replace(tmp_path, self.cache_path)
+            self._modified = False
+        except OSError as e:
+            print(f"Не удалось сохранить кэш анализа: {e}")
 
 
 class GodotProjectParser:
@@ -433,7 +679,13 @@ class GodotProjectParser:
         project_name: Название проекта.
     """
 
-    AUTOLOAD_PATTERN = re.compile(r'^(\w+)="?\*?res://([^"\n]+)"?$', re.MULTILINE)
+    # Секция [autoload] до следующего заголовка секции или конца файла
+    AUTOLOAD_SECTION_PATTERN = re.compile(
+        r'^[ \t]*\[autoload\][ \t\r]*$(.*?)(?=^[ \t]*\[|\Z)', re.MULTILINE | re.DOTALL
+    )
+    AUTOLOAD_PATTERN = re.compile(
+        r'^[ \t]*(\w+)="?\*?res://([^"\r\n]+?)"?[ \t\r]*$', re.MULTILINE
+    )
 
     def __init__(self, project_path: str) -> None:
         """Инициализирует парсер проекта.
@@ -453,28 +705,16 @@ class GodotProjectParser:
             Словарь autoload {имя: путь res://}.
         """
         try:
-            with open(self.project_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(self.project_path)
         except Exception as e:
             print(f"Ошибка чтения project.godot: {e}")
             return {}
 
-        # Ищем секцию autoload
-        in_autoload = False
-        for line in content.split('\n'):
-            line = line.strip()
-            if line == '[autoload]':
-                in_autoload = True
-                continue
-            elif line.startswith('[') and in_autoload:
-                in_autoload = False
-                continue
-
-            if in_autoload and '=' in line:
-                match = self.AUTOLOAD_PATTERN.match(line)
-                if match:
-                    name, path = match.groups()
-                    self.autoloads[name] = f"res://{path}"
+        # Ищем секцию autoload и разбираем только её
+        for section in self.AUTOLOAD_SECTION_PATTERN.finditer(content):
+            for match in self.AUTOLOAD_PATTERN.finditer(section.group(1)):
+                name, path = match.groups()
+                self.autoloads[name] = f"res://{path}"
 
         # Ищем имя проекта
         name_match = re.search(r'config/name="([^"]+)"', content)
@@ -513,6 +753,51 @@ class GodotDependencyAnalyzer:
         >>> print(stats['total_resources'])
     """
 
+    # Минимальное число файлов для параллельного парсинга: на небольших
+    # проектах запуск процессов обходится дороже самого парсинга
+    PARALLEL_MIN_FILES = 500
+
+    # Префиксы отображаемых имён ресурсов по типам
+    TYPE_PREFIX = {
+        GodotResourceType.SCENE: '[Scene]',
+        GodotResourceType.SCRIPT: '[Script]',
+        GodotResourceType.RESOURCE: '[Resource]',
+        GodotResourceType.TEXTURE: '[Texture]',
+        GodotResourceType.AUDIO: '[Audio]',
+        GodotResourceType.SHADER: '[Shader]',
+        GodotResourceType.FONT: '[Font]',
+    }
+
+    # Маппинг типов зависимостей Godot на типы связей DependencyManager
+    REL_TYPE_MAP = {
+        'uses_scene': 'uses',
+        'uses_script': 'uses',
+        'uses_texture': 'uses',
+        'uses_audio': 'uses',
+        'uses_shader': 'uses',
+        'uses_material': 'uses',
+        'uses_font': 'uses',
+        'uses_resource': 'uses',
+        'instances': 'depends_on',
+        'extends': 'depends_on',
+        'preloads': 'uses',
+        'preloads_scene': 'uses',
+        'loads': 'uses',
+        'loads_scene': 'uses',
+        'has_script': 'uses',
+        'uses_autoload': 'connects_to',
+        'uses': 'uses',
+    }
+
+    # Файл кэша результатов парсинга (относительно корня проекта)
+    CACHE_FILE = Path('.godot_analyzer_cache') / 'deps.json'
+
+    # Служебные директории, которые не сканируются
+    EXCLUDED_DIRS = frozenset({'.godot', '.import', '__pycache__'})
+
+    # Расширения файлов, содержимое которых читается при сканировании
+    TEXT_EXTENSIONS = {'.tscn', '.gd'}
+
     # Маппинг расширений файлов на типы ресурсов
     SUPPORTED_EXTENSIONS = {
         '.tscn': GodotResourceType.SCENE,
@@ -538,7 +823,8 @@ class GodotDependencyAnalyzer:
     }
 
     def __init__(self, project_root: str, exclude_textures: bool = True,
-                 exclude_audio: bool = False, exclude_fonts: bool = False) -> None:
+                 exclude_audio: bool = False, exclude_fonts: bool = False,
+                 use_cache: bool = True) -> None:
         """Инициализирует анализатор проекта.
 
         Args:
@@ -546,6 +832,8 @@ class GodotDependencyAnalyzer:
             exclude_textures: Исключить текстуры из анализа (по умолчанию True).
             exclude_audio: Исключить аудио файлы из анализа.
             exclude_fonts: Исключить шрифты из анализа.
+            use_cache: Использовать кэш результатов парсинга в
+                .godot_analyzer_cache внутри проекта.
 
         Raises:
             ValueError: Если project.godot не найден в указанной директории.
@@ -575,6 +863,39 @@ class GodotDependencyAnalyzer:
         if exclude_fonts:
             self._excluded_types.add(GodotResourceType.FONT)
 
+        # Расширения, которые попадают в анализ, с типами ресурсов
+        self._included_extensions: Dict[str, GodotResourceType] = {
+            ext: res_type for ext, res_type in self.SUPPORTED_EXTENSIONS.items()
+            if res_type not in self._excluded_types
+        }
+
+        # Расширения исключённых типов (зависимости на них отбрасываются)
+        self._excluded_extensions = {
+            ext for ext, res_type in self.SUPPORTED_EXTENSIONS.items()
+            if res_type in self._excluded_types
+        }
+
+        # Время модификации и размер файлов {путь res://: (mtime_ns, size)}
+        self._file_stamps: Dict[str, Tuple[int, int]] = {}
+
+        # Кэш результатов парсинга между запусками
+        self._parse_cache: Optional[_ParseCache] = (
+            _ParseCache(self.project_root / self.CACHE_FILE) if use_cache else None
+        )
+
+        # ID объектов всех ресурсов (зависимости на другие пути отбрасываются)
+        self._resource_ids: set = set()
+
+        # Ключи уже добавленных зависимостей (source, target, dep_type)
+        self._dep_keys: set = set()
+
+        # Содержимое сцен и скриптов, прочитанное при сканировании
+        # {путь res://: текст или None при ошибке чтения}
+        self._file_contents: Dict[str, Optional[str]] = {}
+
+        # Общий паттерн поиска обращений к autoload (строится при анализе)
+        self._autoload_regex: Optional[re.Pattern] = None
+
     def analyze(self) -> Tuple[int, int]:
         """Выполняет полный анализ проекта.
 
@@ -582,8 +903,8 @@ class GodotDependencyAnalyzer:
             1. Парсинг project.godot
             2. Сканирование файлов проекта
             3. Добавление autoload как особых ресурсов
-            4. Парсинг зависимостей из сцен и скриптов
-            5. Удаление дубликатов
+            4. Парсинг зависимостей из сцен и скриптов (без дубликатов
+               и без ссылок на файлы вне списка ресурсов)
 
         Returns:
             Кортеж (количество ресурсов, количество зависимостей).
@@ -614,10 +935,11 @@ class GodotDependencyAnalyzer:
                 self.resources[path].name = f"[Autoload] {name}"
 
         # 4. Парсим зависимости из сцен и скриптов
+        self._resource_ids = {_path_to_godot_id(path) for path in self.resources}
         self._parse_dependencies()
 
-        # 5. Удаляем дубликаты зависимостей
-        self._deduplicate_dependencies()
+        # Прочитанное содержимое файлов больше не нужно
+        self._file_contents.clear()
 
         return len(self.resources), len(self.dependencies)
 
@@ -625,54 +947,80 @@ class GodotDependencyAnalyzer:
         """Сканирует все файлы проекта и создаёт ресурсы.
 
         Обходит директорию проекта рекурсивно, пропуская:
-            - Служебные директории (.godot, .import)
+            - Служебные и скрытые директории (.godot, .import, __pycache__)
             - Скрытые файлы
             - Исключённые типы ресурсов
+
+        Текстовые сцены и скрипты сразу читаются в self._file_contents,
+        чтобы парсеры и анализ autoload не открывали их повторно.
         """
-        for file_path in self.project_root.rglob('*'):
-            if file_path.is_file():
-                # Пропускаем служебные директории
-                parts_str = str(file_path)
-                if '.godot' in parts_str or '.import' in parts_str or '__pycache__' in parts_str:
-                    continue
-                if file_path.name.startswith('.'):
-                    continue
+        root = str(self.project_root)
+        for entry in self._walk_files(root):
+            if entry.name.startswith('.'):
+                continue
 
-                ext = file_path.suffix.lower()
-                if ext in self.SUPPORTED_EXTENSIONS:
-                    res_type = self.SUPPORTED_EXTENSIONS[ext]
+            name, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+
+            # Пропускаем неподдерживаемые и исключённые типы
+            res_type = self._included_extensions.get(ext)
+            if res_type is not None:
+                file_path = entry.path
+                rel_path = os.path.relpath(file_path, root)
+                res_path = f"res://{rel_path.replace(os.sep, '/')}"
+                stat = entry.stat()
+                self._file_stamps[res_path] = (stat.st_mtime_ns, stat.st_size)
+
+                # Формируем отображаемое имя с префиксом типа
+                display_name = f"{self.TYPE_PREFIX.get(res_type, '')} {name}"
+
+                self.resources[res_path] = GodotResource(
+                    path=res_path,
+                    type=res_type,
+                    name=display_name,
+                    file_path=file_path,
+                    properties={
+                        'extension': ext,
+                        'size': stat.st_size,
+                        'relative_path': rel_path
+                    }
+                )
 
-                    # Пропускаем исключённые типы
-                    if res_type in self._excluded_types:
-                        continue
+                if ext in self.TEXT_EXTENSIONS:
+                    try:
+                        self._file_contents[res_path] = _read_text(file_path)
+                    except Exception as e:
+                        print(f"Ошибка чтения {file_path}: {e}")
+                        self._file_contents[res_path] = None
 
-                    rel_path = file_path.relative_to(self.project_root)
-                    res_path = f"res://{rel_path.as_posix()}"
-
-                    # Формируем отображаемое имя с префиксом типа
-                    name = file_path.stem
-                    type_prefix = {
-                        GodotResourceType.SCENE: '[Scene]',
-                        GodotResourceType.SCRIPT: '[Script]',
-                        GodotResourceType.RESOURCE: '[Resource]',
-                        GodotResourceType.TEXTURE: '[Texture]',
-                        GodotResourceType.AUDIO: '[Audio]',
-                        GodotResourceType.SHADER: '[Shader]',
-                        GodotResourceType.FONT: '[Font]',
-                    }
-                    display_name = f"{type_prefix.get(res_type, '')} {name}"
-
-                    self.resources[res_path] = GodotResource(
-                        path=res_path,
-                        type=res_type,
-                        name=display_name,
-                        file_path=str(file_path),
-                        properties={
-                            'extension': ext,
-                            'size': file_path.stat().st_size,
-                            'relative_path': str(rel_path)
-                        }
-                    )
+    def _walk_files(self, dir_path: str) -> Iterator[os.DirEntry]:
+        """Рекурсивно перечисляет файлы директории.
+
+        Служебные и скрытые поддиректории отсекаются целиком, а DirEntry
+        переиспользуется, чтобы не делать лишних вызовов stat().
+        Недоступные директории пропускаются, как и в os.walk.
+
+        Args:
+            dir_path: Путь к директории.
+
+        Yields:
+            os.DirEntry для каждого файла.
+        """
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.EXCLUDED_DIRS and not entry.name.startswith('.'):
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            # Нет прав или директория исчезла - пропускаем её
+            pass
+
+        for subdir in subdirs:
+            yield from self._walk_files(subdir)
 
     def _parse_dependencies(self) -> None:
         """Парсит зависимости из всех ресурсов.
@@ -681,17 +1029,68 @@ class GodotDependencyAnalyzer:
             - GodotSceneParser для сцен
             - GodotScriptParser для GDScript
 
+        Неизменённые с прошлого анализа файлы берутся из кэша, а большие
+        проекты парсятся параллельно в нескольких процессах.
         Также анализирует использование autoload синглтонов.
         """
+        cache = self._parse_cache
+        if cache is not None:
+            cache.load()
+
+        # Результаты по файлам в порядке ресурсов; None - нужно парсить
+        results: List[Optional[List[GodotDependency]]] = []
+        tasks = []
         for res_path, resource in self.resources.items():
             if resource.type == GodotResourceType.SCENE:
-                parser = GodotSceneParser(resource.file_path, self.project_root)
-                self.dependencies.extend(parser.parse())
+                parser_class = GodotSceneParser
+            elif resource.type == GodotResourceType.SCRIPT and resource.file_path.endswith('.gd'):
+                parser_class = GodotScriptParser
+            else:
+                continue
+
+            content = self._file_contents.get(res_path)
+            if content is None and res_path in self._file_contents:
+                # Файл не удалось прочитать при сканировании
+                continue
+
+            cached = None
+            if cache is not None:
+                cached = cache.get(res_path, self._file_stamps[res_path])
+            if cached is None:
+                tasks.append((parser_class, resource.file_path, self.project_root,
+                              res_path, content))
+            results.append(cached)
+
+        parsed = None
+        cpus = os.cpu_count() or 1
+        if cpus > 1 and len(tasks) >= self.PARALLEL_MIN_FILES:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    parsed = list(executor.map(
+                        _parse_file, tasks,
+                        chunksize=max(1, len(tasks) // (cpus * 4))
+                    ))
+            except Exception as e:
+                print(f"Параллельный парсинг недоступен: {e}")
+
+        if parsed is None:
+            parsed = map(_parse_file, tasks)
+
+        # Подставляем результаты парсинга на места промахов кэша
+        misses = zip(tasks, parsed)
+        for i, deps in enumerate(results):
+            if deps is None:
+                task, deps = next(misses)
+                results[i] = deps
+                if cache is not None:
+                    res_path = task[3]
+                    cache.put(res_path, self._file_stamps[res_path], deps)
 
-            elif resource.type == GodotResourceType.SCRIPT:
-                if resource.file_path.endswith('.gd'):
-                    parser = GodotScriptParser(resource.file_path, self.project_root)
-                    self.dependencies.extend(parser.parse())
+        if cache is not None:
+            cache.save(self._file_stamps.keys())
+
+        for dep in chain.from_iterable(results):
+            self._add_dep(dep)
 
         # Анализируем использование autoload
         self._analyze_autoload_usage()
@@ -700,55 +1099,75 @@ class GodotDependencyAnalyzer:
         """Анализирует использование autoload синглтонов в скриптах.
 
         Ищет обращения к autoload по имени (например, Global.method())
-        и создаёт зависимости типа uses_autoload.
+        и создаёт зависимости типа uses_autoload. Каждый скрипт читается
+        один раз, а все имена autoload ищутся одним общим паттерном
+        (только в скриптах, где имена встречаются как подстроки).
         """
-        for name, autoload_path in self.autoloads.items():
-            for res_path, resource in self.resources.items():
-                if resource.type == GodotResourceType.SCRIPT and res_path != autoload_path:
+        if not self.autoloads:
+            return
+
+        self._autoload_regex = re.compile(
+            r'\b(' + '|'.join(re.escape(name) for name in self.autoloads) + r')\s*\.'
+        )
+
+        # Имена autoload, используемые в каждом скрипте
+        used_names: Dict[str, set] = {}
+        for res_path, resource in self.resources.items():
+            if resource.type == GodotResourceType.SCRIPT:
+                if res_path in self._file_contents:
+                    content = self._file_contents[res_path]
+                else:
                     try:
-                        with open(resource.file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        # Ищем использование autoload по имени
-                        pattern = rf'\b{name}\s*\.'
-                        if re.search(pattern, content):
-                            self.dependencies.append(GodotDependency(
-                                source=res_path,
-                                target=autoload_path,
-                                dep_type="uses_autoload",
-                                context=f"Uses singleton: {name}"
-                            ))
+                        content = _read_text(resource.file_path)
                     except Exception:
-                        pass
+                        content = None
+                if content is None:
+                    continue
 
-    def _deduplicate_dependencies(self) -> None:
-        """Удаляет дубликаты зависимостей и фильтрует исключённые типы.
+                # Быстрая проверка подстрокой: регулярное выражение
+                # запускается, только если в тексте встречается хоть одно имя
+                if not any(name in content for name in self.autoloads):
+                    continue
+                used_names[res_path] = {
+                    match.group(1) for match in self._autoload_regex.finditer(content)
+                }
+
+        for name, autoload_path in self.autoloads.items():
+            for res_path, names in used_names.items():
+                if name in names and res_path != autoload_path:
+                    self._add_dep(GodotDependency(
+                        source=res_path,
+                        target=autoload_path,
+                        dep_type="uses_autoload",
+                        context=f"Uses singleton: {name}"
+                    ))
+
+    def _add_dep(self, dep: GodotDependency) -> None:
+        """Добавляет зависимость, отбрасывая дубликаты и лишние ссылки.
 
+        Отбрасываются зависимости на исключённые типы и зависимости,
+        у которых источник или цель не входят в ресурсы проекта.
         Зависимость считается дубликатом, если совпадают:
             - source (исходный ресурс)
             - target (целевой ресурс)
             - dep_type (тип зависимости)
-        """
-        seen = set()
-        unique_deps = []
 
-        # Определяем расширения исключённых типов
-        excluded_extensions = set()
-        for ext, res_type in self.SUPPORTED_EXTENSIONS.items():
-            if res_type in self._excluded_types:
-                excluded_extensions.add(ext)
-
-        for dep in self.dependencies:
-            # Проверяем, не ссылается ли зависимость на исключённый тип
-            target_ext = Path(dep.target).suffix.lower()
-            if target_ext in excluded_extensions:
-                continue
+        Args:
+            dep: Найденная зависимость.
+        """
+        # Проверяем, не ссылается ли зависимость на исключённый тип
+        if os.path.splitext(dep.target)[1].lower() in self._excluded_extensions:
+            return
 
-            key = (dep.source, dep.target, dep.dep_type)
-            if key not in seen:
-                seen.add(key)
-                unique_deps.append(dep)
+        # Проверяем, что оба конца станут объектами при экспорте
+        if (_path_to_godot_id(dep.source) not in self._resource_ids
+                or _path_to_godot_id(dep.target) not in self._resource_ids):
+            return
 
-        self.dependencies = unique_deps
+        key = (dep.source, dep.target, dep.dep_type)
+        if key not in self._dep_keys:
+            self._dep_keys.add(key)
+            self.dependencies.append(dep)
 
     def get_statistics(self) -> Dict:
         """Возвращает статистику по проекту.
@@ -779,7 +1198,7 @@ class GodotDependencyAnalyzer:
 
         # Подсчёт по типам ресурсов
         for resource in self.resources.values():
-            type_name = resource.type.value
+            type_name = resource.type_str
             stats['by_type'][type_name] = stats['by_type'].get(type_name, 0) + 1
 
         # Подсчёт по типам зависимостей
@@ -802,91 +1221,52 @@ class GodotDependencyAnalyzer:
         """
         from dependency_manager import InfraObject, Relationship
 
-        added_objects = 0
-        added_relationships = 0
-
-        # Маппинг типов Godot на типы визуализации
+        # Маппинг типов Godot (строковых значений) на типы визуализации
         type_mapping = {
-            GodotResourceType.SCENE: 'godot_scene',
-            GodotResourceType.SCRIPT: 'godot_script',
-            GodotResourceType.RESOURCE: 'godot_resource',
-            GodotResourceType.TEXTURE: 'godot_resource',
-            GodotResourceType.AUDIO: 'godot_resource',
-            GodotResourceType.SHADER: 'godot_script',
-            GodotResourceType.FONT: 'godot_resource',
-            GodotResourceType.AUTOLOAD: 'godot_autoload',
-            GodotResourceType.UNKNOWN: 'godot_resource',
-        }
-
-        # Добавляем ресурсы как объекты
-        for res_path, resource in self.resources.items():
-            obj_type = type_mapping.get(resource.type, 'file')
-
-            properties = {
-                'godot_type': resource.type.value,
-                'res_path': resource.path,
-                **resource.properties
-            }
-
-            try:
-                obj = InfraObject(
-                    obj_id=f"godot_{resource.id}",
-                    obj_type=obj_type,
-                    name=resource.name,
-                    properties=properties
-                )
-
-                if manager.add_object(obj):
-                    added_objects += 1
-            except Exception as e:
-                print(f"Ошибка добавления объекта {resource.path}: {e}")
-
-        # Маппинг типов зависимостей
-        rel_type_map = {
-            'uses_scene': 'uses',
-            'uses_script': 'uses',
-            'uses_texture': 'uses',
-            'uses_audio': 'uses',
-            'uses_shader': 'uses',
-            'uses_material': 'uses',
-            'uses_font': 'uses',
-            'uses_resource': 'uses',
-            'instances': 'depends_on',
-            'extends': 'depends_on',
-            'preloads': 'uses',
-            'preloads_scene': 'uses',
-            'loads': 'uses',
-            'loads_scene': 'uses',
-            'has_script': 'uses',
-            'uses_autoload': 'connects_to',
-            'uses': 'uses',
+            GodotResourceType.SCENE.value: 'godot_scene',
+            GodotResourceType.SCRIPT.value: 'godot_script',
+            GodotResourceType.RESOURCE.value: 'godot_resource',
+            GodotResourceType.TEXTURE.value: 'godot_resource',
+            GodotResourceType.AUDIO.value: 'godot_resource',
+            GodotResourceType.SHADER.value: 'godot_script',
+            GodotResourceType.FONT.value: 'godot_resource',
+            GodotResourceType.AUTOLOAD.value: 'godot_autoload',
+            GodotResourceType.UNKNOWN.value: 'godot_resource',
         }
 
-        # Добавляем зависимости как связи
+        # Собираем ресурсы как объекты. Типы объектов и связей берутся
+        # из type_mapping и REL_TYPE_MAP и всегда допустимы, поэтому
+        # конструкторы InfraObject и Relationship не выбрасывают ValueError
+        added_objects = manager.add_objects([
+            InfraObject(
+                obj_id=f"godot_{resource.id}",
+                obj_type=type_mapping.get(resource.type_str, 'file'),
+                name=resource.name,
+                properties=_export_properties(resource)
+            )
+            for resource in self.resources.values()
+        ])
+
+        # Зависимости уже отфильтрованы при анализе: оба конца есть
+        # среди ресурсов
+        get_rel_type = self.REL_TYPE_MAP.get
+
+        # Собираем зависимости как связи
+        rels_to_add = []
         for dep in self.dependencies:
-            source_id = f"godot_{dep.source.replace('res://', '').replace('/', '_').replace('.', '_').replace('-', '_')}"
-            target_id = f"godot_{dep.target.replace('res://', '').replace('/', '_').replace('.', '_').replace('-', '_')}"
+            source_id = _path_to_godot_id(dep.source)
+            target_id = _path_to_godot_id(dep.target)
 
-            rel_type = rel_type_map.get(dep.dep_type, 'uses')
+            rel_type = get_rel_type(dep.dep_type, 'uses')
 
-            # Проверяем, существуют ли оба объекта
-            if source_id not in [f"godot_{r.id}" for r in self.resources.values()]:
-                continue
-            if target_id not in [f"godot_{r.id}" for r in self.resources.values()]:
-                continue
-
-            try:
-                rel = Relationship(
-                    source_id=source_id,
-                    target_id=target_id,
-                    rel_type=rel_type,
-                    description=f"[{dep.dep_type}] {dep.context}"
-                )
+            rels_to_add.append(Relationship(
+                source_id=source_id,
+                target_id=target_id,
+                rel_type=rel_type,
+                description=f"[{dep.dep_type}] {dep.context}"
+            ))
 
-                if manager.add_relationship(rel):
-                    added_relationships += 1
-            except Exception:
-                pass
+        added_relationships = manager.add_relationships(rels_to_add)
 
         return added_objects, added_relationships
 
@@ -936,7 +1316,6 @@ def analyze_godot_project(project_path: str, exclude_textures: bool = True,
 # =============================================================================
 
 if __name__ == '__main__':
-    import sys
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -969,39 +1348,51 @@ if __name__ == '__main__':
         resources, deps = analyzer.analyze()
         stats = analyzer.get_statistics()
 
-        print(f"\n{'='*50}")
-        print(f"Проект: {stats['project_name']}")
-        print(f"{'='*50}")
+        # Отчёт собирается целиком и выводится одним вызовом
+        lines = [
+            f"\n{'='*50}",
+            f"Проект: {stats['project_name']}",
+            f"{'='*50}",
+        ]
 
         # Показываем активные фильтры
         filters = []
-        if stats['filters']['exclude_textures']:
+        flt = stats['filters']
+        if flt['exclude_textures']:
             filters.append('текстуры')
-        if stats['filters']['exclude_audio']:
+        if flt['exclude_audio']:
             filters.append('аудио')
-        if stats['filters']['exclude_fonts']:
+        if flt['exclude_fonts']:
             filters.append('шрифты')
         if filters:
-            print(f"Исключены: {', '.join(filters)}")
+            lines.append(f"Исключены: {', '.join(filters)}")
 
-        print(f"\nВсего ресурсов: {stats['total_resources']}")
-        print(f"Всего зависимостей: {stats['total_dependencies']}")
+        lines.append(f"\nВсего ресурсов: {stats['total_resources']}")
+        lines.append(f"Всего зависимостей: {stats['total_dependencies']}")
 
-        print(f"\nПо типам ресурсов:")
-        for type_name, count in sorted(stats['by_type'].items()):
-            print(f"  {type_name}: {count}")
+        lines.append("\nПо типам ресурсов:")
+        lines.extend(
+            f"  {type_name}: {count}"
+            for type_name, count in sorted(stats['by_type'].items())
+        )
 
         if stats['autoloads']:
-            print(f"\nAutoload синглтоны: {', '.join(stats['autoloads'])}")
+            lines.append(f"\nAutoload синглтоны: {', '.join(stats['autoloads'])}")
 
-        print(f"\nТипы зависимостей:")
-        for dep_type, count in sorted(stats['dependency_types'].items()):
-            print(f"  {dep_type}: {count}")
+        lines.append("\nТипы зависимостей:")
+        lines.extend(
+            f"  {dep_type}: {count}"
+            for dep_type, count in sorted(stats['dependency_types'].items())
+        )
 
         # Показываем несколько примеров зависимостей
-        print(f"\nПримеры зависимостей (первые 10):")
-        for dep in analyzer.dependencies[:10]:
-            print(f"  {dep.source} --[{dep.dep_type}]--> {dep.target}")
+        lines.append("\nПримеры зависимостей (первые 10):")
+        lines.extend(
+            f"  {dep.source} --[{dep.dep_type}]--> {dep.target}"
+            for dep in analyzer.dependencies[:10]
+        )
+
+        print('\n'.join(lines))
 
     except Exception as e:
         print(f"Ошибка: {e}")